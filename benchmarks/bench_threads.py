@@ -0,0 +1,87 @@
+# ===================================================================
+# Đo thông lượng của vncalendar khi gọi từ nhiều luồng.
+# Measures vncalendar throughput when called from a thread pool.
+#
+# Usage:
+#     python benchmarks/bench_threads.py [max_threads] [calls_per_thread]
+#
+# Workloads:
+#     memo cold   LunarYear / solar-term lookups with the memo tables cleared
+#                 before each run, so threads race on building the same years
+#     memo warm   the same lookups on built tables (lock-free reads)
+#     TotXau      rule-table lookups (Hoàng Đạo star, bad days, Âm lịch hour)
+#
+# On a regular CPython build the GIL keeps pure-Python work on one core,
+# so throughput stays flat; on a free-threaded build (3.13t) it should
+# grow with the number of threads. After each cold run the number of
+# memo entries is printed: it must equal the number of distinct years,
+# i.e. no year was built twice.
+# ===================================================================
+
+from concurrent.futures import ThreadPoolExecutor
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from vncalendar import Date, LunarYear, TietKhi, TotXau, CanChi
+
+START = Date.convertDate2jdn(1, 1, 1900)
+SPAN = 365 * 200
+
+
+def lookups(seed, n):
+    for i in range(n):
+        jdn = START + (seed * 7919 + i * 3637) % SPAN
+        LunarYear.containing(jdn).locate(jdn)
+        TietKhi.getTermAt(jdn)
+
+
+def rules(seed, n):
+    for i in range(n):
+        dl = (seed + i) % 30 + 1; ml = i % 12 + 1
+        TotXau.getHoangHacDao(CanChi.CHI[i % 12], ml)
+        TotXau.isTamNuong(dl, ml, 2000); TotXau.isNguyetKy(dl, ml, 2000)
+        TotXau.gioAm(i % 24); TotXau.quyHoi(CanChi.CHI[i % 12])
+
+
+def clear():
+    LunarYear._cache.clear(); TietKhi._termTables.clear()
+
+
+def run(func, threads, n, setup=None):
+    if setup:
+        setup()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        t = time.perf_counter()
+        list(pool.map(func, range(threads), [n] * threads))
+        return threads * n / (time.perf_counter() - t)
+
+
+def main():
+    maxThreads = int(sys.argv[1]) if len(sys.argv) > 1 else (os.cpu_count() or 4)
+    n = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    gil = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print(f'Python {sys.version.split()[0]}, GIL {"enabled" if gil else "disabled"}, {os.cpu_count()} CPUs')
+    workloads = (
+        ('memo cold', lookups, max(n // 10, 1), clear),
+        ('memo warm', lookups, n, None),
+        ('TotXau', rules, n, None),
+    )
+    for name, func, calls, setup in workloads:
+        func(0, calls)
+        base = None
+        for threads in sorted({1, 2, 4, 8, 16, maxThreads}):
+            if threads > maxThreads:
+                continue
+            ops = run(func, threads, calls, setup)
+            base = base or ops
+            line = f'{name:<10} threads={threads:<3} {ops:>12,.0f} calls/s  x{ops / base:.2f}'
+            if setup:
+                line += f'  ({len(LunarYear._cache)} lunar years built)'
+            print(line)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+import pytest
+
+pd = pytest.importorskip('pandas')
+
+import vncalendar  # noqa: F401  (registers Series.vncal)
+from vncalendar import SolarAndLunar, CanChi, TotXau
+
+
+def _days(s):
+    return [None if pd.isna(t) else (t.day, t.month, t.year) for t in s]
+
+
+@pytest.fixture
+def series():
+    # Tết 2025 and 2026, the leap 6th month of 2025, a year end, and gaps.
+    days = pd.date_range('2025-01-20', periods=30, freq='D').tolist()
+    days += pd.date_range('2025-07-20', periods=40, freq='D').tolist()
+    days += [pd.NaT, pd.Timestamp('2026-02-17 23:30'), pd.Timestamp('2025-12-31 00:01'), pd.NaT]
+    days += days[:5]
+    return pd.Series(days, dtype='datetime64[ns]', name='when')
+
+
+def test_lunar_fields_match_convertSolar2Lunar(series):
+    acc = series.vncal
+    rows = zip(_days(series), acc.lunar_day, acc.lunar_month, acc.lunar_year, acc.is_leap)
+    for day, ld, lm, ly, leap in rows:
+        if day is None:
+            assert all(v is pd.NA for v in (ld, lm, ly, leap))
+        else:
+            assert (ld, lm, ly, int(leap)) == tuple(SolarAndLunar.convertSolar2Lunar(*day))
+    assert acc.lunar_day.dtype == 'Int64' and acc.is_leap.dtype == 'boolean'
+    assert acc.lunar_day.index.equals(series.index) and acc.lunar_day.name == 'when'
+
+
+def test_canchi_day_matches_CanChi(series):
+    res = series.vncal.canchi_day
+    assert len(res.cat.categories) == 60
+    for day, name in zip(_days(series), res):
+        if day is None:
+            assert pd.isna(name)
+        else:
+            assert name == CanChi.ngay(*day)
+
+
+def test_hoang_dao_matches_TotXau(series):
+    acc = series.vncal
+    for day, star, good in zip(_days(series), acc.hoang_dao_star, acc.hoang_dao):
+        if day is None:
+            assert pd.isna(star) and good is pd.NA
+            continue
+        chi = CanChi.ngay(*day).split()[1]
+        name, kind = TotXau.getHoangHacDao(chi, SolarAndLunar.convertSolar2Lunar(*day)[1])
+        assert star == name and good == (kind == 'Hoàng Đạo')
+
+
+def test_aware_values_use_local_day():
+    # 2025-01-28 20:00 UTC is 29/1 03:00 in Vietnam: Tết Ất Tỵ, 1/1/2025.
+    s = pd.Series(pd.to_datetime(['2025-01-28 20:00', None], utc=True))
+    assert s.vncal.lunar_day.tolist() == [1, pd.NA]
+    assert s.vncal.at(0.0).lunar_day.tolist() == [SolarAndLunar.convertSolar2Lunar(28, 1, 2025, 0.0)[0], pd.NA]
+
+
+def test_all_nat_and_non_datetime():
+    s = pd.Series([pd.NaT, pd.NaT], dtype='datetime64[ns]')
+    assert s.vncal.lunar_month.isna().all()
+    assert s.vncal.canchi_day.isna().all()
+    with pytest.raises(AttributeError):
+        pd.Series([1, 2]).vncal
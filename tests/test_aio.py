@@ -0,0 +1,113 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from vncalendar import Date, LunarYear, VanSu
+from vncalendar.aio import AsyncCalendar
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+def _lunar(d, m, y):
+    jdn = Date.convertDate2jdn(d, m, y)
+    return LunarYear.containing(jdn).locate(jdn)
+
+
+DAYS = [Date.convertjdn2Date(Date.convertDate2jdn(1, 1, 2025) + i) for i in range(60)]
+
+
+def test_concurrent_requests_share_one_batch():
+    async def main():
+        acal = AsyncCalendar(window=0.05)
+        res = await asyncio.gather(*(acal.lunar(d) for d in DAYS))
+        return acal, res
+
+    acal, res = _run(main())
+    assert res == [_lunar(*d) for d in DAYS]
+    assert acal.stats == {'requests': 60, 'shared': 0, 'batches': 1, 'computed': 60}
+
+
+def test_max_batch_flushes_early():
+    async def main():
+        acal = AsyncCalendar(window=10, maxBatch=25)
+        await asyncio.wait_for(asyncio.gather(*(acal.lunar(d) for d in DAYS[:50])), 5)
+        return acal
+
+    assert _run(main()).stats['batches'] == 2
+
+
+def test_identical_dates_are_computed_once():
+    async def main():
+        acal = AsyncCalendar()
+        pending = await asyncio.gather(*(acal.lunar((7, 5, 2026)) for _ in range(10)))
+        # maxBatch=1 starts each batch at once: the second request joins the one in flight.
+        eager = AsyncCalendar(maxBatch=1)
+        inflight = await asyncio.gather(eager.lunar((8, 5, 2026)), eager.lunar((8, 5, 2026)))
+        return acal, pending, eager, inflight
+
+    acal, pending, eager, inflight = _run(main())
+    assert pending == [(21, 3, 2026, 0)] * 10
+    assert acal.stats == {'requests': 10, 'shared': 9, 'batches': 1, 'computed': 1}
+    assert inflight == [_lunar(8, 5, 2026)] * 2
+    assert eager.stats == {'requests': 2, 'shared': 1, 'batches': 1, 'computed': 1}
+
+
+def test_errors_stay_with_their_request(monkeypatch):
+    getInfo = VanSu.getInfo
+
+    def failing(d, m, y, SorL):
+        if d == 13:
+            raise RuntimeError('boom')
+        return getInfo(d, m, y, SorL)
+
+    monkeypatch.setattr(VanSu, 'getInfo', staticmethod(failing))
+
+    async def main():
+        acal = AsyncCalendar(executor=ThreadPoolExecutor(1))
+        days = [(12, 5, 2026), (13, 5, 2026), (14, 5, 2026)]
+        return acal, await asyncio.gather(*(acal.info(d) for d in days), return_exceptions=True)
+
+    acal, res = _run(main())
+    assert acal.stats['batches'] == 1
+    assert res[0] == getInfo(12, 5, 2026, 's') and res[2] == getInfo(14, 5, 2026, 's')
+    assert isinstance(res[1], RuntimeError)
+
+
+def test_invalid_date_is_rejected_before_batching():
+    async def main():
+        acal = AsyncCalendar()
+        with pytest.raises(ValueError):
+            await acal.lunar((30, 2, 2025))
+        return acal
+
+    assert _run(main()).stats['requests'] == 0
+
+
+def test_cancelling_one_waiter_keeps_the_shared_result():
+    async def main():
+        acal = AsyncCalendar(window=0.05)
+        a = asyncio.ensure_future(acal.lunar((7, 5, 2026)))
+        b = asyncio.ensure_future(acal.lunar((7, 5, 2026)))
+        await asyncio.sleep(0)
+        a.cancel()
+        res = await b
+        with pytest.raises(asyncio.CancelledError):
+            await a
+        return acal, res, await acal.lunar((7, 5, 2026))
+
+    acal, res, again = _run(main())
+    assert res == again == (21, 3, 2026, 0)
+    assert acal.stats['shared'] == 1
+
+
+def test_info_rejects_other_time_zones():
+    async def main():
+        with pytest.raises(ValueError):
+            await AsyncCalendar(timeZone=8.0).info((7, 5, 2026))
+        return await AsyncCalendar(timeZone=8.0).lunar((7, 5, 2026))
+
+    jdn = Date.convertDate2jdn(7, 5, 2026)
+    assert _run(main()) == LunarYear.containing(jdn, 8.0).locate(jdn)
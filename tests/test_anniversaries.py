@@ -0,0 +1,64 @@
+import pytest
+
+from vncalendar import Date, LunarYear, SolarAndLunar
+
+YEARS = range(2023, 2029)
+
+
+def _l2s(d, m, y, leap=0):
+    return tuple(SolarAndLunar.convertLunar2Solar(d, m, y, leap))
+
+
+def _shift(date, days):
+    return Date.convertjdn2Date(Date.convertDate2jdn(*date) + days)
+
+
+def test_regular_dates_match_reference():
+    (dates,) = SolarAndLunar.getAnniversaries([(10, 3, 0)], YEARS[0], YEARS[-1])
+    assert dates == tuple(_l2s(10, 3, y) for y in YEARS)
+
+
+@pytest.mark.parametrize('policy', ['regular', 'skip'])
+def test_missing_leap_month(policy):
+    # Leap 6th month exists in 2025 only; 2028 has a leap 5th month instead.
+    (dates,) = SolarAndLunar.getAnniversaries([(5, 6, 1)], YEARS[0], YEARS[-1], missingLeap=policy)
+    for y, got in zip(YEARS, dates):
+        if LunarYear.get(y).leapMonth == 6:
+            assert got == _l2s(5, 6, y, 1)
+        elif policy == 'regular':
+            assert got == _l2s(5, 6, y)
+        else:
+            assert got is None
+
+
+@pytest.mark.parametrize('policy', ['last', 'next', 'skip'])
+def test_day_30_in_short_month(policy):
+    (dates,) = SolarAndLunar.getAnniversaries([(30, 3, 0)], YEARS[0], YEARS[-1], missingDay30=policy)
+    for y, got in zip(YEARS, dates):
+        if LunarYear.get(y).monthLength(3, 0) == 30:
+            assert got == _l2s(30, 3, y)
+        elif policy == 'last':
+            assert got == _l2s(29, 3, y)
+        elif policy == 'next':
+            assert got == _shift(_l2s(29, 3, y), 1)
+            assert SolarAndLunar.convertSolar2Lunar(*got)[:2] == (1, 4)
+        else:
+            assert got is None
+    assert any(LunarYear.get(y).monthLength(3, 0) == 29 for y in YEARS)
+
+
+def test_leap_month_day_30_uses_leap_length():
+    # Leap 6/2025 has 29 days while the regular 6th month has 30.
+    (dates,) = SolarAndLunar.getAnniversaries([(30, 6, 1)], 2025, 2025)
+    assert dates == (_l2s(29, 6, 2025, 1),)
+    (dates,) = SolarAndLunar.getAnniversaries([(30, 6, 0)], 2025, 2025)
+    assert dates == (_l2s(30, 6, 2025),)
+
+
+def test_duplicates_and_bad_policy():
+    res = SolarAndLunar.getAnniversaries([(10, 3, 0), (10, 3, False), (1, 1, 0)], 2024, 2026)
+    assert res[0] == res[1] and len(res) == 3
+    with pytest.raises(ValueError):
+        SolarAndLunar.getAnniversaries([(1, 1, 0)], 2024, 2025, missingLeap='nearest')
+    with pytest.raises(ValueError):
+        SolarAndLunar.getAnniversaries([(1, 1, 0)], 2024, 2025, missingDay30='first')
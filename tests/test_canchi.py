@@ -0,0 +1,93 @@
+import random
+
+import pytest
+
+from vncalendar import CanChi, Date
+
+NAMES = [CanChi.fromIndex(i) for i in range(60)]
+
+
+def _walkDays(jdn, step):
+    while True:
+        jdn += step
+        yield jdn, CanChi.ngay(*Date.convertjdn2Date(jdn))
+
+
+def _walkMonths(m, y, step):
+    k = 12 * y + m - 1
+    while True:
+        k += step
+        yield (k % 12 + 1, k // 12), CanChi.thang(k % 12 + 1, k // 12)
+
+
+def _walkYears(y, step):
+    while True:
+        y += step
+        yield y, CanChi.nam(y)
+
+
+def _nth(walk, cch, n):
+    for value, name in walk:
+        if name == cch:
+            n -= 1
+            if n == 0:
+                return value
+
+
+@pytest.mark.parametrize('n', [1, -1, 2, -2, 3])
+def test_findNgay(n):
+    rng = random.Random(50 + n)
+    for _ in range(30):
+        jdn = rng.randint(Date.convertDate2jdn(1, 1, 1900), Date.convertDate2jdn(31, 12, 2100))
+        cch = rng.choice(NAMES)
+        expected = _nth(_walkDays(jdn, 1 if n > 0 else -1), cch, abs(n))
+        assert CanChi.findNgay(cch, *Date.convertjdn2Date(jdn), n) == tuple(Date.convertjdn2Date(expected))
+
+
+def test_findNgay_skips_the_date_itself():
+    cch = CanChi.ngay(17, 2, 2026)
+    assert CanChi.findNgay(cch, 17, 2, 2026) == tuple(Date.convertjdn2Date(Date.convertDate2jdn(17, 2, 2026) + 60))
+    assert CanChi.findNgay(cch, 17, 2, 2026, -1) == tuple(Date.convertjdn2Date(Date.convertDate2jdn(17, 2, 2026) - 60))
+
+
+@pytest.mark.parametrize('n', [1, -1, 2, -3])
+def test_findThang(n):
+    rng = random.Random(60 + n)
+    for _ in range(30):
+        m, y = rng.randint(1, 12), rng.randint(1900, 2100)
+        cch = rng.choice(NAMES)
+        expected = _nth(_walkMonths(m, y, 1 if n > 0 else -1), cch, abs(n))
+        assert CanChi.findThang(cch, m, y, n) == expected
+
+
+@pytest.mark.parametrize('n', [1, -1, 2, -2])
+def test_findNam(n):
+    for y in (1900, 1984, 2025, 2026):
+        for cch in ('Giáp Tý', 'Bính Ngọ', CanChi.nam(y), 'Qúy Hợi'):
+            assert CanChi.findNam(cch, y, n) == _nth(_walkYears(y, 1 if n > 0 else -1), cch, abs(n))
+    assert CanChi.findNam('Bính Ngọ', 2025) == 2026
+    assert CanChi.findNam('Bính Ngọ', 2026) == 2086
+
+
+def test_all_ranges():
+    first = Date.convertDate2jdn(1, 1, 2025); last = Date.convertDate2jdn(31, 12, 2026)
+    for cch in ('Giáp Tý', 'Canh Thân', CanChi.ngay(1, 1, 2025), CanChi.ngay(31, 12, 2026)):
+        expected = [tuple(Date.convertjdn2Date(j)) for j in range(first, last + 1)
+                    if CanChi.ngay(*Date.convertjdn2Date(j)) == cch]
+        assert [tuple(d) for d in CanChi.allNgay(cch, 1, 1, 2025, 31, 12, 2026)] == expected
+    months = [(m, y) for y in range(2000, 2031) for m in range(1, 13)][2:-3]
+    for cch in ('Bính Dần', 'Giáp Tý', CanChi.thang(*months[0]), CanChi.thang(*months[-1])):
+        assert CanChi.allThang(cch, *months[0], *months[-1]) == [k for k in months if CanChi.thang(*k) == cch]
+    for cch in ('Giáp Tý', 'Bính Ngọ', 'Canh Tý'):
+        assert CanChi.allNam(cch, 1900, 2100) == [y for y in range(1900, 2101) if CanChi.nam(y) == cch]
+    assert CanChi.allNgay('Giáp Tý', 2, 1, 2025, 1, 1, 2025) == []
+    assert CanChi.allThang('Giáp Tý', 1, 2000, 2, 2000) == []
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        CanChi.findNgay('Giáp Sửu', 1, 1, 2025)
+    with pytest.raises(ValueError):
+        CanChi.findNam('Giáp Tý', 2025, 0)
+    with pytest.raises(ValueError):
+        CanChi.allThang('Tý Giáp', 1, 2025, 12, 2025)
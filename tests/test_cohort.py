@@ -0,0 +1,62 @@
+import random
+
+import pytest
+
+from vncalendar import CanChi, Cohort, Date, DayIndex, Person, TotXau
+
+RANGE = (1, 3, 2026, 30, 4, 2026)
+
+
+@pytest.fixture(scope='module')
+def people():
+    rng = random.Random(48)
+    group = [Person(rng.randint(1, 28), rng.randint(1, 12), rng.randint(1950, 2005), rng.choice('mf'))
+             for _ in range(40)]
+    # Born before Tết: the lunar birth year is the previous one (Kỷ Tị, not Canh Ngọ).
+    group.append(Person(15, 1, 1990, 'f'))
+    group.append(Person(20, 7, 1970, 'm'))    # Canh Tuất
+    return group
+
+
+def _clashes(person, date):
+    return CanChi.nam(person.lunar_byr) in TotXau.getXung(*date)
+
+
+def test_lunar_birth_year_is_used(people):
+    assert CanChi.nam(people[-2].lunar_byr) == 'Kỷ Tị'
+
+
+def test_matrix_matches_getXung(people):
+    cohort = Cohort(people)
+    days, rows = cohort.matrix(*RANGE)
+    first = Date.convertDate2jdn(*RANGE[:3])
+    assert days == [tuple(Date.convertjdn2Date(first + j)) for j in range(len(days))]
+    assert len(rows) == len(people)
+    for person, row in zip(people, rows):
+        assert list(row) == [int(_clashes(person, day)) for day in days]
+    assert any(any(row) for row in rows)
+    for day in days:
+        assert cohort.conflicts(*day) == [p for p in people if _clashes(p, day)]
+
+
+def test_rank_matches_getXung(people):
+    cohort = Cohort(people)
+    ranked = cohort.rank(*RANGE)
+    ix = DayIndex(2026)
+    assert len(ranked) == Date.convertDate2jdn(*RANGE[3:]) - Date.convertDate2jdn(*RANGE[:3]) + 1
+    for date, n, hoangDao, bad in ranked:
+        jdn = Date.convertDate2jdn(*date)
+        assert n == sum(_clashes(p, date) for p in people)
+        assert hoangDao == (jdn in ix.flag('hoangDao'))
+        assert bad == tuple(name for name in Cohort.BAD if jdn in ix.flag(name))
+    keys = [(n, len(bad), not hoangDao, Date.convertDate2jdn(*date)) for date, n, hoangDao, bad in ranked]
+    assert keys == sorted(keys)
+    assert len({n for _, n, _, _ in ranked}) > 1
+
+
+def test_rank_maxConflicts(people):
+    cohort = Cohort(people)
+    ranked = cohort.rank(*RANGE)
+    low = min(n for _, n, _, _ in ranked)
+    assert cohort.rank(*RANGE, maxConflicts=low) == [r for r in ranked if r[1] <= low]
+    assert cohort.rank(30, 4, 2026, 1, 3, 2026) == []
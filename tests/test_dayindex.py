@@ -0,0 +1,61 @@
+import pytest
+
+from vncalendar import CanChi, Date, DayIndex, DaySet, SolarAndLunar, TotXau
+
+IS = {
+    'tamNuong': TotXau.isTamNuong, 'nguyetPha': TotXau.isNguyetPha,
+    'satChu': TotXau.isSatChu, 'thoTu': TotXau.isThoTu, 'vangVong': TotXau.isVangVong,
+    'nguyetKy': TotXau.isNguyetKy, 'daiBai': TotXau.isDaiBai,
+}
+# TotXau.is* rebuild the Gregorian date with a leap flag guessed from yl % 19,
+# which is wrong for regular months of those lunar years and for leap months.
+GUESSED_LEAP = (0, 3, 6, 9, 11, 14, 17)
+
+
+@pytest.fixture(scope='module')
+def index():
+    return DayIndex(2026, 2027)
+
+
+@pytest.fixture(scope='module')
+def days(index):
+    out = []
+    for jdn in range(index.start, index.start + index.size):
+        d, m, y = Date.convertjdn2Date(jdn)
+        out.append((jdn, (d, m, y), tuple(SolarAndLunar.convertSolar2Lunar(d, m, y))))
+    return out
+
+
+def test_set_algebra_query(index, days):
+    # Hoàng Đạo weekends of lunar 2026 that are neither Tam Nương nor Nguyệt Kỵ.
+    query = (index.flag('hoangDao') & index.weekday(5, 6)) - (index.flag('tamNuong') | index.flag('nguyetKy'))
+    expected = []
+    for jdn, (d, m, y), (dl, ml, yl, leap) in days:
+        good = TotXau.getHoangHacDao(CanChi.ngay(d, m, y).split()[1], ml)[1] == 'Hoàng Đạo'
+        if good and jdn % 7 in (5, 6) and not TotXau.isTamNuong(dl, ml, yl) and not TotXau.isNguyetKy(dl, ml, yl):
+            expected.append(jdn)
+    assert list(query) == expected
+    assert len(query) == len(expected) > 0
+    assert list(~query) == [jdn for jdn, _, _ in days if jdn not in set(expected)]
+    assert (query ^ query) == DaySet(index, 0) and not (query ^ query)
+
+
+@pytest.mark.parametrize('name', sorted(IS))
+def test_counts_by_month_match_totxau(index, days, name):
+    checked = 0; counts = {}
+    for jdn, (d, m, y), (dl, ml, yl, leap) in days:
+        if leap or yl % 19 in GUESSED_LEAP:
+            continue
+        checked |= 1 << (jdn - index.start)
+        counts[(m, y)] = counts.get((m, y), 0) + IS[name](dl, ml, yl)
+    got = (index.flag(name) & DaySet(index, checked)).countByMonth()
+    assert got == {key: counts.get(key, 0) for key in got}
+    assert sum(counts.values()) > 0
+
+
+def test_month_counts_cover_index(index):
+    flag = index.flag('hoangDao')
+    counts = flag.countByMonth()
+    assert len(counts) == 24 and sum(counts.values()) == len(flag)
+    assert counts[(2, 2026)] == len(flag & index.month(2, 2026))
+    assert len(index.year(2027)) == 365 and len(index.all) == 730
@@ -0,0 +1,96 @@
+import asyncio
+import random
+import threading
+
+import pytest
+
+from vncalendar import Date, Ephemeris, LunarYear
+
+TIERS = (Ephemeris.FAST, Ephemeris.PRECISE, Ephemeris.AUTO)
+
+
+def test_using_is_scoped_per_thread():
+    default = Ephemeris.getTier()
+    barrier = threading.Barrier(len(TIERS))
+    seen = {}
+
+    def worker(tier):
+        with Ephemeris.using(tier):
+            barrier.wait()
+            seen[tier] = [Ephemeris.getTier(), LunarYear.get(1850)]
+            barrier.wait()
+        seen[tier].append(Ephemeris.getTier())
+
+    threads = [threading.Thread(target=worker, args=(t,)) for t in TIERS]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert Ephemeris.getTier() == default
+    for tier in TIERS:
+        inside, ly, after = seen[tier]
+        assert inside == tier and after == default
+        with Ephemeris.using(tier):
+            assert LunarYear.get(1850) is ly
+    assert seen[Ephemeris.FAST][1] is not seen[Ephemeris.PRECISE][1]
+
+
+def test_using_is_scoped_per_task():
+    async def task(tier, log):
+        with Ephemeris.using(tier):
+            for _ in range(3):
+                await asyncio.sleep(0)
+                log.append(Ephemeris.getTier())
+        log.append(Ephemeris.getTier())
+
+    async def main():
+        logs = {t: [] for t in TIERS}
+        with Ephemeris.using(Ephemeris.PRECISE):
+            await asyncio.gather(*(task(t, logs[t]) for t in TIERS))
+            assert Ephemeris.getTier() == Ephemeris.PRECISE
+        return logs
+
+    default = Ephemeris.getTier()
+    logs = asyncio.run(main())
+    for tier in TIERS:
+        assert logs[tier] == [tier] * 3 + [Ephemeris.PRECISE]
+    assert Ephemeris.getTier() == default
+
+
+def test_using_rejects_unknown_tier():
+    with pytest.raises(ValueError):
+        with Ephemeris.using('exact'):
+            pass
+    with pytest.raises(ValueError):
+        Ephemeris.setTier('exact')
+
+
+@pytest.mark.parametrize('year', [1200, 1850, 2150, 2800])
+def test_auto_is_precise_outside_auto_range(year):
+    jd = Date.convertDate2jdn(21, 3, year) + 0.25
+    assert not Ephemeris.AUTO_RANGE[0] <= jd < Ephemeris.AUTO_RANGE[1]
+    precise = Ephemeris.sunLongitude(jd, Ephemeris.PRECISE)
+    assert Ephemeris.sunLongitude(jd, Ephemeris.AUTO) == precise
+    assert Ephemeris.sunLongitudes([jd], Ephemeris.AUTO) == [precise]
+    with Ephemeris.using(Ephemeris.AUTO):
+        assert Ephemeris.sunLongitude(jd) == precise
+
+
+def test_auto_is_fast_inside_auto_range_away_from_boundaries():
+    jd = Date.convertDate2jdn(1, 5, 2025) + 0.5
+    fast = Ephemeris.sunLongitude(jd, Ephemeris.FAST)
+    assert abs((fast + 7.5) % 15 - 7.5) > Ephemeris.GUARD
+    assert Ephemeris.sunLongitude(jd, Ephemeris.AUTO) == fast
+
+
+@pytest.mark.parametrize('tier', TIERS)
+def test_sunLongitudes_matches_sunLongitude(tier):
+    rng = random.Random(33)
+    lo, hi = Date.convertDate2jdn(1, 1, 1000), Date.convertDate2jdn(1, 1, 3000)
+    jds = [rng.uniform(lo, hi) for _ in range(300)]
+    # Around the March 2025 equinox, inside the 'auto' guard band.
+    jds += [2460754.876 + i * 0.005 for i in range(-10, 11)]
+    jds += list(Ephemeris.AUTO_RANGE) + [Ephemeris.AUTO_RANGE[0] - 0.5, Ephemeris.AUTO_RANGE[1] - 0.5]
+    for apparent in (True, False):
+        batch = Ephemeris.sunLongitudes(iter(jds), tier, apparent)
+        assert batch == [Ephemeris.sunLongitude(jd, tier, apparent) for jd in jds]
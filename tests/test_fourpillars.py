@@ -0,0 +1,48 @@
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from vncalendar import CanChi, FourPillars
+
+BEFORE = ('Qúy Mão', 'Ất Sửu')
+AFTER = ('Giáp Thìn', 'Bính Dần')
+
+
+def test_lap_xuan_2024_boundary():
+    # Lập Xuân 2024 starts at 15:22 (UTC+7): year and month pillars switch together.
+    assert FourPillars.get(datetime(2024, 2, 4, 15, 21))[:2] == BEFORE
+    assert FourPillars.get(datetime(2024, 2, 4, 15, 22))[:2] == AFTER
+    aware = datetime(2024, 2, 4, 8, 22, tzinfo=timezone.utc)
+    assert FourPillars.get(aware)[:2] == AFTER
+    assert FourPillars.get(aware - timedelta(minutes=1))[:2] == BEFORE
+    assert FourPillars.get(aware.timestamp())[:2] == AFTER
+    # In UTC+8 the same instant is 16:22 local time.
+    assert FourPillars.get(datetime(2024, 2, 4, 16, 21), 8.0)[:2] == BEFORE
+
+
+def test_day_and_hour_pillars():
+    p = FourPillars.get(datetime(2026, 5, 7, 10, 30))
+    assert p[2] == CanChi.ngay(7, 5, 2026)
+    # The Tý hour at 23:00 already belongs to the next day.
+    assert FourPillars.get(datetime(2026, 5, 7, 23, 10))[2] == CanChi.ngay(8, 5, 2026)
+    assert FourPillars.get(date(2026, 5, 7)) == p[:3] + (None,)
+
+
+def test_numpy_arrays():
+    np = pytest.importorskip('numpy')
+    raw = ['2024-02-04T15:21', '2024-02-04T15:22', 'NaT']
+    for unit in ('m', 's', 'ns'):
+        res = FourPillars.getMany(np.array(raw, dtype=f'datetime64[{unit}]'))
+        assert [r[:2] if r else r for r in res] == [BEFORE, AFTER, None], unit
+    days = FourPillars.getMany(np.array(['2024-02-04', 'NaT'], dtype='datetime64[D]'))
+    assert days == [FourPillars.get(date(2024, 2, 4)), None]
+    assert FourPillars.get(np.datetime64('2024-02-04T15:22')) == FourPillars.get(datetime(2024, 2, 4, 15, 22))
+
+
+def test_pandas_series_and_values():
+    pd = pytest.importorskip('pandas')
+    s = pd.Series(pd.to_datetime(['2024-02-04 15:21', '2024-02-04 15:22', None]))
+    expected = [FourPillars.get(datetime(2024, 2, 4, 15, 21)), FourPillars.get(datetime(2024, 2, 4, 15, 22)), None]
+    assert FourPillars.getMany(s) == expected
+    assert FourPillars.getMany(s.values) == expected
+    assert FourPillars.getMany(s, asIndex=True)[1] == tuple(CanChi.toIndex(n) for n in expected[1])
@@ -0,0 +1,37 @@
+from datetime import datetime, timedelta
+
+from vncalendar import CanChi, Date, SolarAndLunar, TotXau
+
+
+def _jdn(dt):
+    return Date.convertDate2jdn(dt.day, dt.month, dt.year)
+
+
+def test_ty_hour_crosses_midnight():
+    timeline = TotXau.getGioTimeline(31, 12, 2025, 1, 1, 2026)
+    assert len(timeline) == 24
+    start, end, branch, name, _ = timeline[12]
+    assert (start, end, branch) == (datetime(2025, 12, 31, 23), datetime(2026, 1, 1, 1), 'Tý')
+    assert name == CanChi.fromIndex(CanChi.gioIndex(Date.convertDate2jdn(1, 1, 2026), 0))
+    assert name == CanChi.fromIndex(CanChi.gioIndex(Date.convertDate2jdn(31, 12, 2025), 23))
+    assert timeline[0][0] == datetime(2025, 12, 30, 23)
+    assert timeline[-1][1] == datetime(2026, 1, 1, 23)
+    for a, b in zip(timeline, timeline[1:]):
+        assert a[1] == b[0] and b[1] - b[0] == timedelta(hours=2)
+
+
+def test_flags_match_getGioHoangDao():
+    # Lunar 2026 has no leap month and 2026 % 19 is not one of the years
+    # TotXau.getGioHoangDao guesses as leap, so its lunar round trip is exact.
+    timeline = TotXau.getGioTimeline(1, 3, 2026, 30, 4, 2026)
+    assert len(timeline) == 61 * 12
+    for start, end, branch, name, good in timeline:
+        day = start + timedelta(hours=1)
+        dl, ml, yl, leap = SolarAndLunar.convertSolar2Lunar(day.day, day.month, day.year)
+        assert yl == 2026 and not leap
+        assert good == (branch in TotXau.getGioHoangDao(dl, ml, yl))
+        assert branch == TotXau.gioAm(start.hour)
+        assert name == CanChi.fromIndex(CanChi.gioIndex(_jdn(start), start.hour))
+    good = TotXau.getGioTimeline(1, 3, 2026, 30, 4, 2026, onlyGood=True)
+    assert good == [t for t in timeline if t[4]]
+    assert len(good) == 61 * 6
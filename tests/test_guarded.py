@@ -0,0 +1,25 @@
+import pytest
+
+from vncalendar import Date, SolarAndLunar, TietKhi
+from vncalendar.verify import Verify
+
+
+@pytest.mark.parametrize('y', [500, 501, 1000, 2025, 3192, 3193, 3200])
+@pytest.mark.parametrize('timeZone', [7.0, 8.0])
+def test_guarded_matches_reference_across_the_range(y, timeZone):
+    _, _, _, diverged = Verify.compareYear(y, timeZone, path='guarded')
+    assert diverged == []
+
+
+def test_known_divergences_are_fixed():
+    assert SolarAndLunar.convertSolar2LunarGuarded(4, 12, 408, 7) == SolarAndLunar.convertSolar2Lunar(4, 12, 408, 7)
+    assert SolarAndLunar.convertSolar2LunarGuarded(24, 4, 3193, 7) == SolarAndLunar.convertSolar2Lunar(24, 4, 3193, 7)
+
+
+@pytest.mark.parametrize('y', [100, 408, 3500])
+def test_outside_the_range_uses_the_reference(y):
+    for d, m in ((1, 1), (4, 12), (21, 6)):
+        assert SolarAndLunar.convertSolar2LunarGuarded(d, m, y) == SolarAndLunar.convertSolar2Lunar(d, m, y)
+        assert TietKhi.getTermGuarded(d, m, y) == TietKhi.getTerm(d, m, y)
+    lo, hi = SolarAndLunar.GUARDED_RANGE
+    assert (lo, hi) == (Date.convertDate2jdn(1, 1, 500), Date.convertDate2jdn(1, 1, 3201))
@@ -0,0 +1,93 @@
+import random
+
+import pytest
+
+from vncalendar import Date, HolidayCalendar
+
+# A Saturday day off on 31/12 gives a nghỉ bù in the next year.
+EXTRA = [(31, 12, 2022), (2, 5, 2025)]
+WORKDAYS = [(26, 4, 2025)]
+FIRST, LAST = Date.convertDate2jdn(1, 1, 2016), Date.convertDate2jdn(31, 12, 2034)
+
+
+@pytest.fixture(scope='module')
+def oracle():
+    cal = HolidayCalendar(2012, 2038, extra=EXTRA, workdays=WORKDAYS)
+    work = {jdn for jdn in range(Date.convertDate2jdn(1, 1, 2012), Date.convertDate2jdn(1, 1, 2039))
+            if cal.isWorkingDay(*Date.convertjdn2Date(jdn))}
+    return work
+
+
+def _fresh():
+    return HolidayCalendar(2025, extra=EXTRA, workdays=WORKDAYS)
+
+
+def _next(work, jdn, step):
+    jdn += step
+    while jdn not in work:
+        jdn += step
+    return jdn
+
+
+def _add(work, jdn, n):
+    if jdn not in work:
+        jdn = _next(work, jdn, 1)
+    for _ in range(abs(n)):
+        jdn = _next(work, jdn, 1 if n > 0 else -1)
+    return jdn
+
+
+def test_known_days():
+    cal = _fresh()
+    assert not cal.isWorkingDay(29, 1, 2025)      # Mùng 1 Tết Ất Tỵ
+    assert not cal.isWorkingDay(2, 9, 2025)
+    assert not cal.isWorkingDay(2, 5, 2025)       # extra
+    assert cal.isWorkingDay(26, 4, 2025)          # Saturday worked
+    assert cal.isHoliday(30, 4, 2025) and not cal.isHoliday(29, 4, 2025)
+
+
+def test_outside_built_range():
+    assert HolidayCalendar(2025).nextWorkingDay(5, 1, 2024) == (8, 1, 2024)
+    assert HolidayCalendar(2025).nextWorkingDay(5, 6, 2026) == (8, 6, 2026)
+    assert HolidayCalendar(2025).previousWorkingDay(1, 1, 2025) == (31, 12, 2024)
+    assert HolidayCalendar(2025).isWorkingDay(2, 1, 2019)
+
+
+def test_growth_matches_a_calendar_built_at_once(oracle):
+    cal = _fresh()
+    cal.isWorkingDay(1, 1, 2016); cal.isWorkingDay(31, 12, 2034)
+    got = {jdn for jdn in range(FIRST, LAST + 1) if cal.isWorkingDay(*Date.convertjdn2Date(jdn))}
+    assert got == {jdn for jdn in oracle if FIRST <= jdn <= LAST}
+
+
+def test_arithmetic_against_brute_force(oracle):
+    rng = random.Random(49)
+    for _ in range(300):
+        a, b = rng.randint(FIRST, LAST), rng.randint(FIRST, LAST)
+        da, db = Date.convertjdn2Date(a), Date.convertjdn2Date(b)
+        n = rng.randint(-400, 400)
+        lo, hi = min(a, b), max(a, b)
+        count = sum(1 for j in range(lo, hi + 1) if j in oracle)
+        assert _fresh().countWorkingDays(*da, *db) == (count if a <= b else -count)
+        assert _fresh().nextWorkingDay(*da) == Date.convertjdn2Date(_next(oracle, a, 1))
+        assert _fresh().previousWorkingDay(*da) == Date.convertjdn2Date(_next(oracle, a, -1))
+        assert _fresh().addWorkingDays(*da, n) == Date.convertjdn2Date(_add(oracle, a, n))
+
+
+def test_one_calendar_serves_many_queries(oracle):
+    cal = _fresh()
+    rng = random.Random(7)
+    for _ in range(200):
+        a = rng.randint(FIRST, LAST)
+        n = rng.randint(-60, 60)
+        assert cal.addWorkingDays(*Date.convertjdn2Date(a), n) == Date.convertjdn2Date(_add(oracle, a, n))
+        assert cal.nextWorkingDay(*Date.convertjdn2Date(a)) == Date.convertjdn2Date(_next(oracle, a, 1))
+
+
+def test_day_off_spilling_into_the_next_year():
+    # Without Tết Dương lịch, the nghỉ bù of Saturday 31/12/2022 is Monday 2/1/2023.
+    cal = HolidayCalendar(2023, fixed=(), extra=[(31, 12, 2022)])
+    assert not cal.isWorkingDay(2, 1, 2023)
+    assert cal.countWorkingDays(1, 1, 2023, 8, 1, 2023) == 4
+    assert cal.getHolidays(2023)[0] == ((2, 1, 2023), 'Nghỉ bù Ngày nghỉ', HolidayCalendar.COMPENSATORY)
+    assert cal.isHoliday(31, 12, 2022) and cal.fromYear < 2023
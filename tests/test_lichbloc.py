@@ -0,0 +1,40 @@
+import pytest
+
+from vncalendar import Date, LichBloc, TietKhi, VanSu
+
+
+@pytest.mark.parametrize('y', [2026, 2027, 2031])
+@pytest.mark.parametrize('timeZone', [7.0, 8.0])
+def test_term_starts_follow_term_table(y, timeZone):
+    days, terms = TietKhi.getTermTable(y, timeZone)
+    starts = {jdn: TietKhi.TERMS_LIST[t][0] for jdn, t in zip(days[1:], terms[1:])}
+    seen = {}
+    for page in LichBloc.pages(y, timeZone):
+        d, m, _ = page['date']
+        td = page['tietStart']
+        jdn = Date.convertDate2jdn(d, m, y)
+        if jdn in starts:
+            assert page['tiet'] == starts[jdn]
+            assert (td.day, td.month, td.year) == (d, m, y)
+            seen[jdn] = td
+        else:
+            assert td is None
+    assert len(seen) == len(starts) == 24
+
+
+@pytest.mark.parametrize('y, expected', [
+    (2026, ('2026-01-05 15:19', '2026-01-20 08:40')),
+    (2027, ('2027-01-05 21:05', '2027-01-20 14:29')),
+    (2031, ('2031-01-05 20:23', '2031-01-20 13:44')),
+])
+def test_january_terms_are_of_the_same_year(y, expected):
+    pages = {p['date']: p for p in LichBloc.pages(y)}
+    got = tuple(pages[(d, 1, y)]['tietStart'].strftime('%Y-%m-%d %H:%M') for d in (5, 20))
+    assert got == expected
+    assert LichBloc.fields(pages[(5, 1, y)])['tiet'] == VanSu.getInfo(5, 1, y, 's').splitlines()[-1]
+
+
+def test_last_line_matches_getInfo():
+    for page in LichBloc.pages(2027):
+        d, m, y = page['date']
+        assert LichBloc.fields(page)['tiet'] == VanSu.getInfo(d, m, y, 's').splitlines()[-1]
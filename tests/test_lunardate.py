@@ -0,0 +1,99 @@
+import random
+
+import pytest
+
+from vncalendar import Date, LunarDate, SolarAndLunar, SolarDate
+
+
+def _forward(a, b):
+    """Largest n with a.addMonths(n) on or before b (b not earlier than a)."""
+    n = 0
+    while a.addMonths(n + 1).jdn <= b.jdn:
+        n += 1
+    return n
+
+
+def test_monthsBetween_is_antisymmetric_and_matches_addMonths():
+    rng = random.Random(39)
+    lo, hi = Date.convertDate2jdn(1, 1, 2019), Date.convertDate2jdn(31, 12, 2026)
+    for _ in range(400):
+        a, b = LunarDate.fromJdn(rng.randint(lo, hi)), LunarDate.fromJdn(rng.randint(lo, hi))
+        assert a.monthsBetween(b) == -b.monthsBetween(a)
+        first, last = sorted((a, b), key=lambda x: x.jdn)
+        assert first.monthsBetween(last) == _forward(first, last)
+
+
+def test_monthsBetween_end_of_short_month():
+    # 30/4/2020 ÂL, then the leap 4th month has 29 days: 29/4N completes one month.
+    a = LunarDate(30, 4, 2020)
+    b = LunarDate(29, 4, 2020, 1)
+    assert a.monthsBetween(b) == 1
+    assert b.monthsBetween(a) == -1
+    assert a.monthsBetween(LunarDate(28, 4, 2020, 1)) == 0
+    assert LunarDate(28, 4, 2020, 1).monthsBetween(a) == 0
+    assert a.monthsBetween(SolarDate(a.solar.day, a.solar.month, a.solar.year)) == 0
+
+
+def test_hash_and_equality_by_day():
+    tet = SolarDate(17, 2, 2026)
+    assert tet == SolarDate.fromJdn(tet.jdn) == LunarDate(1, 1, 2026)
+    assert hash(tet) == hash(LunarDate(1, 1, 2026)) == hash(tet.jdn)
+    assert len({tet, SolarDate(17, 2, 2026), LunarDate(1, 1, 2026), tet + 1}) == 2
+    assert {tet: 'Tết'}[LunarDate(1, 1, 2026)] == 'Tết'
+    assert tet != (17, 2, 2026)
+
+
+def test_ordering_mixes_solar_and_lunar():
+    days = [SolarDate(1, 3, 2026), LunarDate(1, 1, 2026), SolarDate(31, 12, 2025), LunarDate(29, 12, 2025)]
+    assert [d.jdn for d in sorted(days)] == sorted(d.jdn for d in days)
+    assert LunarDate(29, 12, 2025) < SolarDate(17, 2, 2026) <= LunarDate(1, 1, 2026)
+    assert SolarDate(18, 2, 2026) > LunarDate(1, 1, 2026) >= SolarDate(17, 2, 2026)
+    assert max(days) == SolarDate(1, 3, 2026)
+
+
+def test_day_arithmetic():
+    a = SolarDate(28, 2, 2024)
+    assert (a + 2).toTuple() == (1, 3, 2024)
+    assert (2 + a) == a + 2 and isinstance(2 + a, SolarDate)
+    assert (a - 59).toTuple() == (31, 12, 2023)
+    assert SolarDate(1, 1, 2025) - a == 308
+    assert a - SolarDate(1, 1, 2025) == -308
+    b = LunarDate(29, 6, 2025, 1)
+    assert (b + 1).toTuple() == (1, 7, 2025, 0)
+    assert (b - 29).toTuple() == (30, 6, 2025, 0)
+    assert isinstance(b + 1, LunarDate)
+    assert LunarDate(1, 1, 2026) - SolarDate(29, 1, 2025) == 384
+    for bad in (1.5, '1', None):
+        with pytest.raises(TypeError):
+            a + bad
+        with pytest.raises(TypeError):
+            a - bad
+
+
+def test_cross_conversion_is_cached():
+    rng = random.Random(30)
+    lo, hi = Date.convertDate2jdn(1, 1, 1900), Date.convertDate2jdn(31, 12, 2100)
+    for _ in range(200):
+        s = SolarDate.fromJdn(rng.randint(lo, hi))
+        lunar = s.lunar
+        assert lunar is s.lunar and lunar.solar is s
+        assert lunar.toTuple() is lunar.toTuple()
+        assert lunar.toTuple() == tuple(SolarAndLunar.convertSolar2Lunar(*s.toTuple()))
+        assert LunarDate(*lunar.toTuple()).solar.toTuple() == s.toTuple()
+    l = LunarDate(15, 4, 2020, 1)
+    assert l.solar is l.solar and l.solar.lunar is l
+    assert l.solar.toTuple() == tuple(SolarAndLunar.convertLunar2Solar(15, 4, 2020, 1))
+
+
+def test_immutable_and_validated():
+    a = SolarDate(1, 1, 2025)
+    with pytest.raises(AttributeError):
+        a.jdn = 0
+    with pytest.raises(AttributeError):
+        del a.jdn
+    with pytest.raises(ValueError):
+        SolarDate(29, 2, 2025)
+    with pytest.raises(ValueError):
+        LunarDate(30, 6, 2025, 1)
+    with pytest.raises(ValueError):
+        LunarDate(1, 5, 2025, 1)
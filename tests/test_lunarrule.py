@@ -0,0 +1,81 @@
+from itertools import islice
+
+import pytest
+
+from vncalendar import CanChi, Date, Ephemeris, LunarRule, LunarYear, SolarAndLunar
+
+# Lunar 2025 has a leap 6th month (25/7 – 22/8/2025).
+RANGE = ((1, 1, 2025), (31, 12, 2025))
+RULES = {
+    'ram': (LunarRule(15), lambda l, cc: l[0] == 15),
+    'mung1_ram': (LunarRule([1, 15]), lambda l, cc: l[0] in (1, 15)),
+    'gio_to': (LunarRule(10, 3, leapMonths=False), lambda l, cc: l[:2] == (10, 3) and not l[3]),
+    'giap_ty': (LunarRule(canchi='Giáp Tý'), lambda l, cc: cc == 'Giáp Tý'),
+}
+
+
+def _reference(match):
+    j1 = Date.convertDate2jdn(*RANGE[0]); j2 = Date.convertDate2jdn(*RANGE[1])
+    out = []
+    for jdn in range(j1, j2 + 1):
+        d, m, y = Date.convertjdn2Date(jdn)
+        if match(tuple(SolarAndLunar.convertSolar2Lunar(d, m, y)), CanChi.ngay(d, m, y)):
+            out.append((d, m, y))
+    return out
+
+
+@pytest.mark.parametrize('name', RULES)
+def test_between_matches_day_by_day(name):
+    rule, match = RULES[name]
+    got = list(rule.between(*RANGE[0], *RANGE[1]))
+    assert got == _reference(match)
+
+
+def test_leap_month_occurrences():
+    leap = SolarAndLunar.convertLunar2Solar(15, 6, 2025, 1)
+    assert tuple(leap) in RULES['ram'][0].between(*RANGE[0], *RANGE[1])
+    assert tuple(leap) not in LunarRule(15, leapMonths=False).between(*RANGE[0], *RANGE[1])
+    assert len(list(LunarRule(15).between(*RANGE[0], *RANGE[1]))) == 12
+    assert len(list(LunarRule(15, leapMonths=False).between(*RANGE[0], *RANGE[1]))) == 11
+
+
+def test_expansion_is_lazy():
+    key = (2750, 7.0, Ephemeris.getTier())
+    LunarYear._cache._data.pop(key, None)
+    first = list(islice(LunarRule(15).between(1, 1, 2700, 31, 12, 2800), 3))
+    assert len(first) == 3
+    assert key not in LunarYear._cache._data
+
+
+def test_rrule_output():
+    assert LunarRule(15).toRRule(1, 1, 2025) == (
+        'DTSTART;VALUE=DATE:20250101\n'
+        'RRULE:RSCALE=CHINESE;FREQ=MONTHLY;BYMONTHDAY=15;SKIP=OMIT'
+    )
+    assert LunarRule([15, 1]).toRRule(1, 1, 2025).endswith('BYMONTHDAY=1,15;SKIP=OMIT')
+    assert LunarRule(10, 3, leapMonths=False).toRRule(7, 4, 2025) == (
+        'DTSTART;VALUE=DATE:20250407\n'
+        'RRULE:RSCALE=CHINESE;FREQ=YEARLY;BYMONTH=3;BYMONTHDAY=10;SKIP=OMIT'
+    )
+    assert 'BYMONTH=6,6L;' in LunarRule(30, 6, missingDay30='last').toRRule(1, 1, 2025)
+    assert LunarRule(30, 6, missingDay30='last').toRRule(1, 1, 2025).endswith('SKIP=BACKWARD')
+    giapTy = LunarRule(canchi='Giáp Tý').toRRule(1, 1, 2025)
+    first = _reference(RULES['giap_ty'][1])[0]
+    assert giapTy == 'DTSTART;VALUE=DATE:%04d%02d%02d\nRRULE:FREQ=DAILY;INTERVAL=60' % first[::-1]
+    assert LunarRule(1, canchi='Giáp Tý').toRRule(1, 1, 2025) is None
+
+
+@pytest.mark.parametrize('name', RULES)
+def test_rdate_output(name):
+    rule, match = RULES[name]
+    rdate = rule.toRDate(*RANGE[0], *RANGE[1])
+    assert rdate == 'RDATE;VALUE=DATE:' + ','.join('%04d%02d%02d' % (y, m, d) for d, m, y in _reference(match))
+
+
+def test_invalid_rules():
+    with pytest.raises(ValueError):
+        LunarRule()
+    with pytest.raises(ValueError):
+        LunarRule(canchi='Giáp Sửu')
+    with pytest.raises(ValueError):
+        LunarRule(1, missingDay30='next')
@@ -0,0 +1,46 @@
+import threading
+import time
+
+import pytest
+
+from vncalendar.main import _Memo
+
+
+def test_cold_key_is_built_once():
+    memo = _Memo()
+    calls = []
+    threads = 16
+    barrier = threading.Barrier(threads)
+    results = [None] * threads
+
+    def build(key):
+        calls.append(key)
+        time.sleep(0.05)
+        return ('built', key)
+
+    def worker(i):
+        barrier.wait()
+        results[i] = memo.get(2025, build, 2025)
+
+    pool = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+    assert calls == [2025]
+    assert all(r is results[0] for r in results)
+    assert len(memo) == 1 and memo._locks == {}
+
+
+def test_failed_build_leaves_no_lock():
+    memo = _Memo()
+
+    def fail():
+        raise RuntimeError('boom')
+
+    with pytest.raises(RuntimeError):
+        memo.get('k', fail)
+    assert memo._locks == {} and len(memo) == 0
+    assert memo.get('k', lambda: 42) == 42
+    memo.clear()
+    assert len(memo) == 0
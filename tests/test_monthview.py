@@ -0,0 +1,51 @@
+import pytest
+
+from vncalendar import CanChi, Date, LunarYear, SolarAndLunar, TietKhi, TotXau, VanSu
+
+
+def _termStart(d, m, y):
+    pd, pm, py = Date.convertjdn2Date(Date.convertDate2jdn(d, m, y) - 1)
+    term = TietKhi.getTerm(d, m, y)
+    return term if term != TietKhi.getTerm(pd, pm, py) else None
+
+
+@pytest.mark.parametrize('m, y, firstWeekday', [
+    (2, 2026, 0),     # Tết Bính Ngọ (17/2) and Lập Xuân (4/2)
+    (8, 2025, 6),     # inside the leap 6th month of 2025
+    (1, 2026, 0),     # Tiểu Hàn and Đại Hàn, grid starts in December
+    (12, 2033, 3),    # leap 11th month of 2033, grid ends in January
+])
+def test_cells_match_reference(m, y, firstWeekday):
+    cells = VanSu.monthView(m, y, firstWeekday)
+    assert len(cells) == 42
+    first = Date.convertDate2jdn(*cells[0]['date'])
+    assert first % 7 == firstWeekday
+    assert [c['inMonth'] for c in cells].count(True) == Date.dayMonth(m, y)
+    for i, cell in enumerate(cells):
+        d, mm, yy = cell['date']
+        assert Date.convertDate2jdn(d, mm, yy) == first + i
+        assert cell['inMonth'] == (mm == m)
+        lunar = SolarAndLunar.convertSolar2Lunar(d, mm, yy)
+        assert cell['lunar'] == tuple(lunar)
+        assert cell['hoangDao'] == TotXau.getHoangHacDao(CanChi.ngay(d, mm, yy).split()[1], lunar[1])
+        assert cell['tiet'] == _termStart(d, mm, yy)
+
+
+def test_grid_contents():
+    cells = {c['date']: c for c in VanSu.monthView(2, 2026)}
+    assert cells[(17, 2, 2026)]['lunar'] == (1, 1, 2026, 0)
+    assert cells[(4, 2, 2026)]['tiet'] == 'Lập Xuân'
+    leap = [c['lunar'] for c in VanSu.monthView(8, 2025) if c['lunar'][3]]
+    assert leap and all(l[1] == 6 for l in leap)
+
+
+@pytest.mark.parametrize('y, leapMonth', [
+    (1898, 3), (1900, 8), (2012, 4), (2014, 9), (2017, 6), (2020, 4),
+    (2023, 2), (2025, 6), (2028, 5), (2033, 11), (2024, 0),
+])
+def test_leap_month_offset(y, leapMonth):
+    # getLeapMonthOffset used to compare sectors with degrees, always giving month 11.
+    assert LunarYear.get(y).leapMonth == leapMonth
+    if leapMonth:
+        d, m, yy = SolarAndLunar.convertLunar2Solar(1, leapMonth, y, 1)
+        assert SolarAndLunar.convertSolar2Lunar(d, m, yy) == (1, leapMonth, y, 1)
@@ -0,0 +1,66 @@
+import unicodedata
+
+import pytest
+
+from vncalendar import Date, LunarYear, SolarAndLunar
+from vncalendar.parse import Parser
+
+
+def test_leap_month_lunar_dates():
+    # 2025 has a leap 6th month and no leap 4th month.
+    jdn, solar, lunar, isLunar = Parser.parseOne('23/6N/2025 ÂL')
+    assert (solar, lunar, isLunar) == ((16, 8, 2025), (23, 6, 2025, 1), True)
+    assert Date.convertDate2jdn(*solar) == jdn
+    assert Parser.parseOne('23/6n/2025')[2] == (23, 6, 2025, 1)
+    assert Parser.parseOne('23/6/2025 al')[2] == (23, 6, 2025, 0)
+    with pytest.raises(ValueError, match='no leap month 4'):
+        Parser.parseOne('1/4N/2025')
+
+
+def test_day_30_of_a_short_month():
+    ly = LunarYear.get(2025)
+    assert ly.monthLength(2, 0) == 29 and ly.monthLength(1, 0) == 30
+    with pytest.raises(ValueError, match='has 29 days'):
+        Parser.parseOne('30/2/2025 ÂL')
+    assert Parser.parseOne('30/1/2025 ÂL')[1] == (27, 2, 2025)
+
+
+@pytest.mark.parametrize('s', ['15/08/2025', '15/8/2025', '15-8-2025', '15.8.2025', '2025-08-15', ' 2025-8-15 '])
+def test_gregorian_forms(s):
+    jdn, solar, lunar, isLunar = Parser.parseOne(s)
+    assert solar == (15, 8, 2025) and not isLunar
+    assert jdn == Date.convertDate2jdn(15, 8, 2025)
+    assert lunar == tuple(SolarAndLunar.convertSolar2Lunar(15, 8, 2025))
+
+
+def test_decomposed_unicode_suffix():
+    s = unicodedata.normalize('NFD', '15/8/2025 ÂL')
+    assert Parser.parseOne(s)[2] == (15, 8, 2025, 0)
+
+
+@pytest.mark.parametrize('s', ['29/2/2025', '2025-02-29', '31/4/2025', '0/1/2025', '15/13/2025', 'abc', ''])
+def test_invalid_gregorian(s):
+    with pytest.raises(ValueError):
+        Parser.parseOne(s)
+
+
+def test_bulk_error_mask_and_dedup():
+    strings = ['15/8/2025', None, float('nan'), '30/2/2025 ÂL', '15/8/2025', '23/6N/2025 ÂL', 20250815]
+    res = Parser.parse(strings)
+    assert list(res) == list(Parser.FIELDS)
+    assert all(len(col) == len(strings) for col in res.values())
+    assert res['ok'] == [True, False, False, False, True, True, False]
+    for i, ok in enumerate(res['ok']):
+        if ok:
+            assert res['error'][i] is None
+        else:
+            assert res['error'][i]
+            assert res['jdn'][i] is res['solar'][i] is res['lunar'][i] is res['isLunar'][i] is None
+    assert res['solar'][0] == res['solar'][4] == (15, 8, 2025)
+    assert res['isLunar'][5] is True and res['isLunar'][0] is False
+
+
+def test_bulk_pandas_series():
+    pd = pytest.importorskip('pandas')
+    res = Parser.parse(pd.Series(['2025-08-15', None, '1/4N/2025']))
+    assert res['ok'] == [True, False, False]
@@ -0,0 +1,47 @@
+import pytest
+
+from vncalendar import CanChi, Date, DayIndex, LunarYear, RulePack, TotXau
+
+
+def _builtinRules():
+    byMonth = lambda table: {'by': 'lunarMonth', 'map': dict(table)}
+    hoangDao = {m: [b for b in CanChi.CHI
+                    if TotXau.HOANG_HAC_DAO[TotXau.getHoangHacDaoIndex(CanChi.CHI.index(b), m)][1] == 'Hoàng Đạo']
+                for m in range(1, 13)}
+    daiBai = {stem: byMonth(months) for stem, months in TotXau.DAI_BAI.items()}
+    return [
+        {'name': 'rHoangDao', 'kind': 'tot', 'when': {'dayBranch': byMonth(hoangDao)}},
+        {'name': 'rTamNuong', 'kind': 'xau', 'when': {'lunarDay': sorted(TotXau.TAM_NUONG)}},
+        {'name': 'rNguyetPha', 'kind': 'xau', 'when': {'dayBranch': byMonth(TotXau.NGUYET_PHA)}},
+        {'name': 'rSatChu', 'kind': 'xau', 'when': {'dayBranch': byMonth(TotXau.SAT_CHU)}},
+        {'name': 'rThoTu', 'kind': 'xau', 'when': {'dayBranch': byMonth(TotXau.THO_TU)}},
+        {'name': 'rVangVong', 'kind': 'xau', 'when': {'dayBranch': byMonth(TotXau.VANG_VONG)}},
+        {'name': 'rNguyetKy', 'kind': 'xau', 'when': {'lunarDay': sorted(TotXau.NGUYET_KY)}},
+        {'name': 'rDaiBai', 'kind': 'xau', 'when': {'dayCanChi': {'by': 'yearStem', 'map': daiBai}}},
+    ]
+
+
+@pytest.mark.parametrize('y', [2020, 2025])
+def test_compiled_pack_matches_builtin_flags(y):
+    pack = RulePack(_builtinRules(), 'builtin')
+    index = DayIndex(y, rules=pack)
+    for flag, rule in zip(DayIndex.FLAGS, pack.names):
+        assert index.flag(rule) == index.flag(flag), flag
+        assert len(index.flag(flag)) > 0 or flag == 'daiBai'
+
+
+@pytest.mark.parametrize('y', [2024, 2026])
+def test_compiled_pack_matches_TotXau(y):
+    pack = RulePack(_builtinRules())
+    checks = dict(zip(pack.names[1:], (TotXau.isTamNuong, TotXau.isNguyetPha, TotXau.isSatChu, TotXau.isThoTu,
+                                       TotXau.isVangVong, TotXau.isNguyetKy, TotXau.isDaiBai)))
+    for jdn in range(Date.convertDate2jdn(1, 1, y), Date.convertDate2jdn(31, 12, y) + 1):
+        dl, ml, yl, leap = LunarYear.containing(jdn).locate(jdn)
+        got = set(pack.getDay(*Date.convertjdn2Date(jdn)))
+        star = TotXau.getHoangHacDao(CanChi.CHI[(jdn + 1) % 12], ml)
+        assert ('rHoangDao' in got) == (star[1] == 'Hoàng Đạo')
+        if leap or yl % 19 in (0, 3, 6, 9, 11, 14, 17):
+            # TotXau.is* take no leap flag and pass leap=1 for these lunar years.
+            continue
+        for name, check in checks.items():
+            assert (name in got) == check(dl, ml, yl), (name, Date.convertjdn2Date(jdn))
@@ -0,0 +1,88 @@
+import multiprocessing
+import os
+import subprocess
+import sys
+
+import pytest
+
+from vncalendar import LunarYear, TietKhi
+from vncalendar.shared import DayTable
+
+pytest.importorskip('multiprocessing.shared_memory')
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+YEARS = (2019, 2027)
+
+CHILD = '''
+import sys
+from vncalendar import LunarYear, TietKhi
+from vncalendar.shared import DayTable
+
+def fields(ly):
+    return ly.year, ly.k, ly.starts, ly.months, ly.end, ly.leapMonth
+
+def check(name, fromYear, toYear):
+    table = DayTable.attach(name)
+    table.install()
+    LunarYear._cache.clear(); TietKhi._termTables.clear()
+    years = range(fromYear, toYear + 1)
+    shared = [(fields(LunarYear.get(y)), TietKhi.getTermTable(y)) for y in years]
+    restored = [fields(table.lunarYear(y)) for y in years]
+    table.close()
+    LunarYear._cache.clear(); TietKhi._termTables.clear()
+    fresh = [(fields(LunarYear.get(y)), TietKhi.getTermTable(y)) for y in years]
+    return shared == fresh and restored == [f for f, _ in fresh]
+
+if __name__ == '__main__':
+    print(check(sys.argv[1], int(sys.argv[2]), int(sys.argv[3])))
+'''
+
+
+def _childCheck(name, queue):
+    namespace = {}
+    exec(CHILD.replace("if __name__ == '__main__':", 'if False:'), namespace)
+    queue.put(namespace['check'](name, *YEARS))
+
+
+@pytest.fixture
+def published():
+    table = DayTable.build(*YEARS)
+    name = table.publish()
+    yield table, name
+    table.unlink()
+
+
+def test_independent_process_attaches_and_matches(published):
+    table, name = published
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    out = subprocess.run([sys.executable, '-c', CHILD, name, *map(str, YEARS)],
+                         capture_output=True, text=True, env=env, timeout=120)
+    assert out.stdout.strip() == 'True', out.stderr
+    # The worker's exit must not have destroyed the publisher's segment.
+    again = DayTable.attach(name)
+    assert again.lunar(table.start) == table.lunar(table.start)
+    again.close()
+
+
+def test_multiprocessing_child_attaches_and_matches(published):
+    _, name = published
+    ctx = multiprocessing.get_context('spawn')
+    queue = ctx.Queue()
+    proc = ctx.Process(target=_childCheck, args=(name, queue))
+    proc.start()
+    ok = queue.get(timeout=120)
+    proc.join(60)
+    assert ok and proc.exitcode == 0
+
+
+def test_install_close_and_unlink():
+    table = DayTable.build(*YEARS)
+    name = table.publish()
+    worker = DayTable.attach(name)
+    worker.install()
+    assert LunarYear._shared is worker and TietKhi._shared is worker
+    worker.close()
+    assert LunarYear._shared is None and TietKhi._shared is None
+    table.unlink()
+    with pytest.raises(FileNotFoundError):
+        DayTable.attach(name)
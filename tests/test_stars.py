@@ -0,0 +1,44 @@
+import pytest
+
+from vncalendar import CanChi, Date, SolarAndLunar, Stars
+
+
+@pytest.mark.parametrize('date, canchi, lunarMonth, good, bad', [
+    # Tết Bính Ngọ: month 1 gives Thiên Đức Hợp and Nguyệt Không on Nhâm,
+    # Thiên Hỷ and Nguyệt Yếm on Tuất.
+    ((17, 2, 2026), 'Nhâm Tuất', 1, ('Thiên Đức Hợp', 'Nguyệt Không', 'Thiên Hỷ'), ('Nguyệt Yếm',)),
+    # Month 12: Thiên Đức and Nguyệt Đức on Canh, Giải Thần on Ngọ.
+    ((1, 1, 2025), 'Canh Ngọ', 12, ('Thiên Đức', 'Nguyệt Đức', 'Giải Thần'), ()),
+    # Month 7: Thiên Phú on Tuất, Cửu Không on Tuất, Trùng Phục on Giáp.
+    ((2, 9, 2025), 'Giáp Tuất', 7, ('Thiên Phú',), ('Cửu Không', 'Trùng Phục')),
+    # Month 1: Nguyệt Sát on Sửu.
+    ((20, 2, 2026), 'Ất Sửu', 1, (), ('Nguyệt Sát',)),
+    # Leap 6th month uses the rules of month 6: no star falls on Tân Hợi.
+    ((10, 8, 2025), 'Tân Hợi', 6, (), ()),
+])
+def test_known_days(date, canchi, lunarMonth, good, bad):
+    assert CanChi.ngay(*date) == canchi
+    assert SolarAndLunar.convertSolar2Lunar(*date)[1] == lunarMonth
+    assert Stars.getDay(*date) == (good, bad)
+    assert Stars.lookup(lunarMonth, CanChi.toIndex(canchi)) == (good, bad)
+
+
+def test_lookup_follows_rules():
+    for ml in range(1, 13):
+        for cc in range(60):
+            name = CanChi.fromIndex(cc).split()
+            good, bad = Stars.lookup(ml, cc)
+            hits = [n for n, kind, days in Stars.RULES if days[ml - 1] in name]
+            assert list(good) + list(bad) == hits
+
+
+@pytest.mark.parametrize('tz', [7.0, 8.0])
+def test_getRange_matches_getDay(tz):
+    # Across Tết 2025, the leap 6th month and Tết 2026.
+    res = Stars.getRange(15, 1, 2025, 28, 2, 2026, tz)
+    first = Date.convertDate2jdn(15, 1, 2025)
+    assert len(res) == Date.convertDate2jdn(28, 2, 2026) - first + 1
+    for i, (date, good, bad) in enumerate(res):
+        assert date == tuple(Date.convertjdn2Date(first + i))
+        assert (good, bad) == Stars.getDay(*date, timeZone=tz)
+    assert Stars.getRange(2, 1, 2025, 1, 1, 2025) == []
@@ -0,0 +1,41 @@
+import pytest
+
+from vncalendar import CanChi, Date, TietKhi, VanSu
+
+
+def _monthBranch(jdn):
+    return 2 + (TietKhi.getTermAt(jdn)[0] - 21) % 24 // 2
+
+
+def test_truc_repeats_on_lap_xuan():
+    # Lập Xuân 2026 starts on 4/2: the Dần month begins and the Trực repeats.
+    assert TietKhi.getTerm(4, 2, 2026) == 'Lập Xuân' != TietKhi.getTerm(3, 2, 2026)
+    assert [VanSu.getTruc(d, 2, 2026) for d in range(2, 7)] == ['Phá', 'Nguy', 'Nguy', 'Thành', 'Thu']
+    # Kiến falls on the day whose branch is the month branch (Dần after Lập Xuân).
+    kien = next(d for d in range(4, 20) if VanSu.getTruc(d, 2, 2026) == 'Kiến')
+    assert CanChi.ngay(kien, 2, 2026).split()[1] == 'Dần'
+
+
+def test_truc_repeats_only_when_month_branch_changes():
+    first = Date.convertDate2jdn(1, 1, 2025); last = Date.convertDate2jdn(31, 12, 2026)
+    repeats = 0
+    for jdn in range(first + 1, last + 1):
+        a, b = VanSu.getTrucIndex(jdn - 1), VanSu.getTrucIndex(jdn)
+        if _monthBranch(jdn) != _monthBranch(jdn - 1):
+            assert a == b
+            repeats += 1
+        else:
+            assert b == (a + 1) % 12
+        assert VanSu.TRUC[b] != 'Kiến' or (jdn + 1) % 12 == _monthBranch(jdn) % 12
+    assert repeats == 24
+
+
+@pytest.mark.parametrize('tz', [7.0, 8.0])
+def test_getTrucRange_matches_getTruc(tz):
+    res = VanSu.getTrucRange(20, 12, 2024, 10, 1, 2027, tz)
+    first = Date.convertDate2jdn(20, 12, 2024)
+    assert len(res) == Date.convertDate2jdn(10, 1, 2027) - first + 1
+    for i, (date, truc) in enumerate(res):
+        assert date == tuple(Date.convertjdn2Date(first + i))
+        assert truc == VanSu.getTruc(*date, timeZone=tz)
+    assert VanSu.getTrucRange(2, 1, 2025, 1, 1, 2025) == []
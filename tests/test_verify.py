@@ -0,0 +1,38 @@
+import io
+
+import pytest
+
+from vncalendar.verify import FIELDS, Verify, main
+
+
+@pytest.mark.parametrize('y', [1900, 1984, 2025, 2033, 2100])
+@pytest.mark.parametrize('timeZone', [7.0, 8.0])
+def test_fast_path_matches_reference(y, timeZone):
+    tz, year, digest, diverged = Verify.compareYear(y, timeZone)
+    assert (tz, year) == (timeZone, y)
+    assert diverged == []
+    # Without the reference the digest is taken over the fast records: identical when they agree.
+    assert Verify.compareYear(y, timeZone, withReference=False)[2] == digest
+
+
+def test_divergences_are_reported(monkeypatch):
+    monkeypatch.setattr(Verify, 'fast', staticmethod(lambda jdn, timeZone=7.0: (0,) * len(FIELDS)))
+    diverged = Verify.compareYear(2025, 7.0, limit=3)[3]
+    assert len(diverged) == 3
+    out = io.StringIO()
+    Verify.report(*diverged[0], 7.0, out=out)
+    assert out.getvalue().startswith('DIVERGENCE 01/01/2025')
+
+
+def test_golden_round_trip(tmp_path):
+    results = [Verify.compareYear(y, tz, withReference=False) for tz in (7.0, 8.0) for y in (2024, 2025)]
+    f = io.StringIO()
+    Verify.writeGolden(results, f)
+    f.seek(0)
+    assert Verify.readGolden(f) == {(tz, y): digest for tz, y, digest, _ in results}
+
+    path = tmp_path / 'golden.txt'
+    path.write_text(f.getvalue(), encoding='utf-8')
+    assert main(['--check', str(path), '--workers', '1']) == 0
+    path.write_text(f.getvalue().replace(results[0][2], '0' * 16), encoding='utf-8')
+    assert main(['--check', str(path), '--workers', '1']) == 1
@@ -1,12 +1,27 @@
-from main import Date, SolarAndLunar, CanChi, TotXau, TietKhi, VanSu, Stars, Person
+from .main import Date, Ephemeris, SolarAndLunar, MoonPhase, LunarYear, SolarDate, LunarDate, LunarRule, CanChi, TotXau, TietKhi, VanSu, DaySet, DayIndex, LichBloc, Annotator, Stars, RulePack, FourPillars, Person, Cohort, HolidayCalendar
+from . import accessor  # registers Series.vncal when pandas is installed
 __all__ = [
     'Date',
+    'Ephemeris',
     'SolarAndLunar',
+    'MoonPhase',
+    'LunarYear',
+    'SolarDate',
+    'LunarDate',
+    'LunarRule',
     'CanChi',
     'TotXau',
     'TietKhi',
     'VanSu',
+    'DaySet',
+    'DayIndex',
+    'LichBloc',
+    'Annotator',
     'Stars',
+    'RulePack',
+    'FourPillars',
     'Person',
+    'Cohort',
+    'HolidayCalendar',
     ]
 
@@ -0,0 +1,140 @@
+# ===================================================================
+# Bộ truy cập .vncal cho pandas (tùy chọn, chỉ đăng ký khi có pandas).
+#
+# Optional pandas accessor: registers `Series.vncal` when pandas is
+# importable. Each distinct day of the Series is converted once with the
+# memoized tables, then broadcast back to the rows.
+#
+# Usage:
+#     import pandas as pd
+#     import vncalendar
+#     s = pd.Series(pd.date_range('2025-01-01', periods=5, freq='D'))
+#     s.vncal.lunar_day; s.vncal.canchi_day; s.vncal.at(8.0).solar_term
+# ===================================================================
+
+from .main import LunarYear, CanChi, TotXau, TietKhi
+
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError:
+    pd = None
+
+
+class VnCalAccessor:
+    timeZone = 7.0
+
+    def __init__(self, series, timeZone=None):
+        """
+        Wrap a datetime Series. Naive values are local wall time in timeZone,
+        aware values are converted to it.
+
+        Args:
+            series (pandas.Series): Series of datetime64 values.
+            timeZone (float, optional): Time zone offset in hours. Default is VnCalAccessor.timeZone.
+
+        Raises:
+            AttributeError: If the Series does not hold datetimes (as pandas expects from accessors).
+        """
+        if not pd.api.types.is_datetime64_any_dtype(series.dtype):
+            raise AttributeError('.vncal accessor only works on datetime Series')
+        self._s = series
+        if timeZone is not None:
+            self.timeZone = timeZone
+
+    def at(self, timeZone):
+        """
+        Return the accessor of the same Series in another time zone.
+        """
+        return VnCalAccessor(self._s, timeZone)
+
+    def _days(self):
+        """
+        Return (codes, jdns): codes maps each row to a distinct local day (-1 for NaT),
+        jdns holds the Julian Day Number of every distinct day.
+        """
+        s = self._s
+        if s.dt.tz is not None:
+            s = s.dt.tz_convert('UTC').dt.tz_localize(None) + pd.Timedelta(hours=self.timeZone)
+        codes, uniques = pd.factorize(s.dt.floor('D'))
+        jdns = uniques.values.astype('datetime64[D]').astype('int64') + 2440588
+        return codes, jdns.tolist()
+
+    def _lunar(self, i):
+        codes, jdns = self._days()
+        values = [LunarYear.containing(j, self.timeZone).locate(j)[i] for j in jdns]
+        return codes, values
+
+    def _take(self, codes, values, fill=0):
+        """
+        Broadcast per-day values to the rows, fill where the row is NaT.
+        """
+        res = np.asarray(values or [fill], dtype=np.int64)[codes.clip(0)]
+        res[codes < 0] = fill
+        return res
+
+    def _integers(self, codes, values, dtype='Int64'):
+        res = pd.array(self._take(codes, values), dtype='Int64').astype(dtype)
+        res[codes < 0] = None
+        return pd.Series(res, index=self._s.index, name=self._s.name)
+
+    def _categories(self, codes, values, categories):
+        res = pd.Categorical.from_codes(self._take(codes, values, -1), categories=categories)
+        return pd.Series(res, index=self._s.index, name=self._s.name)
+
+    @property
+    def lunar_day(self):
+        """Lunar day (1–30), nullable Int64."""
+        return self._integers(*self._lunar(0))
+
+    @property
+    def lunar_month(self):
+        """Lunar month (1–12), nullable Int64."""
+        return self._integers(*self._lunar(1))
+
+    @property
+    def lunar_year(self):
+        """Lunar year, nullable Int64."""
+        return self._integers(*self._lunar(2))
+
+    @property
+    def is_leap(self):
+        """True inside a leap month, nullable boolean."""
+        codes, values = self._lunar(3)
+        return self._integers(codes, [bool(v) for v in values], 'boolean')
+
+    @property
+    def canchi_day(self):
+        """Stem-Branch of the day, categorical over the 60 names."""
+        codes, jdns = self._days()
+        return self._categories(codes, [CanChi.ngayIndex(j) for j in jdns],
+                                [CanChi.fromIndex(i) for i in range(60)])
+
+    @property
+    def solar_term(self):
+        """Solar term of the day, categorical over the 24 names."""
+        codes, jdns = self._days()
+        return self._categories(codes, [TietKhi.getTermAt(j, self.timeZone)[0] for j in jdns],
+                                [name for name, _ in TietKhi.TERMS_LIST])
+
+    @property
+    def hoang_dao(self):
+        """True on Hoàng Đạo days, nullable boolean."""
+        codes, jdns = self._days()
+        values = [TotXau.HOANG_HAC_DAO[self._star(j)][1] == 'Hoàng Đạo' for j in jdns]
+        return self._integers(codes, values, 'boolean')
+
+    @property
+    def hoang_dao_star(self):
+        """Hoàng / Hắc Đạo star of the day, categorical over the 12 names."""
+        codes, jdns = self._days()
+        return self._categories(codes, [self._star(j) for j in jdns],
+                                [name for name, _ in TotXau.HOANG_HAC_DAO])
+
+    def _star(self, j):
+        m = LunarYear.containing(j, self.timeZone).locate(j)[1]
+        return TotXau.getHoangHacDaoIndex((j + 1) % 12, m)
+
+
+if pd is not None:
+    pd.api.extensions.register_series_accessor('vncal')(VnCalAccessor)
@@ -0,0 +1,163 @@
+# ===================================================================
+# Giao diện asyncio: gom các yêu cầu đồng thời thành lô.
+#
+# Asyncio facade. Lookups awaited by concurrent coroutines within a short
+# window are coalesced into one batch, computed on an executor so the
+# event loop is never blocked, and identical dates pending or in flight
+# are computed once and shared by every waiter.
+#
+# Usage:
+#     acal = AsyncCalendar()                          # default executor
+#     acal = AsyncCalendar(executor=ProcessPoolExecutor(4), window=0.005)
+#     await acal.lunar((7, 5, 2026))                  # (21, 3, 2026, 0)
+#     await acal.info(date(2026, 5, 7))               # VanSu.getInfo text
+#     await asyncio.gather(*(acal.lunar(d) for d in days))
+# ===================================================================
+
+import asyncio
+
+from .main import Date, LunarYear, VanSu
+
+
+def _compute(kind, keys, timeZone):
+    """
+    Compute one batch. Returns (True, value) or (False, exception) per key, so one
+    bad date does not fail the whole batch. Module level, so process pools can pickle it.
+    """
+    res = []
+    for d, m, y in keys:
+        try:
+            if kind == 'lunar':
+                jdn = Date.convertDate2jdn(d, m, y)
+                res.append((True, LunarYear.containing(jdn, timeZone).locate(jdn)))
+            else:
+                res.append((True, VanSu.getInfo(d, m, y, 's')))
+        except Exception as e:
+            res.append((False, e))
+    return res
+
+
+class AsyncCalendar:
+    def __init__(self, timeZone=7.0, window=0.002, maxBatch=1024, executor=None):
+        """
+        Create the facade. Use it from one event loop.
+
+        Args:
+            timeZone (float, optional): Time zone offset in hours. Default is 7.0.
+            window (float, optional): Seconds a batch stays open after its first request.
+                Default is 0.002.
+            maxBatch (int, optional): Batch size that triggers an immediate flush. Default is 1024.
+            executor (concurrent.futures.Executor, optional): Where batches run.
+                Default is the event loop's default executor.
+        """
+        self.timeZone = timeZone; self.window = window
+        self.maxBatch = maxBatch; self.executor = executor
+        self._pending = {'lunar': {}, 'info': {}}
+        self._inflight = {'lunar': {}, 'info': {}}
+        self._timers = {}
+        self.stats = {'requests': 0, 'shared': 0, 'batches': 0, 'computed': 0}
+
+    async def lunar(self, day):
+        """
+        Return the lunar date of a Gregorian date.
+
+        Args:
+            day (datetime.date | tuple[int, int, int]): Date, or (day, month, year).
+
+        Returns:
+            tuple[int, int, int, int]: (lunar_day, lunar_month, lunar_year, is_leap_month).
+        """
+        return await self._submit('lunar', day)
+
+    async def info(self, day):
+        """
+        Return VanSu.getInfo of a Gregorian date.
+
+        Args:
+            day (datetime.date | tuple[int, int, int]): Date, or (day, month, year).
+
+        Returns:
+            str: Almanac summary of the day.
+
+        Raises:
+            ValueError: If the facade uses a time zone other than 7.0, since
+                VanSu.getInfo is computed for Vietnam time only.
+        """
+        if self.timeZone != 7.0:
+            raise ValueError(f'info is only available for timeZone 7.0, not {self.timeZone}')
+        return await self._submit('info', day)
+
+    async def flush(self):
+        """
+        Start every pending batch now and wait for the batches in flight.
+        """
+        for kind in self._pending:
+            self._flush(kind)
+        waiting = [f for inflight in self._inflight.values() for f in inflight.values()]
+        if waiting:
+            await asyncio.wait(waiting)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.flush()
+
+    @staticmethod
+    def _key(day):
+        """
+        Return (day, month, year) of a date argument, raise ValueError if it is not a valid date.
+        """
+        if isinstance(day, tuple):
+            d, m, y = (int(v) for v in day)
+        else:
+            d, m, y = day.day, day.month, day.year
+        if not (1 <= m <= 12 and 1 <= d <= Date.dayMonth(m, y)):
+            raise ValueError(f'Invalid date: {d}/{m}/{y}')
+        return d, m, y
+
+    async def _submit(self, kind, day):
+        key = AsyncCalendar._key(day)
+        self.stats['requests'] += 1
+        future = self._pending[kind].get(key) or self._inflight[kind].get(key)
+        if future is not None:
+            self.stats['shared'] += 1
+        else:
+            loop = asyncio.get_running_loop()
+            future = self._pending[kind][key] = loop.create_future()
+            if len(self._pending[kind]) >= self.maxBatch:
+                self._flush(kind)
+            elif kind not in self._timers:
+                self._timers[kind] = loop.call_later(self.window, self._flush, kind)
+        # Shielded, so a cancelled caller does not cancel the result shared with others.
+        return await asyncio.shield(future)
+
+    def _flush(self, kind):
+        timer = self._timers.pop(kind, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending[kind]
+        if not batch:
+            return
+        self._pending[kind] = {}
+        self._inflight[kind].update(batch)
+        self.stats['batches'] += 1; self.stats['computed'] += len(batch)
+        loop = asyncio.get_running_loop()
+        keys = list(batch)
+        job = loop.run_in_executor(self.executor, _compute, kind, keys, self.timeZone)
+        job.add_done_callback(lambda job: self._done(kind, batch, keys, job))
+
+    def _done(self, kind, batch, keys, job):
+        inflight = self._inflight[kind]
+        for key in keys:
+            inflight.pop(key, None)
+        error = job.exception() if not job.cancelled() else asyncio.CancelledError()
+        results = [(False, error)] * len(keys) if error else job.result()
+        for key, (ok, value) in zip(keys, results):
+            future = batch[key]
+            if future.done():
+                continue
+            if ok:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
@@ -24,8 +24,54 @@
 # NOTE (!) This is a Vietnamese website.
 # ===================================================================
 
+from bisect import bisect_right
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import date, datetime, timedelta
+from itertools import accumulate, product
+import html
+import json
 import math
+import threading
+
+class _Memo:
+    """
+    Memo table shared by all threads.
+
+    Reads of a built entry take no lock. Building a missing entry takes a
+    per-key lock, so threads racing on the same cold key wait for one
+    build instead of each computing it. Entries are never mutated after
+    they are published.
+    """
+    __slots__ = ('_data', '_locks', '_lock')
+
+    def __init__(self):
+        self._data = {}; self._locks = {}
+        self._lock = threading.Lock()
+
+    def get(self, key, build, *args):
+        value = self._data.get(key)
+        if value is not None:
+            return value
+        with self._lock:
+            lock = self._locks.setdefault(key, threading.Lock())
+        try:
+            with lock:
+                value = self._data.get(key)
+                if value is None:
+                    value = self._data[key] = build(*args)
+        finally:
+            with self._lock:
+                self._locks.pop(key, None)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
 
 class Date:
     @staticmethod
@@ -236,7 +282,248 @@ class Date:
         return a[h]
 
 
+class Ephemeris:
+    FAST = 'fast'
+    PRECISE = 'precise'
+    AUTO = 'auto'
+    tier = 'fast'
+    GUARD = 0.02
+    # Julian Dates of 1900-01-01 and 2101-01-01: the span where the 'auto' guard
+    # was checked against 'precise'. Outside it 'auto' computes precisely.
+    AUTO_RANGE = (2415020.5, 2488069.5)
+    _scoped = ContextVar('vncalendar_tier', default=None)
+
+    # Periodic terms (amplitude, phase, rate) of the solar longitude series
+    # from Reingold & Dershowitz, Calendrical Calculations.
+    SUN_TERMS = (
+        (403406, 270.54861, 0.9287892), (195207, 340.19128, 35999.1376958),
+        (119433, 63.91854, 35999.4089666), (112392, 331.26220, 35998.7287385),
+        (3891, 317.843, 71998.20261), (2819, 86.631, 71998.4403),
+        (1721, 240.052, 36000.35726), (660, 310.26, 71997.4812),
+        (350, 247.23, 32964.4678), (334, 260.87, -19.4410),
+        (314, 297.82, 445267.1117), (268, 343.14, 45036.8840),
+        (242, 166.79, 3.1008), (234, 81.53, 22518.4434),
+        (158, 3.50, -19.9739), (132, 132.75, 65928.9345),
+        (129, 182.95, 9038.0293), (114, 162.03, 3034.7684),
+        (99, 29.8, 33718.148), (93, 266.4, 3034.448),
+        (86, 249.2, -2280.773), (78, 157.6, 29929.992),
+        (72, 257.8, 31556.493), (68, 185.1, 149.588),
+        (64, 69.9, 9037.750), (46, 8.0, 107997.405),
+        (38, 197.1, -4444.176), (37, 250.4, 151.771),
+        (32, 65.3, 67555.316), (29, 162.7, 31556.080),
+        (28, 341.5, -4561.540), (27, 291.6, 107996.706),
+        (27, 98.5, 1221.655), (25, 146.7, 62894.167),
+        (24, 110.0, 31437.369), (21, 5.2, 14578.298),
+        (21, 342.6, -31931.757), (20, 230.9, 34777.243),
+        (18, 256.1, 1221.999), (17, 45.3, 62894.511),
+        (14, 242.9, -4442.039), (13, 115.2, 107997.909),
+        (13, 151.8, 119.066), (13, 285.3, 16859.071),
+        (12, 53.3, -4.578), (10, 126.6, 26895.292),
+        (10, 205.7, -39.127), (10, 85.9, 12297.536),
+        (10, 146.1, 90073.778)
+    )
+
+    @staticmethod
+    def setTier(tier):
+        """
+        Set the process-wide default tier, used when no tier is passed explicitly
+        and no Ephemeris.using block is active. Prefer Ephemeris.using in threaded
+        or asynchronous code: it changes the tier of the current context only.
+
+        Args:
+            tier (str):
+                - 'fast': low-order series (about 0.01°), the historical behaviour.
+                  It has no ΔT correction, so its error grows away from 2000.
+                - 'precise': 49 periodic terms and a ΔT model (better than 0.001°).
+                - 'auto': 'fast', re-evaluated with 'precise' only within GUARD
+                  degrees of a 15° boundary, where the result could change. The
+                  0.02° guard was validated against 'precise' for 1900–2100 only;
+                  outside AUTO_RANGE 'auto' always computes with 'precise'.
+
+        Raises:
+            ValueError: If the tier is not recognized.
+        """
+        Ephemeris._check(tier)
+        Ephemeris.tier = tier
+
+    @staticmethod
+    @contextmanager
+    def using(tier):
+        """
+        Select a tier for the current thread or asyncio task only, for the
+        duration of a with block. Memoized tables are keyed by tier, so blocks
+        with different tiers never share results.
+
+        Args:
+            tier (str): 'fast', 'precise' or 'auto' (see setTier).
+
+        Raises:
+            ValueError: If the tier is not recognized.
+
+        Example:
+            with Ephemeris.using('precise'):
+                TietKhi.getTermDate('Lập Xuân', 1850)
+        """
+        Ephemeris._check(tier)
+        token = Ephemeris._scoped.set(tier)
+        try:
+            yield tier
+        finally:
+            Ephemeris._scoped.reset(token)
+
+    @staticmethod
+    def getTier():
+        """
+        Return the tier in effect: the innermost Ephemeris.using block of the
+        current context, else the process default set by setTier.
+
+        Returns:
+            str: 'fast', 'precise' or 'auto'.
+        """
+        return Ephemeris._scoped.get() or Ephemeris.tier
+
+    @staticmethod
+    def _check(tier):
+        if tier not in (Ephemeris.FAST, Ephemeris.PRECISE, Ephemeris.AUTO):
+            raise ValueError(f"Unknown ephemeris tier: {tier!r}")
+
+    @staticmethod
+    def deltaT(y):
+        """
+        Return ΔT = TT - UT in seconds (Espenak & Meeus polynomials).
+
+        Args:
+            y (float): Decimal Gregorian year.
+
+        Returns:
+            float: ΔT in seconds.
+        """
+        if y < -500 or y >= 2150:
+            u = (y - 1820) / 100
+            return -20 + 32*u*u
+        if y < 500:
+            u = y / 100
+            return 10583.6 - 1014.41*u + 33.78311*u**2 - 5.952053*u**3 - 0.1798452*u**4 + 0.022174192*u**5 + 0.0090316521*u**6
+        if y < 1600:
+            u = (y - 1000) / 100
+            return 1574.2 - 556.01*u + 71.23472*u**2 + 0.319781*u**3 - 0.8503463*u**4 - 0.005050998*u**5 + 0.0083572073*u**6
+        if y < 1700:
+            t = y - 1600
+            return 120 - 0.9808*t - 0.01532*t**2 + t**3/7129
+        if y < 1800:
+            t = y - 1700
+            return 8.83 + 0.1603*t - 0.0059285*t**2 + 0.00013336*t**3 - t**4/1174000
+        if y < 1860:
+            t = y - 1800
+            return 13.72 - 0.332447*t + 0.0068612*t**2 + 0.0041116*t**3 - 0.00037436*t**4 + 0.0000121272*t**5 - 0.0000001699*t**6 + 0.000000000875*t**7
+        if y < 1900:
+            t = y - 1860
+            return 7.62 + 0.5737*t - 0.251754*t**2 + 0.01680668*t**3 - 0.0004473624*t**4 + t**5/233174
+        if y < 1920:
+            t = y - 1900
+            return -2.79 + 1.494119*t - 0.0598939*t**2 + 0.0061966*t**3 - 0.000197*t**4
+        if y < 1941:
+            t = y - 1920
+            return 21.20 + 0.84493*t - 0.076100*t**2 + 0.0020936*t**3
+        if y < 1961:
+            t = y - 1950
+            return 29.07 + 0.407*t - t**2/233 + t**3/2547
+        if y < 1986:
+            t = y - 1975
+            return 45.45 + 1.067*t - t**2/260 - t**3/718
+        if y < 2005:
+            t = y - 2000
+            return 63.86 + 0.3345*t - 0.060374*t**2 + 0.0017275*t**3 + 0.000651814*t**4 + 0.00002373599*t**5
+        if y < 2050:
+            t = y - 2000
+            return 62.92 + 0.32217*t + 0.005589*t**2
+        u = (y - 1820) / 100
+        return -20 + 32*u*u - 0.5628*(2150 - y)
+
+    @staticmethod
+    def _fast(jd, apparent):
+        T = (jd - 2451545) / 36525; T2 = T*T; T3 = T2*T
+        L0 = 280.46645 + 36000.76983*T + 0.0003032*T2
+        M = math.radians(357.52910 + 35999.05030*T - 0.0001559*T2 - 0.00000048*T3)
+        C = (1.914600 - 0.004817*T - 0.000014*T2) * math.sin(M)
+        C += (0.019993 - 0.000101*T) * math.sin(2*M)
+        C += 0.000290 * math.sin(3*M)
+        lam = L0 + C
+        if apparent:
+            lam = lam - 0.00569 - 0.00478 * math.sin(math.radians(125.04 - 1934.136*T))
+        return lam - 360 * math.floor(lam / 360)
+
+    @staticmethod
+    def _precise(jd, apparent):
+        jde = jd + Ephemeris.deltaT(2000 + (jd - 2451545) / 365.25) / 86400
+        c = (jde - 2451545) / 36525; dr = math.pi/180
+        s = 0
+        for x, y, z in Ephemeris.SUN_TERMS:
+            s += x * math.sin((y + z*c) * dr)
+        lam = 282.7771834 + 36000.76953744*c + 0.000005729577951308232*s
+        if apparent:
+            lam += 0.0000974*math.cos((177.63 + 35999.01848*c) * dr) - 0.005575
+            lam += -0.004778*math.sin((124.90 - 1934.134*c + 0.002063*c*c) * dr) - 0.0003667*math.sin((201.11 + 72001.5377*c + 0.00057*c*c) * dr)
+        return lam - 360 * math.floor(lam / 360)
+
+    @staticmethod
+    def sunLongitude(jd, tier=None, apparent=True):
+        """
+        Return the sun's longitude in degrees at a Julian Date.
+
+        Args:
+            jd (float): Julian Date (UT).
+            tier (str, optional): 'fast', 'precise' or 'auto'. Default is Ephemeris.getTier().
+            apparent (bool, optional): True for the apparent longitude (nutation and
+                aberration applied), False for the true geometric longitude. Default is True.
+
+        Returns:
+            float: Solar longitude in degrees (0–360).
+        """
+        tier = tier or Ephemeris.getTier()
+        if tier == Ephemeris.AUTO and not Ephemeris.AUTO_RANGE[0] <= jd < Ephemeris.AUTO_RANGE[1]:
+            tier = Ephemeris.PRECISE
+        if tier == Ephemeris.PRECISE:
+            return Ephemeris._precise(jd, apparent)
+        lam = Ephemeris._fast(jd, apparent)
+        if tier == Ephemeris.AUTO and abs((lam + 7.5) % 15 - 7.5) < Ephemeris.GUARD:
+            return Ephemeris._precise(jd, apparent)
+        return lam
+
+    @staticmethod
+    def sunLongitudes(jds, tier=None, apparent=True):
+        """
+        Return the sun's longitude in degrees for a sequence of Julian Dates.
+
+        In 'auto' mode the whole sequence is screened with the fast series first
+        and only the entries near a 15° boundary are recomputed precisely.
+
+        Args:
+            jds (iterable[float]): Julian Dates (UT).
+            tier (str, optional): 'fast', 'precise' or 'auto'. Default is Ephemeris.getTier().
+            apparent (bool, optional): See sunLongitude. Default is True.
+
+        Returns:
+            list[float]: Solar longitudes in degrees (0–360).
+        """
+        tier = tier or Ephemeris.getTier()
+        jds = list(jds)
+        if tier == Ephemeris.PRECISE:
+            return [Ephemeris._precise(jd, apparent) for jd in jds]
+        res = [Ephemeris._fast(jd, apparent) for jd in jds]
+        if tier == Ephemeris.AUTO:
+            lo, hi = Ephemeris.AUTO_RANGE
+            for i, lam in enumerate(res):
+                if not lo <= jds[i] < hi or abs((lam + 7.5) % 15 - 7.5) < Ephemeris.GUARD:
+                    res[i] = Ephemeris._precise(jds[i], apparent)
+        return res
+
+
 class SolarAndLunar:
+    # JDNs of 1/1/500 and 1/1/3201: the span where the guarded paths were checked
+    # day by day against the reference. Outside it they call the full series.
+    GUARDED_RANGE = (1903682, 2890202)
+
     @staticmethod
     def getNewMoonDay(k, timeZone = 7.0):
         """
@@ -279,7 +566,8 @@ class SolarAndLunar:
         Return the sun's longitude at a given Julian Day Number (JDN).
 
         The longitude is divided into 12 sectors (each 30 degrees)
-        corresponding to solar terms.
+        corresponding to solar terms. It is the geometric longitude from
+        Ephemeris.sunLongitude at the selected precision tier.
 
         Args:
             jdn (int): Julian Day Number.
@@ -289,15 +577,7 @@ class SolarAndLunar:
         Returns:
             int: Solar longitude sector (0–11).
         """
-        T = (jdn - 2451545.5 - timeZone/24) / 36525; T2 = T*T
-        dr = math.pi/180
-        M = 357.52910 + 35999.05030*T - 0.0001559*T2 - 0.00000048*T*T2
-        L0 = 280.46645 + 36000.76983*T + 0.0003032*T2
-        DL = (1.914600 - 0.004817*T - 0.000014*T2)*math.sin(dr*M)
-        DL = DL + (0.019993 - 0.000101*T)*math.sin(dr*2*M) + 0.000290*math.sin(dr*3*M)
-        L = L0 + DL; L = L*dr
-        L = L - math.pi*2*(math.floor(L/(math.pi*2)))
-        return math.floor(L / math.pi * 6)
+        return math.floor(Ephemeris.sunLongitude(jdn - 0.5 - timeZone/24, apparent=False) / 30)
     
     @staticmethod
     def getLunarMonth11(yy, timeZone=7.0):
@@ -337,18 +617,13 @@ class SolarAndLunar:
         Returns:
             int: Offset of the leap month (1–13).
         """
-        k = int((a11 - 2415021.076998695) / 29.530588853 + 0.5)
+        k = math.floor((a11 - 2415021.076998695) / 29.530588853 + 0.5)
         for i in range(1, 14):
             ms = SolarAndLunar.getNewMoonDay(k + i, timeZone); nms = SolarAndLunar.getNewMoonDay(k + i + 1, timeZone)
             s1 = SolarAndLunar.getSunLongitude(ms, timeZone); s2 = SolarAndLunar.getSunLongitude(nms, timeZone)
-            if s2 < s1:
-                s2 += 360
-            hmt = False
-            for mt in range(0, 360, 30):
-                if s1 < mt <= s2:
-                    hmt = True
-                    break
-            if not hmt:
+            # getSunLongitude returns a 30-degree sector, a month without a
+            # major term (trung khí) starts and ends in the same sector.
+            if s1 == s2:
                 return i
         return 13
     
@@ -375,6 +650,8 @@ class SolarAndLunar:
         monthStart = SolarAndLunar.getNewMoonDay(k + 1, timeZone)
         if monthStart > dayNumber:
             monthStart = SolarAndLunar.getNewMoonDay(k, timeZone)
+        if monthStart > dayNumber:
+            monthStart = SolarAndLunar.getNewMoonDay(k - 1, timeZone)
         a11 = SolarAndLunar.getLunarMonth11(yy, timeZone)
         b11 = a11
         if a11 >= monthStart:
@@ -399,6 +676,143 @@ class SolarAndLunar:
             lunarYear -= 1
         return lunarDay, lunarMonth, lunarYear, lunarLeap
     
+    @staticmethod
+    def getNewMoonDayGuarded(k, timeZone=7.0):
+        """
+        Return the same value as getNewMoonDay using the mean lunation and its
+        two largest periodic terms, with the full series only as a fallback.
+
+        The omitted terms, the T² terms of M, M' and F and the ΔT correction sum to
+        less than 0.05 + 0.0005*|T| + 0.0004*T² days (T in centuries from 1900), so
+        the day is certain unless the estimated instant lies that close to local
+        midnight. Outside GUARDED_RANGE the full series is always used.
+
+        Args:
+            k (int): Number of new moons since 1900-01-01.
+            timeZone (float, optional): Time zone offset in hours. Default is 7.0.
+
+        Returns:
+            int: Julian Day Number of the new moon.
+        """
+        T = k/1236.85; T2 = T * T; dr = math.pi/180
+        jd = 2415020.75933 + 29.53058868*k + 0.0001178*T2
+        M = 359.2242 + 29.10535608*k; Mpr = 306.0253 + 385.81691806*k
+        jd += 0.1734*math.sin(M*dr) - 0.4068*math.sin(Mpr*dr)
+        x = jd + 0.5 + timeZone/24
+        guard = 0.05 + 0.0005*abs(T) + 0.0004*T2
+        lo, hi = SolarAndLunar.GUARDED_RANGE
+        if lo <= x < hi and guard < x - math.floor(x) < 1 - guard:
+            return math.floor(x)
+        return SolarAndLunar.getNewMoonDay(k, timeZone)
+
+    @staticmethod
+    def getSunLongitudeGuarded(jdn, timeZone=7.0):
+        """
+        Return the same sector as getSunLongitude using the mean longitude and
+        the main equation-of-center term, with the full series only as a fallback.
+
+        The omitted terms and the gap to either tier (the 'precise' ΔT grows as T²)
+        stay below SolarAndLunar.sunGuard(T) degrees (T in centuries from J2000), so
+        the sector is certain outside that window around a 30-degree boundary.
+        Outside GUARDED_RANGE the full series is always used.
+
+        Args:
+            jdn (int): Julian Day Number.
+            timeZone (float, optional): Time zone offset in hours. Default is 7.0.
+
+        Returns:
+            int: Solar longitude sector (0–11).
+        """
+        lo, hi = SolarAndLunar.GUARDED_RANGE
+        T = (jdn - 2451545.5 - timeZone/24) / 36525
+        lam = 280.46645 + 36000.76983*T + 1.9146*math.sin(math.radians(357.52910 + 35999.05030*T))
+        lam -= 360 * math.floor(lam / 360)
+        if lo <= jdn < hi and abs((lam + 15) % 30 - 15) > SolarAndLunar.sunGuard(T):
+            return int(lam // 30)
+        return SolarAndLunar.getSunLongitude(jdn, timeZone)
+
+    @staticmethod
+    def sunGuard(T):
+        """
+        Return the error bound in degrees of the two-term solar longitude used by the
+        guarded paths, T in Julian centuries from J2000 (measured over years -500..4500
+        against both ephemeris tiers).
+        """
+        return 0.05 + 0.012*abs(T) + 0.0006*T*T
+
+    @staticmethod
+    def convertSolar2LunarGuarded(dd, mm, yy, timeZone=7.0):
+        """
+        Convert a Gregorian date to the Lunar date like convertSolar2Lunar,
+        but from mean lunations and mean longitudes with an exact fallback.
+
+        Every new moon and sun sector the reference algorithm needs is taken
+        from getNewMoonDayGuarded / getSunLongitudeGuarded, so the full series
+        only run for the few lunations and sectors inside their uncertainty
+        window. Needs no tables; checked against the reference for the years of
+        GUARDED_RANGE (500–3200), outside which it runs convertSolar2Lunar.
+
+        Args:
+            dd (int): Day of the month.
+            mm (int): Month of the year.
+            yy (int): Year in Gregorian calendar.
+            timeZone (float, optional): Time zone offset in hours. Default is 7.0.
+
+        Returns:
+            tuple[int, int, int, int]: (lunar_day, lunar_month, lunar_year, is_leap_month),
+            identical to convertSolar2Lunar.
+        """
+        dayNumber = Date.convertDate2jdn(dd, mm, yy)
+        lo, hi = SolarAndLunar.GUARDED_RANGE
+        if not lo <= dayNumber < hi:
+            return SolarAndLunar.convertSolar2Lunar(dd, mm, yy, timeZone)
+        newMoon = SolarAndLunar.getNewMoonDayGuarded; sector = SolarAndLunar.getSunLongitudeGuarded
+
+        def month11(y):
+            k = math.floor((Date.convertDate2jdn(31, 12, y) - 2415021) / 29.530588853)
+            nm = newMoon(k, timeZone)
+            return newMoon(k - 1, timeZone) if sector(nm, timeZone) >= 9 else nm
+
+        def leapOffset(a11):
+            k = math.floor((a11 - 2415021.076998695) / 29.530588853 + 0.5)
+            s1 = sector(newMoon(k + 1, timeZone), timeZone)
+            for i in range(1, 14):
+                s2 = sector(newMoon(k + i + 1, timeZone), timeZone)
+                if s1 == s2:
+                    return i
+                s1 = s2
+            return 13
+
+        k = math.floor((dayNumber - 2415021.076998695) / 29.530588853)
+        monthStart = newMoon(k + 1, timeZone)
+        if monthStart > dayNumber:
+            monthStart = newMoon(k, timeZone)
+        if monthStart > dayNumber:
+            monthStart = newMoon(k - 1, timeZone)
+        a11 = month11(yy)
+        b11 = a11
+        if a11 >= monthStart:
+            lunarYear = yy
+            a11 = month11(yy - 1)
+        else:
+            lunarYear = yy + 1
+            b11 = month11(yy + 1)
+        lunarDay = dayNumber - monthStart + 1
+        diff = math.floor((monthStart - a11) / 29)
+        lunarLeap = 0
+        lunarMonth = diff + 11
+        if b11 - a11 > 365:
+            leapMonthDiff = leapOffset(a11)
+            if diff >= leapMonthDiff:
+                lunarMonth = diff + 10
+                if diff == leapMonthDiff:
+                    lunarLeap = 1
+        if lunarMonth > 12:
+            lunarMonth = lunarMonth - 12
+        if lunarMonth >= 11 and diff < 4:
+            lunarYear -= 1
+        return lunarDay, lunarMonth, lunarYear, lunarLeap
+
     @staticmethod
     def convertLunar2Solar(lunarDay, lunarMonth, lunarYear, lunarLeap, timeZone=7.0):
         """
@@ -434,868 +848,3132 @@ class SolarAndLunar:
                 return [0, 0, 0]
             elif lunarLeap != 0 or off >= leapOff:
                 off += 1
-        k = int(0.5 + (a11 - 2415021.076998695) / 29.530588853)
+        k = math.floor(0.5 + (a11 - 2415021.076998695) / 29.530588853)
         monthStart = SolarAndLunar.getNewMoonDay(k + off, timeZone)
         return Date.convertjdn2Date(monthStart + lunarDay - 1)
 
-class CanChi:
     @staticmethod
-    def nam(y):
+    def getAnniversaries(records, fromYear, toYear, missingLeap='regular', missingDay30='last', timeZone=7.0):
         """
-        Return the heavenly stems and earthly branches (Stem-Branch) of the year given.
-        
+        Resolve lunar anniversaries (giỗ, lunar birthdays) to Gregorian dates
+        for every lunar year in a range.
+
+        Each LunarYear of the range is looked up once and shared by all
+        records, and identical (day, month, leap) records are resolved once.
+
         Args:
-            y (int): Year in Lunar calendar.
+            records (iterable[tuple[int, int, int]]): (lunar_day, lunar_month, is_leap_month) items.
+            fromYear (int): First lunar year (inclusive).
+            toYear (int): Last lunar year (inclusive).
+            missingLeap (str, optional): What to do when the leap month does not exist in a year:
+                - 'regular': use the regular month of the same number (default).
+                - 'skip': return None for that year.
+            missingDay30 (str, optional): What to do with day 30 in a 29-day month:
+                - 'last': use the last day of the month, day 29 (default).
+                - 'next': use the first day of the following month.
+                - 'skip': return None for that year.
+            timeZone (float, optional): Time zone offset in hours. Default is 7.0.
 
         Returns:
-            The Stem-Branch of the year given in Vietnamese.  
+            list[tuple[tuple[int, int, int] | None, ...]]: For each record, one
+            (day, month, year) Gregorian date, or None, per lunar year of the range.
+
+        Raises:
+            ValueError: If a policy name is not recognized.
         """
-        can = ['Giáp', 'Ất', 'Bính', 'Đinh', 'Mậu', 'Kỷ', 'Canh', 'Tân', 'Nhâm', 'Qúy']
-        chi = ['Tý', 'Sửu', 'Dần', 'Mão', 'Thìn', 'Tị', 'Ngọ', 'Mùi', 'Thân', 'Dậu', 'Tuất', 'Hợi']
-        c1 = can[int(str(y + 6)[-1])]; c2 = chi[(y + 8) % 12]
-        return c1 + ' ' + c2
-    
+        if missingLeap not in ('regular', 'skip'):
+            raise ValueError(f"Unknown missingLeap policy: {missingLeap!r}")
+        if missingDay30 not in ('last', 'next', 'skip'):
+            raise ValueError(f"Unknown missingDay30 policy: {missingDay30!r}")
+        years = [LunarYear.get(y, timeZone) for y in range(fromYear, toYear + 1)]
+        done = {}; res = []
+        for rec in records:
+            key = (rec[0], rec[1], 1 if rec[2] else 0)
+            dates = done.get(key)
+            if dates is None:
+                dl, ml, leap = key; dates = []
+                for ly in years:
+                    used = leap; start = ly.monthStart(ml, leap)
+                    if start is None and leap and missingLeap == 'regular':
+                        used = 0; start = ly.monthStart(ml, 0)
+                    if start is None:
+                        dates.append(None)
+                        continue
+                    jdn = start + dl - 1
+                    if dl == 30 and ly.monthLength(ml, used) == 29:
+                        if missingDay30 == 'skip':
+                            dates.append(None)
+                            continue
+                        if missingDay30 == 'last':
+                            jdn -= 1
+                    dates.append(Date.convertjdn2Date(jdn))
+                dates = done[key] = tuple(dates)
+            res.append(dates)
+        return res
+
+class MoonPhase:
+    PHASES = ['Trăng mới', 'Thượng huyền', 'Trăng tròn', 'Hạ huyền']
+
     @staticmethod
-    def thang(m, y):
+    def getPhaseJd(k, phase=0):
         """
-        Return the heavenly stems and earthly branches (Stem-Branch) of the month given.
-        
+        Return the exact instant of a principal moon phase as a Julian Date.
+
+        Uses the same mean lunation and periodic terms as
+        SolarAndLunar.getNewMoonDay, with the quarter-phase corrections
+        for first and last quarter.
+
         Args:
-            m (int): Month of the Lunar year.
-            y (int): Year in Lunar calendar.
+            k (int): Number of new moons since 1900-01-01 (as in getNewMoonDay).
+            phase (int, optional): 0 = new moon, 1 = first quarter,
+                2 = full moon, 3 = last quarter. Default is 0.
 
         Returns:
-            The Stem-Branch of the month given in Vietnamese.  
+            float: Julian Date (UT, fractional) of the phase.
         """
-        can = ['Giáp', 'Ất', 'Bính', 'Đinh', 'Mậu', 'Kỷ', 'Canh', 'Tân', 'Nhâm', 'Qúy']
-        chi = ['Tý', 'Sửu', 'Dần', 'Mão', 'Thìn', 'Tị', 'Ngọ', 'Mùi', 'Thân', 'Dậu', 'Tuất', 'Hợi']
-        chin = chi[2::] + chi[:2]
-        start_can = {
-            'Giáp': 'Bính', 'Kỷ': 'Bính',
-            'Ất': 'Mậu',  'Canh': 'Mậu',
-            'Bính': 'Canh','Tân': 'Canh',
-            'Đinh': 'Nhâm','Nhâm': 'Nhâm',
-            'Mậu': 'Giáp','Qúy': 'Giáp'
-        }
-        yrc1 = can[(y - 4) % 10]; c0 = can.index(start_can[yrc1])
-        moc1 = can[(c0 + m - 1) % 10]; moc2 = chin[m - 1]
-        return moc1 + ' ' + moc2
-    
+        k = k + phase / 4
+        T = k/1236.85; T2 = T * T; T3 = T2 * T; dr = math.pi/180
+        Jd1 = 2415020.75933 + 29.53058868*k + 0.0001178*T2 - 0.000000155*T3
+        Jd1 = Jd1 + 0.00033*math.sin((166.56 + 132.87*T - 0.009173*T2)*dr)
+        M = (359.2242 + 29.10535608*k - 0.0000333*T2 - 0.00000347*T3)*dr
+        Mpr = (306.0253 + 385.81691806*k + 0.0107306*T2 + 0.00001236*T3)*dr
+        F = (21.2964 + 390.67050646*k - 0.0016528*T2 - 0.00000239*T3)*dr
+        if phase % 2 == 0:
+            C1 = (0.1734 - 0.000393*T)*math.sin(M) + 0.0021*math.sin(2*M)
+            C1 = C1 - 0.4068*math.sin(Mpr) + 0.0161*math.sin(2*Mpr) - 0.0004*math.sin(3*Mpr)
+            C1 = C1 + 0.0104*math.sin(2*F) - 0.0051*math.sin(M+Mpr) - 0.0074*math.sin(M-Mpr)
+            C1 = C1 + 0.0004*math.sin(2*F+M) - 0.0004*math.sin(2*F-M) - 0.0006*math.sin(2*F+Mpr)
+            C1 = C1 + 0.0010*math.sin(2*F-Mpr) + 0.0005*math.sin(2*Mpr+M)
+        else:
+            C1 = (0.1721 - 0.0004*T)*math.sin(M) + 0.0021*math.sin(2*M)
+            C1 = C1 - 0.6280*math.sin(Mpr) + 0.0089*math.sin(2*Mpr) - 0.0004*math.sin(3*Mpr)
+            C1 = C1 + 0.0079*math.sin(2*F) - 0.0119*math.sin(M+Mpr) - 0.0047*math.sin(M-Mpr)
+            C1 = C1 + 0.0003*math.sin(2*F+M) - 0.0004*math.sin(2*F-M) - 0.0006*math.sin(2*F+Mpr)
+            C1 = C1 + 0.0021*math.sin(2*F-Mpr) + 0.0003*math.sin(M+2*Mpr) + 0.0004*math.sin(M-2*Mpr)
+            C1 = C1 - 0.0003*math.sin(2*M+Mpr)
+            W = 0.0028 - 0.0004*math.cos(M) + 0.0003*math.cos(Mpr)
+            C1 = C1 + W if phase == 1 else C1 - W
+        if T < -11:
+            deltat = 0.001 + 0.000839*T + 0.0002261*T2 - 0.00000845*T3 - 0.000000081*T*T3
+        else:
+            deltat = -0.000278 + 0.000265*T + 0.000262*T2
+        return Jd1 + C1 - deltat
+
     @staticmethod
-    def ngay(d,m,y):
+    def jd2Datetime(jd, timeZone=7.0):
         """
-        Return the heavenly stems and earthly branches (Stem-Branch) of the date given.
-        
+        Return the local datetime of a Julian Date.
+
         Args:
-            d (int): Day of the month
-            m (int): Month of the year.
-            y (int): Year in Gregorian calendar.
+            jd (float): Julian Date (UT).
+            timeZone (float, optional): Time zone offset in hours. Default is 7.0.
 
         Returns:
-            The Stem-Branch of the date given in Vietnamese.  
+            datetime: Local date and time, truncated to the second.
         """
-        can = ['Giáp', 'Ất', 'Bính', 'Đinh', 'Mậu', 'Kỷ', 'Canh', 'Tân', 'Nhâm', 'Qúy']
-        chi = ['Tý', 'Sửu', 'Dần', 'Mão', 'Thìn', 'Tị', 'Ngọ', 'Mùi', 'Thân', 'Dậu', 'Tuất', 'Hợi']
-        jdn = Date.convertDate2jdn(d, m, y)
-        c1 = can[(jdn + 9) % 10]; c2 = chi[(jdn + 1) % 12]
-        return c1 + ' ' + c2
+        local = jd + 0.5 + timeZone/24
+        jdn = math.floor(local)
+        d, m, y = Date.convertjdn2Date(jdn)
+        return datetime(y, m, d) + timedelta(seconds=int((local - jdn) * 86400))
 
-class TotXau:
     @staticmethod
-    def getHoangHacDao(d, m):
+    def getPhases(d1, m1, y1, d2, m2, y2, timeZone=7.0):
         """
-        Determine whether a given day branch (Địa Chi) in a specific lunar month
-        is a Hoàng Đạo (auspicious) or Hắc Đạo (inauspicious) day.
+        Return every principal moon phase whose local date lies between two dates.
 
         Args:
-            d (str): Day Earthly Branch (e.g. 'Tý', 'Sửu', 'Dần', ...).
-            m (int): Lunar month (1–12).
+            d1 (int): Day of the first date.
+            m1 (int): Month of the first date.
+            y1 (int): Year of the first date.
+            d2 (int): Day of the last date (inclusive).
+            m2 (int): Month of the last date.
+            y2 (int): Year of the last date.
+            timeZone (float, optional): Time zone offset in hours. Default is 7.0.
 
         Returns:
-            tuple[str | None, str | None]:
-                - Name of the star (e.g., 'Thanh Long', 'Bạch Hổ', ...)
-                - Type: 'Hoàng Đạo' or 'Hắc Đạo'
-
-                Returns (None, None) if no match is found.
+            list[tuple[float, int]]: (Julian Date, phase) in time order,
+            phase indexes PHASES (0 = new moon ... 3 = last quarter).
         """
-        TRUC_BANG = {
-            "Thanh Long": {(1,7):"Tý",(2,8):"Dần",(3,9):"Thìn",(4,10):"Ngọ",(5,11):"Thân",(6,12):"Tuất"},
-            "Minh Đường": {(1,7):"Sửu",(2,8):"Mão",(3,9):"Tị",(4,10):"Mùi",(5,11):"Dậu",(6,12):"Hợi"},
-            "Thiên Hình": {(1,7):"Dần",(2,8):"Thìn",(3,9):"Ngọ",(4,10):"Thân",(5,11):"Tuất",(6,12):"Tý"},
-            "Chu Tước": {(1,7):"Mão",(2,8):"Tị",(3,9):"Mùi",(4,10):"Dậu",(5,11):"Hợi",(6,12):"Sửu"},
-            "Kim Quỹ": {(1,7):"Thìn",(2,8):"Ngọ",(3,9):"Thân",(4,10):"Tuất",(5,11):"Tý",(6,12):"Dần"},
-            "Kim Đường": {(1,7):"Tị",(2,8):"Mùi",(3,9):"Dậu",(4,10):"Hợi",(5,11):"Sửu",(6,12):"Mão"},
-            "Bạch Hổ": {(1,7):"Ngọ",(2,8):"Thân",(3,9):"Tuất",(4,10):"Tý",(5,11):"Dần",(6,12):"Thìn"},
-            "Ngọc Đường": {(1,7):"Mùi",(2,8):"Dậu",(3,9):"Hợi",(4,10):"Sửu",(5,11):"Mão",(6,12):"Tị"},
-            "Thiên Lao": {(1,7):"Thân",(2,8):"Tuất",(3,9):"Tý",(4,10):"Dần",(5,11):"Thìn",(6,12):"Ngọ"},
-            "Huyền Vũ": {(1,7):"Dậu",(2,8):"Hợi",(3,9):"Sửu",(4,10):"Mão",(5,11):"Tị",(6,12):"Mùi"},
-            "Tư Mệnh": {(1,7):"Tuất",(2,8):"Tý",(3,9):"Dần",(4,10):"Thìn",(5,11):"Ngọ",(6,12):"Thân"},
-            "Câu Trận": {(1,7):"Hợi",(2,8):"Sửu",(3,9):"Mão",(4,10):"Tị",(5,11):"Mùi",(6,12):"Dậu"}
-        }
-        HOANG_DAO = {"Thanh Long","Minh Đường","Kim Quỹ","Kim Đường","Ngọc Đường","Tư Mệnh"}
-        for ten, bang in TRUC_BANG.items():
-            for thang, chi in bang.items():
-                if m in thang and d == chi:
-                    loai = "Hoàng Đạo" if ten in HOANG_DAO else "Hắc Đạo"
-                    return ten, loai
-        return None, None
-    
+        j1 = Date.convertDate2jdn(d1, m1, y1); j2 = Date.convertDate2jdn(d2, m2, y2)
+        k = math.floor((j1 - 2415021.076998695) / 29.530588853) - 1
+        res = []
+        while True:
+            for phase in range(4):
+                jd = MoonPhase.getPhaseJd(k, phase)
+                day = math.floor(jd + 0.5 + timeZone/24)
+                if day > j2:
+                    return res
+                if day >= j1:
+                    res.append((jd, phase))
+            k += 1
+
     @staticmethod
-    def isTamNuong(dl, ml, yl):
+    def getIllumination(jd):
         """
-        Check if a lunar day is a Tam Nương day (considered inauspicious).
-        Tam Nương days are fixed lunar days: 3, 7, 13, 18, 22, 27.
+        Return the illuminated fraction of the moon's disk at a Julian Date.
 
         Args:
-            dl (int): Lunar day.
-            ml (int): Lunar month (unused).
-            yl (int): Lunar year (unused).
+            jd (float): Julian Date.
 
         Returns:
-            bool: True if the day is Tam Nương day, otherwise False.
+            float: Illuminated fraction (0.0 at new moon, 1.0 at full moon).
         """
-        return dl in [3, 7, 13, 18, 22, 27]
-    
+        T = (jd - 2451545) / 36525; T2 = T*T; dr = math.pi/180
+        D = (297.8501921 + 445267.1114034*T - 0.0018819*T2)*dr
+        M = (357.5291092 + 35999.0502909*T - 0.0001536*T2)*dr
+        Mpr = (134.9633964 + 477198.8675055*T + 0.0087414*T2)*dr
+        i = 180 - D/dr - 6.289*math.sin(Mpr) + 2.100*math.sin(M) - 1.274*math.sin(2*D - Mpr)
+        i = i - 0.658*math.sin(2*D) - 0.214*math.sin(2*Mpr) - 0.110*math.sin(D)
+        return (1 + math.cos(i*dr)) / 2
+
     @staticmethod
-    def isNguyetPha(dl, ml, yl):
+    def getDaily(d1, m1, y1, d2, m2, y2, hour=12, timeZone=7.0):
         """
-        Check if a lunar date is a Nguyệt Phá day (considered inauspicious).
+        Return the moon age and illuminated fraction of every day in a range,
+        as columns.
+
+        New moon instants for the range are computed once, ages are then a
+        subtraction against the latest one.
 
         Args:
-            dl (int): Lunar day.
-            ml (int): Lunar month.
-            yl (int): Lunar year.
+            d1 (int): Day of the first date.
+            m1 (int): Month of the first date.
+            y1 (int): Year of the first date.
+            d2 (int): Day of the last date (inclusive).
+            m2 (int): Month of the last date.
+            y2 (int): Year of the last date.
+            hour (float, optional): Local clock hour at which each day is sampled. Default is 12.
+            timeZone (float, optional): Time zone offset in hours. Default is 7.0.
 
         Returns:
-            bool: True if it is a Nguyệt Phá day, otherwise False.
+            dict[str, list]: Parallel columns:
+                - 'jdn' (list[int]): Julian Day Number of each day.
+                - 'age' (list[float]): Days since the previous new moon.
+                - 'illumination' (list[float]): Illuminated fraction (0.0–1.0).
         """
-        isLeap = 1 if yl % 19 in [0, 3, 6, 9, 11, 14, 17] else 0
-        ds, ms, ys = SolarAndLunar.convertLunar2Solar(dl, ml, yl, isLeap)
-        nguyetPha = {
-            1: 'Thân', 2: 'Dậu', 3: 'Tuất',
-            4: 'Hợi', 5: 'Tý', 6: 'Sửu',
-            7: 'Dần', 8: 'Mão', 9: 'Thìn',
-            10: 'Tị', 11: 'Ngọ', 12: 'Mùi'
+        j1 = Date.convertDate2jdn(d1, m1, y1); j2 = Date.convertDate2jdn(d2, m2, y2)
+        off = (hour - 12 - timeZone) / 24
+        k = math.floor((j1 - 2415021.076998695) / 29.530588853) - 1
+        newMoons = []
+        while not newMoons or newMoons[-1] <= j2 + off:
+            newMoons.append(MoonPhase.getPhaseJd(k)); k += 1
+        jdns = list(range(j1, j2 + 1))
+        ages = []; n = 0
+        for jdn in jdns:
+            jd = jdn + off
+            while n + 1 < len(newMoons) and newMoons[n + 1] <= jd:
+                n += 1
+            ages.append(jd - newMoons[n])
+        return {
+            'jdn': jdns,
+            'age': ages,
+            'illumination': [MoonPhase.getIllumination(jdn + off) for jdn in jdns],
         }
-        return CanChi.ngay(ds, ms, ys).split()[1] == nguyetPha[ml]
-            
-    @staticmethod
-    def isSatChu(dl, ml, yl):
+
+class LunarYear:
+    """
+    All lunar months of one lunar year, resolved once and memoized
+    (safe under concurrent first access).
+
+    A lunar year runs from the first day of month 1 to the day before
+    month 1 of the next year. Month starts are computed with the same
+    rules as SolarAndLunar.convertSolar2Lunar, so lookups through a
+    LunarYear always agree with the reference conversion.
+
+    Months are consecutive lunations: starts[i] is
+    SolarAndLunar.getNewMoonDay(k + i), with k the lunation number of
+    the first month of the year.
+    """
+    _cache = _Memo()
+    _shared = None
+
+    def __init__(self, year, timeZone=7.0):
         """
-        Check if a lunar date is a Sát Chủ day (considered inauspicious).
+        Build the month table of a lunar year.
 
         Args:
-            dl (int): Lunar day.
-            ml (int): Lunar month.
-            yl (int): Lunar year.
-
-        Returns:
-            bool: True if it is a Sát Chủ day, otherwise False.
+            year (int): Lunar year.
+            timeZone (float, optional): Time zone offset in hours. Default is 7.0.
         """
-        isLeap = 1 if yl % 19 in [0, 3, 6, 9, 11, 14, 17] else 0
-        ds, ms, ys = SolarAndLunar.convertLunar2Solar(dl, ml, yl, isLeap)
-        satChu = {1: 'Tý', 2: 'Sửu', 3: 'Sửu',
-                  4: 'Tuất', 5: 'Thìn', 6: 'Thìn',
-                  7: 'Sửu', 8: 'Thìn', 9: 'Sửu',
-                  10: 'Thìn', 11: 'Mùi', 12: 'Thìn'
-                  }
-        return CanChi.ngay(ds, ms, ys).split()[1] == satChu[ml]
-    
+        self.year = year; self.timeZone = timeZone
+        self.starts = []; self.months = []
+        self.leapMonth = 0; self.end = None; self.k = None
+        a11 = SolarAndLunar.getLunarMonth11(year - 1, timeZone)
+        for yy in (year, year + 1):
+            b11 = SolarAndLunar.getLunarMonth11(yy, timeZone)
+            k = math.floor(0.5 + (a11 - 2415021.076998695) / 29.530588853)
+            leapOff = SolarAndLunar.getLeapMonthOffset(a11, timeZone) if b11 - a11 > 365 else 14
+            for i in range(14):
+                monthStart = SolarAndLunar.getNewMoonDay(k + i, timeZone)
+                if monthStart >= b11:
+                    break
+                diff = math.floor((monthStart - a11) / 29)
+                lunarMonth = diff + 11; lunarLeap = 0; lunarYear = yy
+                if diff >= leapOff:
+                    lunarMonth = diff + 10
+                    if diff == leapOff:
+                        lunarLeap = 1
+                if lunarMonth > 12:
+                    lunarMonth -= 12
+                if lunarMonth >= 11 and diff < 4:
+                    lunarYear -= 1
+                if lunarYear == year:
+                    if self.k is None:
+                        self.k = k + i
+                    self.starts.append(monthStart); self.months.append((lunarMonth, lunarLeap))
+                    if lunarLeap:
+                        self.leapMonth = lunarMonth
+                elif lunarYear > year:
+                    self.end = monthStart
+                    break
+            a11 = b11
+        self.starts = tuple(self.starts); self.months = tuple(self.months)
+
+    def __repr__(self):
+        return f"LunarYear(year={self.year}, leapMonth={self.leapMonth}, timeZone={self.timeZone})"
+
     @staticmethod
-    def isThoTu(dl, ml, yl):
+    def get(year, timeZone=7.0):
         """
-        Check if a lunar date is a Thọ Tử day (considered inauspicious).
-        
+        Return the memoized LunarYear of a given lunar year.
+
         Args:
-            dl (int): Lunar day.
-            ml (int): Lunar month.
-            yl (int): Lunar year.
+            year (int): Lunar year.
+            timeZone (float, optional): Time zone offset in hours. Default is 7.0.
 
         Returns:
-            bool: True if it is a Thọ Tử day, otherwise False.
+            LunarYear: The month table of the lunar year.
         """
-        isLeap = 1 if yl % 19 in [0, 3, 6, 9, 11, 14, 17] else 0
-        ds, ms, ys = SolarAndLunar.convertLunar2Solar(dl, ml, yl, isLeap)
-        thoTu = {1: 'Tuất', 2: 'Thân', 3: 'Hợi',
-                 4: 'Tị', 5: 'Tý', 6: 'Ngọ',
-                 7: 'Sửu', 8: 'Mùi', 9: 'Dần',
-                 10: 'Thân', 11: 'Mão', 12: 'Dậu'
-                 }
-        return CanChi.ngay(ds, ms, ys).split()[1] == thoTu[ml]
-    
+        return LunarYear._cache.get((year, timeZone, Ephemeris.getTier()), LunarYear._build, year, timeZone)
+
     @staticmethod
-    def isVangVong(dl, ml, yl):
+    def _build(year, timeZone):
+        shared = LunarYear._shared
+        ly = shared.lunarYear(year, timeZone, Ephemeris.getTier()) if shared is not None else None
+        return ly if ly is not None else LunarYear(year, timeZone)
+
+    @classmethod
+    def _restore(cls, year, timeZone, k, starts, months, end):
         """
-        Check if a lunar date is a Vãng Vong day (considered inauspicious).
+        Rebuild a LunarYear from stored fields without astronomical computation.
+        """
+        ly = cls.__new__(cls)
+        ly.year = year; ly.timeZone = timeZone; ly.k = k
+        ly.starts = tuple(starts); ly.months = tuple(months); ly.end = end
+        ly.leapMonth = next((m for m, leap in ly.months if leap), 0)
+        return ly
+
+    @staticmethod
+    def containing(jdn, timeZone=7.0):
+        """
+        Return the LunarYear that contains a given Julian Day Number.
 
         Args:
-            dl (int): Lunar day.
-            ml (int): Lunar month.
-            yl (int): Lunar year.
+            jdn (int): Julian Day Number.
+            timeZone (float, optional): Time zone offset in hours. Default is 7.0.
 
         Returns:
-            bool: True if it is a Vãng Vong day, otherwise False.
+            LunarYear: The lunar year whose months cover the day.
         """
-        isLeap = 1 if yl % 19 in [0, 3, 6, 9, 11, 14, 17] else 0
-        ds, ms, ys = SolarAndLunar.convertLunar2Solar(dl, ml, yl, isLeap)
-        vangVong = {1: 'Dần', 2: 'Tị', 3: 'Thân',
-                    4: 'Hợi', 5: 'Mão', 6: 'Ngọ',
-                    7: 'Dậu', 8: 'Tý', 9: 'Thìn',
-                    10: 'Mùi', 11: 'Tuất', 12: 'Sửu'
-                    }
-        return CanChi.ngay(ds, ms, ys).split()[1] == vangVong[ml]
-    
+        ly = LunarYear.get(Date.convertjdn2Date(jdn)[2], timeZone)
+        if jdn < ly.starts[0]:
+            return LunarYear.get(ly.year - 1, timeZone)
+        if jdn >= ly.end:
+            return LunarYear.get(ly.year + 1, timeZone)
+        return ly
+
     @staticmethod
-    def isNguyetKy(dl, ml, yl):
+    def lunation(jdn, timeZone=7.0):
         """
-        Check if a lunar date is a Nguyệt Kỵ day (considered inauspicious).
+        Return the lunation number of the lunar month containing a day.
 
         Args:
-            dl (int): Lunar day.
-            ml (int): Lunar month.
-            yl (int): Lunar year.
+            jdn (int): Julian Day Number.
+            timeZone (float, optional): Time zone offset in hours. Default is 7.0.
 
         Returns:
-            bool: True if it is a Nguyệt Kỵ day, otherwise False.
+            tuple[int, int]: (k, offset) where the month starts on
+            SolarAndLunar.getNewMoonDay(k) and jdn is offset days after it.
         """
-        return dl in [5, 14, 23]
-    
-    @staticmethod
-    def isDaiBai(dl, ml, yl):
+        ly = LunarYear.containing(jdn, timeZone)
+        i = bisect_right(ly.starts, jdn) - 1
+        return ly.k + i, jdn - ly.starts[i]
+
+    def locate(self, jdn):
         """
-        Check if a lunar date is a Đại Bại day (considered inauspicious).
+        Return the lunar date of a Julian Day Number inside this year.
 
         Args:
-            dl (int): Lunar day.
-            ml (int): Lunar month.
-            yl (int): Lunar year.
+            jdn (int): Julian Day Number.
 
         Returns:
-            bool: True if it is a Đại Bại day, otherwise False.
+            tuple[int, int, int, int]: (lunar_day, lunar_month, lunar_year, is_leap_month),
+            or None if the day is outside this lunar year.
         """
-        try:
-            isLeap = 1 if yl % 19 in [0, 3, 6, 9, 11, 14, 17] else 0
-            ds, ms, ys = SolarAndLunar.convertLunar2Solar(dl, ml, yl, isLeap)
-            canchi = CanChi.ngay(ds, ms, ys)
-            if CanChi.nam(yl).split()[0] in ['Giáp', 'Kỷ']:
-                dbgk = {3: 'Mậu Tuất', 7: 'Qúy Hợi',
-                        10: 'Bính Thân', 11: 'Đinh Hợi'
-                        }
-                return canchi == dbgk[ml]
-            elif CanChi.nam(yl).split()[0] in ['Ất', 'Canh']:
-                dbac = {4: 'Nhâm Thân', 9: 'Ất Tị'}
-                return canchi == dbac[ml]
-            elif CanChi.nam(yl).split()[0] in ['Bính', 'Tân']:
-                dbbt = {3: 'Tân Tị', 9: 'Canh Thìn'}
-                return canchi == dbbt[ml]
-            elif CanChi.nam(yl).split()[0] in ['Mậu', 'Qúy']:
-                return canchi == 'Kỷ Sửu'
-            return False
-        except KeyError:
-            return False
-    
-    @staticmethod
-    def getCuuDieu(yl, gen):
+        if not self.starts[0] <= jdn < self.end:
+            return None
+        i = bisect_right(self.starts, jdn) - 1
+        m, leap = self.months[i]
+        return jdn - self.starts[i] + 1, m, self.year, leap
+
+    def monthStart(self, m, leap=0):
         """
-        Determine the Cửu Diệu star (Nine-Year Cycle Star) for a person
-        based on their lunar birth year and gen.
+        Return the Julian Day Number of the first day of a lunar month.
 
         Args:
-            yl (int): Lunar birth year.
-            gen (str): gen identifier:
-                - 'm' for male (nam)
-                - 'f' for female (nữ)
+            m (int): Lunar month (1–12).
+            leap (int, optional): 1 for the leap month, otherwise 0.
 
         Returns:
-            str | None: Name of the Cửu Diệu star for the current year.
-            Returns None if age < 10.
+            int | None: JDN of day 1 of the month, or None if the month
+            does not exist in this year (e.g. a missing leap month).
         """
-        age = (datetime.now().year - yl) + 1
-        if age < 10:
+        try:
+            return self.starts[self.months.index((m, 1 if leap else 0))]
+        except ValueError:
             return None
-        nam = ['La Hầu', 'Thổ Tú', 'Thủy Diệu', 'Thái Bạch', 'Thái Dương', 'Vân Hớn', 'Kế Đô', 'Thái Âm', 'Mộc Đức']
-        nu  = ['Kế Đô', 'Vân Hớn', 'Mộc Đức', 'Thái Âm', 'Thổ Tú', 'La Hầu', 'Thái Dương', 'Thái Bạch', 'Thủy Diệu']
-        idx = age % 9
-        if idx == 0:
-            idx = 9
-        return nam[idx - 1] if gen == 'm' else nu[idx - 1]
-            
-    @staticmethod
-    def getGioHoangDao(dl, ml, yl):
+
+    def monthLength(self, m, leap=0):
         """
-        Determine the Hoàng Đạo (auspicious) hours for a given lunar date.
+        Return the number of days (29 or 30) in a lunar month.
 
         Args:
-            dl (int): Lunar day.
-            ml (int): Lunar month.
-            yl (int): Lunar year.
+            m (int): Lunar month (1–12).
+            leap (int, optional): 1 for the leap month, otherwise 0.
 
         Returns:
-            tuple[str, ...] | None: A tuple of Earthly Branches representing auspicious hours (e.g. ('Tý', 'Sửu', 'Thìn', ...)).
-            Returns None if no matching rule is found.
+            int | None: Length of the month, or None if it does not exist.
         """
-        isLeap = 1 if yl % 19 in [0, 3, 6, 9, 11, 14, 17] else 0
-        ds, ms, ys = SolarAndLunar.convertLunar2Solar(dl, ml, yl, isLeap)
-        chi = CanChi.ngay(ds, ms, ys).split()[1]
-        gioHoangDao = {('Dần', 'Thân'): ('Tý', 'Sửu', 'Thìn', 'Tị', 'Mùi', 'Tuất'),
-                       ('Mão', 'Dậu'): ('Tý', 'Dần', 'Mão', 'Ngọ', 'Mùi', 'Dậu'),
-                       ('Thìn', 'Tuất'): ('Dần', 'Thìn', 'Tị', 'Thân', 'Dậu', 'Hợi'),
-                       ('Tị', 'Hợi'): ('Sửu', 'Thìn', 'Ngọ', 'Mùi', 'Tuất', 'Hợi'),
-                       ('Tý', 'Ngọ'): ('Tý', 'Sửu', 'Mão', 'Ngọ', 'Thân', 'Dậu'),
-                       ('Sửu', 'Mùi'): ('Dần', 'Mão', 'Tị', 'Thân', 'Tuất', 'Hợi')
-                       }
-        for k, v in gioHoangDao.items():
-            if chi in k:
-                return v
-            
-    @staticmethod
-    def getXung(d, m, y):
+        try:
+            i = self.months.index((m, 1 if leap else 0))
+        except ValueError:
+            return None
+        nxt = self.starts[i + 1] if i + 1 < len(self.starts) else self.end
+        return nxt - self.starts[i]
+
+
+class _DayValue:
+    __slots__ = ('jdn', '_other', '_tuple')
+    timeZone = 7.0
+
+    def __init__(self, jdn, parts=None):
+        object.__setattr__(self, 'jdn', jdn)
+        object.__setattr__(self, '_other', None)
+        object.__setattr__(self, '_tuple', parts)
+
+    @classmethod
+    def fromJdn(cls, jdn):
         """
-        Get the list of conflicting (xung khắc) Can-Chi combinations for a given Gregorian date.
+        Build the value directly from a Julian Day Number.
 
         Args:
-            d (int): Gregorian day.
-            m (int): Gregorian month.
-            y (int): Gregorian year.
+            jdn (int): Julian Day Number.
 
         Returns:
-            list[str, str, str, str, str]:
-                A list of Can-Chi combinations considered conflicting
-                with the given date.
-                Returns an empty list if no mapping is found.
+            The date value of that day.
         """
-        cch = CanChi.ngay(d, m, y)
-        XUNG = {
-            "Giáp Tý":  ["Giáp Tý", "Giáp Ngọ", "Canh Tý", "Canh Ngọ", "Mậu Ngọ"],
-            "Ất Sửu":   ["Ất Sửu", "Ất Mùi", "Tân Sửu", "Tân Mùi", "Kỷ Mùi"],
-            "Bính Dần": ["Bính Dần", "Bính Thân", "Nhâm Dần", "Nhâm Thân", "Giáp Thân"],
-            "Đinh Mão": ["Đinh Mão", "Đinh Dậu", "Qúy Mão", "Qúy Dậu", "Ất Dậu"],
-            "Mậu Thìn": ["Mậu Thìn", "Mậu Tuất", "Giáp Thìn", "Giáp Tuất", "Canh Tuất"],
-            "Kỷ Tị":    ["Kỷ Tị", "Kỷ Hợi", "Ất Tị", "Ất Hợi", "Tân Hợi"],
-            "Canh Ngọ": ["Canh Ngọ", "Canh Tý", "Bính Ngọ", "Bính Tý", "Nhâm Tý"],
-            "Tân Mùi":  ["Tân Mùi", "Tân Sửu", "Đinh Mùi", "Đinh Sửu", "Qúy Sửu"],
-            "Nhâm Thân":["Nhâm Thân", "Nhâm Dần", "Mậu Thân", "Mậu Dần", "Bính Dần"],
-            "Qúy Dậu":  ["Qúy Dậu", "Qúy Mão", "Kỷ Dậu", "Kỷ Mão", "Đinh Mão"],
-            "Giáp Tuất":["Giáp Tuất", "Giáp Thìn", "Canh Tuất", "Canh Thìn", "Nhâm Thìn"],
-            "Ất Hợi":   ["Ất Hợi", "Ất Tị", "Tân Hợi", "Tân Tị", "Qúy Tị"],
-            "Bính Tý":  ["Bính Tý", "Bính Ngọ", "Nhâm Tý", "Nhâm Ngọ", "Canh Ngọ"],
-            "Đinh Sửu": ["Đinh Sửu", "Đinh Mùi", "Qúy Sửu", "Qúy Mùi", "Tân Mùi"],
-            "Mậu Dần":  ["Mậu Dần", "Mậu Thân", "Giáp Dần", "Giáp Thân", "Canh Thân"],
-            "Kỷ Mão":   ["Kỷ Mão", "Kỷ Dậu", "Ất Mão", "Ất Dậu", "Tân Dậu"],
-            "Canh Thìn":["Canh Thìn", "Canh Tuất", "Bính Thìn", "Bính Tuất", "Giáp Tuất"],
-            "Tân Tị":   ["Tân Tị", "Tân Hợi", "Đinh Tị", "Đinh Hợi", "Ất Hợi"],
-            "Nhâm Ngọ": ["Nhâm Ngọ", "Nhâm Tý", "Mậu Ngọ", "Mậu Tý", "Giáp Tý"],
-            "Qúy Mùi":  ["Qúy Mùi", "Qúy Sửu", "Kỷ Mùi", "Kỷ Sửu", "Ất Sửu"],
-            "Giáp Thân":["Giáp Thân", "Giáp Dần", "Canh Thân", "Canh Dần", "Mậu Dần"],
-            "Ất Dậu":   ["Ất Dậu", "Ất Mão", "Tân Dậu", "Tân Mão", "Kỷ Mão"],
-            "Bính Tuất":["Bính Tuất", "Bính Thìn", "Nhâm Tuất", "Nhâm Thìn", "Mậu Thìn"],
-            "Đinh Hợi": ["Đinh Hợi", "Đinh Tị", "Qúy Hợi", "Qúy Tị", "Kỷ Tị"],
-            "Mậu Tý":   ["Mậu Tý", "Mậu Ngọ", "Giáp Tý", "Giáp Ngọ", "Bính Ngọ"],
-            "Kỷ Sửu":   ["Kỷ Sửu", "Kỷ Mùi", "Ất Sửu", "Ất Mùi", "Đinh Mùi"],
-            "Canh Dần": ["Canh Dần", "Canh Thân", "Bính Dần", "Bính Thân", "Nhâm Thân"],
-            "Tân Mão":  ["Tân Mão", "Tân Dậu", "Đinh Mão", "Đinh Dậu", "Qúy Dậu"],
-            "Nhâm Thìn":["Nhâm Thìn", "Nhâm Tuất", "Mậu Thìn", "Mậu Tuất", "Bính Tuất"],
-            "Qúy Tị":   ["Qúy Tị", "Qúy Hợi", "Kỷ Tị", "Kỷ Hợi", "Đinh Hợi"],
-            "Giáp Ngọ": ["Giáp Ngọ", "Giáp Tý", "Canh Tý", "Canh Ngọ", "Mậu Tý"],
-            "Ất Mùi":   ["Ất Mùi", "Ất Sửu", "Tân Sửu", "Tân Mùi", "Kỷ Sửu"],
-            "Bính Thân":["Bính Thân", "Bính Dần", "Nhâm Dần", "Nhâm Thân", "Giáp Dần"],
-            "Đinh Dậu": ["Đinh Dậu", "Đinh Mão", "Qúy Mão", "Qúy Dậu", "Ất Mão"],
-            "Mậu Tuất": ["Mậu Tuất", "Mậu Thìn", "Giáp Thìn", "Giáp Tuất", "Canh Thìn"],
-            "Kỷ Hợi":   ["Kỷ Hợi", "Kỷ Tị", "Ất Tị", "Ất Hợi", "Tân Tị"],
-            "Canh Tý":  ["Canh Tý", "Canh Ngọ", "Bính Ngọ", "Bính Tý", "Nhâm Ngọ"],
-            "Tân Sửu":  ["Tân Sửu", "Tân Mùi", "Đinh Mùi", "Đinh Sửu", "Qúy Mùi"],
-            "Nhâm Dần": ["Nhâm Dần", "Nhâm Thân", "Mậu Thân", "Mậu Dần", "Bính Thân"],
-            "Qúy Mão":  ["Qúy Mão", "Qúy Dậu", "Kỷ Dậu", "Kỷ Mão", "Đinh Dậu"],
-            "Giáp Thìn":["Giáp Thìn", "Giáp Tuất", "Canh Thìn", "Canh Tuất", "Nhâm Tuất"],
-            "Ất Tị":    ["Ất Tị", "Ất Hợi", "Tân Tị", "Tân Hợi", "Qúy Hợi"],
-            "Bính Ngọ": ["Bính Ngọ", "Bính Tý", "Nhâm Ngọ", "Nhâm Tý", "Canh Tý"],
-            "Đinh Mùi": ["Đinh Mùi", "Đinh Sửu", "Qúy Mùi", "Qúy Sửu", "Tân Sửu"],
-            "Mậu Thân": ["Mậu Thân", "Mậu Dần", "Giáp Thân", "Giáp Dần", "Canh Dần"],
-            "Kỷ Dậu":   ["Kỷ Dậu", "Kỷ Mão", "Ất Dậu", "Ất Mão", "Tân Mão"],
-            "Canh Tuất":["Canh Tuất", "Canh Thìn", "Bính Tuất", "Bính Thìn", "Giáp Thìn"],
-            "Tân Hợi":  ["Tân Hợi", "Tân Tị", "Đinh Hợi", "Đinh Tị", "Ất Tị"],
-            "Nhâm Tý":  ["Nhâm Tý", "Nhâm Ngọ", "Mậu Tý", "Mậu Ngọ", "Giáp Ngọ"],
-            "Qúy Sửu":  ["Qúy Sửu", "Qúy Mùi", "Kỷ Sửu", "Kỷ Mùi", "Ất Mùi"],
-            "Giáp Dần": ["Giáp Dần", "Giáp Thân", "Canh Dần", "Canh Thân", "Mậu Thân"],
-            "Ất Mão":   ["Ất Mão", "Ất Dậu", "Tân Mão", "Tân Dậu", "Kỷ Dậu"],
-            "Bính Thìn":["Bính Thìn", "Bính Tuất", "Nhâm Thìn", "Nhâm Tuất", "Mậu Tuất"],
-            "Đinh Tị":  ["Đinh Tị", "Đinh Hợi", "Qúy Tị", "Qúy Hợi", "Kỷ Hợi"],
-            "Mậu Ngọ":  ["Mậu Ngọ", "Mậu Tý", "Giáp Ngọ", "Giáp Tý", "Bính Tý"],
-            "Kỷ Mùi":   ["Kỷ Mùi", "Kỷ Sửu", "Ất Mùi", "Ất Sửu", "Đinh Sửu"],
-            "Canh Thân":["Canh Thân", "Canh Dần", "Bính Thân", "Bính Dần", "Nhâm Dần"],
-            "Tân Dậu":  ["Tân Dậu", "Tân Mão", "Đinh Dậu", "Đinh Mão", "Qúy Mão"],
-            "Nhâm Tuất":["Nhâm Tuất", "Nhâm Thìn", "Mậu Tuất", "Mậu Thìn", "Bính Thìn"],
-            "Qúy Hợi":  ["Qúy Hợi", "Qúy Tị", "Kỷ Hợi", "Kỷ Tị", "Đinh Tị"]
-        }
-        return XUNG.get(cch, [])
+        obj = cls.__new__(cls)
+        _DayValue.__init__(obj, jdn)
+        return obj
 
-    @staticmethod
-    def quyHoi(h):
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        return type(self).fromJdn, (self.jdn,)
+
+    def __hash__(self):
+        return hash(self.jdn)
+
+    def __eq__(self, other):
+        return self.jdn == other.jdn if isinstance(other, _DayValue) else NotImplemented
+
+    def __lt__(self, other):
+        return self.jdn < other.jdn if isinstance(other, _DayValue) else NotImplemented
+
+    def __le__(self, other):
+        return self.jdn <= other.jdn if isinstance(other, _DayValue) else NotImplemented
+
+    def __gt__(self, other):
+        return self.jdn > other.jdn if isinstance(other, _DayValue) else NotImplemented
+
+    def __ge__(self, other):
+        return self.jdn >= other.jdn if isinstance(other, _DayValue) else NotImplemented
+
+    def __add__(self, n):
+        return type(self).fromJdn(self.jdn + n) if isinstance(n, int) else NotImplemented
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, _DayValue):
+            return self.jdn - other.jdn
+        return type(self).fromJdn(self.jdn - other) if isinstance(other, int) else NotImplemented
+
+
+class SolarDate(_DayValue):
+    """
+    Immutable Gregorian date stored as its Julian Day Number.
+
+    Hashable and ordered (also against LunarDate, by day), supports
+    `+ n` / `- n` days and `date - date`. The lunar counterpart is
+    computed on first access and kept.
+    """
+    __slots__ = ()
+
+    def __init__(self, d, m, y):
         """
-        Get the hour range (in 24-hour format) corresponding to a given Earthly Branch (Địa Chi) time.
+        Initialize a Gregorian date.
 
         Args:
-            h (str): Earthly Branch (e.g., 'Tý', 'Sửu', 'Dần', ...).
+            d (int): Day of the month.
+            m (int): Month of the year.
+            y (int): Year in Gregorian calendar.
 
-        Returns:
-            tuple[int, int]: A tuple (start_hour, end_hour) representing the 24-hour range.
-            Returns None if no mapping is found.
+        Raises:
+            ValueError: If the date does not exist.
         """
-        quyHoi = {'Tý': (23, 1), 'Sửu': (1, 3), 'Dần': (3, 5),
-                  'Mão': (5, 7), 'Thìn': (7, 9), 'Tị': (9, 11),
-                  'Ngọ': (11, 13), 'Mùi': (13, 15), 'Thân': (15, 17),
-                  'Dậu': (17, 19), 'Tuất': (19, 21), 'Hợi': (21, 23)
-                  }
-        return quyHoi.get(h, None)
-    
-    @staticmethod
-    def gioAm(h):
+        if not 1 <= m <= 12 or not 1 <= d <= Date.dayMonth(m, y):
+            raise ValueError(f"Invalid Gregorian date: {d}/{m}/{y}")
+        super().__init__(Date.convertDate2jdn(d, m, y), (d, m, y))
+
+    def __repr__(self):
+        return "SolarDate(%d, %d, %d)" % self.toTuple()
+
+    @property
+    def day(self):
+        return self.toTuple()[0]
+
+    @property
+    def month(self):
+        return self.toTuple()[1]
+
+    @property
+    def year(self):
+        return self.toTuple()[2]
+
+    @property
+    def lunar(self):
+        """LunarDate: The same day on the lunar calendar (cached)."""
+        if self._other is None:
+            other = LunarDate.fromJdn(self.jdn)
+            object.__setattr__(other, '_other', self)
+            object.__setattr__(self, '_other', other)
+        return self._other
+
+    def toTuple(self):
+        """tuple[int, int, int]: (day, month, year), computed once."""
+        if self._tuple is None:
+            object.__setattr__(self, '_tuple', tuple(Date.convertjdn2Date(self.jdn)))
+        return self._tuple
+
+
+class LunarDate(_DayValue):
+    """
+    Immutable lunar date stored as its Julian Day Number.
+
+    Hashable and ordered (also against SolarDate, by day), supports
+    `+ n` / `- n` days and `date - date`. The Gregorian counterpart is
+    computed on first access and kept.
+    """
+    __slots__ = ()
+
+    def __init__(self, d, m, y, leap=0):
         """
-        Determine the Earthly Branch (Âm lịch hour) corresponding
-        to a given 24-hour clock hour.
+        Initialize a lunar date.
 
         Args:
-            h (int): Hour in 24-hour format (0–23).
+            d (int): Lunar day.
+            m (int): Lunar month (1–12).
+            y (int): Lunar year.
+            leap (int, optional): 1 if the month is a leap month, otherwise 0.
 
-        Returns:
-            str | None: The corresponding Earthly Branch (e.g., 'Tý', 'Sửu', ...).
-            Returns None if the input hour is outside 0 - 23.
+        Raises:
+            ValueError: If the lunar date does not exist (e.g. a missing
+                leap month or day 30 of a 29-day month).
         """
-        if not 0 <= h <= 23:
-            return None
-        a = {
-            'Tý': (23, 1), 'Sửu': (1, 3), 'Dần': (3, 5),
-            'Mão': (5, 7), 'Thìn': (7, 9), 'Tị': (9, 11),
-            'Ngọ': (11, 13), 'Mùi': (13, 15), 'Thân': (15, 17),
-            'Dậu': (17, 19), 'Tuất': (19, 21), 'Hợi': (21, 23)
-        }
-        for b, c in a.items():
-            if c[0] < c[1] and c[0] <= h < c[1]:
-                return b
-            if c[0] > c[1] and (h >= c[0] or h < c[1]):
-                return b
+        ly = LunarYear.get(y, self.timeZone)
+        length = ly.monthLength(m, leap)
+        if length is None or not 1 <= d <= length:
+            raise ValueError(f"Invalid lunar date: {d}/{m}{'N' if leap else ''}/{y}")
+        super().__init__(ly.monthStart(m, leap) + d - 1, (d, m, y, 1 if leap else 0))
+
+    def __repr__(self):
+        return "LunarDate(%d, %d, %d, %d)" % self.toTuple()
+
+    @property
+    def day(self):
+        return self.toTuple()[0]
+
+    @property
+    def month(self):
+        return self.toTuple()[1]
+
+    @property
+    def year(self):
+        return self.toTuple()[2]
+
+    @property
+    def leap(self):
+        return self.toTuple()[3]
+
+    @property
+    def solar(self):
+        """SolarDate: The same day on the Gregorian calendar (cached)."""
+        if self._other is None:
+            other = SolarDate.fromJdn(self.jdn)
+            object.__setattr__(other, '_other', self)
+            object.__setattr__(self, '_other', other)
+        return self._other
+
+    def toTuple(self):
+        """tuple[int, int, int, int]: (lunar_day, lunar_month, lunar_year, is_leap_month), computed once."""
+        if self._tuple is None:
+            object.__setattr__(self, '_tuple', tuple(LunarYear.containing(self.jdn, self.timeZone).locate(self.jdn)))
+        return self._tuple
+
+    @property
+    def lunation(self):
+        """int: Lunation number k of the month (as in SolarAndLunar.getNewMoonDay)."""
+        return LunarYear.lunation(self.jdn, self.timeZone)[0]
 
-class TietKhi:
-    TERMS = {
-        'Lập Xuân': 315, 'Vũ Thủy': 330, 'Kinh Trập': 345,
-        'Xuân Phân': 0, 'Thanh Minh': 15, 'Cốc Vũ': 30,
-        'Lập Hạ': 45, 'Tiểu Mãn': 60, 'Mang Chủng': 75,
-        'Hạ Chí': 90, 'Tiểu Thử': 105, 'Đại Thử': 120,
-        'Lập Thu': 135, 'Xử Thử': 150, 'Bạch Lộ': 165,
-        'Thu Phân': 180, 'Hàn Lộ': 195, 'Sương Giáng': 210,
-        'Lập Đông': 225, 'Tiểu Tuyết': 240, 'Đại Tuyết': 255,
-        'Đông Chí': 270, 'Tiểu Hàn': 285, 'Đại Hàn': 300
-    }
-    
-    TERMS_LIST = [
-        ('Xuân Phân', 0), ('Thanh Minh', 15), ('Cốc Vũ', 30),
-        ('Lập Hạ', 45), ('Tiểu Mãn', 60), ('Mang Chủng', 75),
-        ('Hạ Chí', 90), ('Tiểu Thử', 105), ('Đại Thử', 120),
-        ('Lập Thu', 135), ('Xử Thử', 150), ('Bạch Lộ', 165),
-        ('Thu Phân', 180), ('Hàn Lộ', 195), ('Sương Giáng', 210),
-        ('Lập Đông', 225), ('Tiểu Tuyết', 240), ('Đại Tuyết', 255),
-        ('Đông Chí', 270), ('Tiểu Hàn', 285), ('Đại Hàn', 300),
-        ('Lập Xuân', 315), ('Vũ Thủy', 330), ('Kinh Trập', 345)
-    ]
-    
     @staticmethod
-    def jdate(d, m, y, h, mn, s, timeZone = 7.0):
+    def _clip(start, length, offset, missingDay30):
         """
-        Return the Julian Date (fractional) of a given date and time.
+        Return the JDN of day offset + 1 of a month, or apply missingDay30 when the month is too short.
+        """
+        if offset < length:
+            return start + offset
+        if missingDay30 == 'skip':
+            return None
+        return start + (length - 1 if missingDay30 == 'last' else length)
+
+    def addMonths(self, n, missingDay30='last'):
+        """
+        Return the same lunar day n lunar months later (earlier if n < 0).
+
+        Leap months count as months: one month after 15/4 in 2020 is 15/4N.
 
         Args:
-            d (int): Day of the month.
-            m (int): Month of the year.
-            y (int): Year in Gregorian calendar.
-            h (int): Hour (0–23).
-            mn (int): Minute (0–59).
-            s (int): Second (0–59).
-            timeZone (float, optional): Time zone offset in hours. Default is 7.0.
+            n (int): Number of lunar months.
+            missingDay30 (str, optional): What to do with day 30 when the target month has 29 days:
+                - 'last': use day 29 (default).
+                - 'next': use the first day of the following month.
+                - 'skip': return None.
 
         Returns:
-            float: Julian Date as a floating-point number.
+            LunarDate | None: The shifted date.
+
+        Raises:
+            ValueError: If the policy name is not recognized.
         """
-        jdn = Date.convertDate2jdn(d, m, y)
-        return (jdn + (h - 12)/24 + mn/1440 + s/86400) - timeZone/24
-    
-    @staticmethod
-    def getSunLongitude(jd):
+        if missingDay30 not in ('last', 'next', 'skip'):
+            raise ValueError(f"Unknown missingDay30 policy: {missingDay30!r}")
+        k, offset = LunarYear.lunation(self.jdn, self.timeZone)
+        start = SolarAndLunar.getNewMoonDay(k + n, self.timeZone)
+        length = SolarAndLunar.getNewMoonDay(k + n + 1, self.timeZone) - start
+        jdn = LunarDate._clip(start, length, offset, missingDay30)
+        return None if jdn is None else LunarDate.fromJdn(jdn)
+
+    def nextMonth(self, missingDay30='last'):
         """
-        Return the true solar longitude (in degrees) for a given Julian Date.
+        Return the same lunar day in the next lunar month (see addMonths).
+        """
+        return self.addMonths(1, missingDay30)
+
+    def addYears(self, n, missingLeap='regular', missingDay30='last'):
+        """
+        Return the same lunar day and month n lunar years later (earlier if n < 0).
 
         Args:
-            jd (float): Julian Date.
+            n (int): Number of lunar years.
+            missingLeap (str, optional): What to do when the date is in a leap month
+                that the target year does not have:
+                - 'regular': use the regular month of the same number (default).
+                - 'skip': return None.
+            missingDay30 (str, optional): See addMonths. Default is 'last'.
 
         Returns:
-            float: Solar longitude in degrees (0–360).
+            LunarDate | None: The shifted date.
+
+        Raises:
+            ValueError: If a policy name is not recognized.
         """
-        T = (jd - 2451545) / 36525
-        T2 = T*T
-        T3 = T2*T
-        L0 = 280.46645 + 36000.76983*T + 0.0003032*T2
-        M = 357.52910 + 35999.05030*T - 0.0001559*T2 - 0.00000048*T3
-        Mr = math.radians(M)
-        C = (1.914600 - 0.004817*T - 0.000014*T2) * math.sin(Mr)
-        C += (0.01993 - 0.000101*T) * math.sin(2*Mr)
-        C += 0.000290 * math.sin(3*Mr)
-        theta = L0 + C
-        omega = math.radians(125.04 - 1934.136*T)
-        lam = theta - 0.00569 - 0.00478 * math.sin(omega)
-        lam = lam - 360 * math.floor(lam / 360)
-        return lam
-    
-    @staticmethod
-    def getDay(year, targetLong):
+        if missingLeap not in ('regular', 'skip'):
+            raise ValueError(f"Unknown missingLeap policy: {missingLeap!r}")
+        if missingDay30 not in ('last', 'next', 'skip'):
+            raise ValueError(f"Unknown missingDay30 policy: {missingDay30!r}")
+        d, m, y, leap = self.toTuple()
+        ly = LunarYear.get(y + n, self.timeZone)
+        if leap and ly.leapMonth != m:
+            if missingLeap == 'skip':
+                return None
+            leap = 0
+        jdn = LunarDate._clip(ly.monthStart(m, leap), ly.monthLength(m, leap), d - 1, missingDay30)
+        return None if jdn is None else LunarDate.fromJdn(jdn)
+
+    def monthsBetween(self, other):
         """
-        Find the date in a given year when the sun reaches a target solar longitude.
+        Return the number of whole lunar months from this date to another day.
 
         Args:
-            year (int): Gregorian year to search within.
-            targetLong (float): Target solar longitude in degrees (0–360).
+            other (LunarDate | SolarDate): The other day.
 
         Returns:
-            datetime | None: The date when the sun first reaches the target longitude,
-            or None if not found within the search window.
+            int: Whole lunar months, negative if other is earlier; a month is
+            complete once the same lunar day (or the end of a shorter month) is reached.
+            The count is antisymmetric: a.monthsBetween(b) == -b.monthsBetween(a).
         """
-        if targetLong >= 315 or targetLong < 45:
-            start = datetime(year, 1, 1)
-        elif targetLong < 135:
-            start = datetime(year, 4, 1)
-        elif targetLong < 225:
-            start = datetime(year, 7, 1)
-        else:
-            start = datetime(year, 10, 1)
-        
-        for i in range(120):
-            curr = start + timedelta(days=i)
-            next = curr + timedelta(days=1)
-            
-            jd1 = TietKhi.jdate(curr.day, curr.month, curr.year, 0, 0, 0)
-            jd2 = TietKhi.jdate(next.day, next.month, next.year, 0, 0, 0)
-            
-            sl1 = TietKhi.getSunLongitude(jd1)
-            sl2 = TietKhi.getSunLongitude(jd2)
-            
-            if sl1 <= targetLong <= sl2 or (sl1 > sl2 and (targetLong >= sl1 or targetLong <= sl2)):
-                return curr
-        
-        return None
-            
-    
-    @staticmethod
-    def getExactTime(day, targetLong):
+        a = (self.jdn,) + LunarYear.lunation(self.jdn, self.timeZone)
+        b = (other.jdn,) + LunarYear.lunation(other.jdn, self.timeZone)
+        if b[0] < a[0]:
+            return -self._months(b, a)
+        return self._months(a, b)
+
+    def _months(self, a, b):
         """
-        Find the exact Julian Date within a given day when the sun reaches
-        a target solar longitude, using binary search.
+        Whole months from a to a later day b, both (jdn, lunation, offset).
+        """
+        (_, k1, o1), (jdn, k2, o2) = a, b
+        n = k2 - k1
+        if n > 0 and o2 < o1 and jdn + 1 != SolarAndLunar.getNewMoonDay(k2 + 1, self.timeZone):
+            n -= 1
+        return n
+
+class LunarRule:
+    """
+    A recurring event on the lunar calendar, expanded lazily.
+
+    Examples:
+        LunarRule(15)                     # Rằm, every lunar month
+        LunarRule([1, 15])                # mùng 1 and Rằm
+        LunarRule(10, 3, leapMonths=False)  # Giỗ Tổ Hùng Vương, 10/3 every year
+        LunarRule(canchi='Giáp Tý')       # every Giáp Tý day
+    """
+    def __init__(self, days=None, months=None, leapMonths=True, canchi=None, missingDay30='skip', timeZone=7.0):
+        """
+        Initialize a lunar recurrence rule.
 
         Args:
-            day (datetime): The date to search within.
-            targetLong (float): Target solar longitude in degrees (0–360).
+            days (int | list[int], optional): Lunar day(s) of the month (1–30).
+                None matches every day (only useful together with canchi).
+            months (int | list[int], optional): Lunar month(s) (1–12).
+                None matches every month.
+            leapMonths (bool, optional): True if the rule also fires in leap months. Default is True.
+            canchi (str, optional): Stem-Branch of the day (e.g. 'Giáp Tý').
+            missingDay30 (str, optional): Day 30 in a 29-day month:
+                - 'skip': no occurrence that month (default).
+                - 'last': fall back to day 29.
+            timeZone (float, optional): Time zone offset in hours. Default is 7.0.
+
+        Raises:
+            ValueError: If the rule matches nothing or an argument is not recognized.
+        """
+        self.days = sorted({days} if isinstance(days, int) else set(days)) if days is not None else None
+        self.months = sorted({months} if isinstance(months, int) else set(months)) if months is not None else None
+        self.leapMonths = leapMonths; self.canchi = canchi
+        self.missingDay30 = missingDay30; self.timeZone = timeZone
+        self.canchiIndex = CanChi.toIndex(canchi) if canchi is not None else None
+        if days is None and canchi is None:
+            raise ValueError("A LunarRule needs days, canchi or both")
+        if canchi is not None and self.canchiIndex is None:
+            raise ValueError(f"Unknown Stem-Branch: {canchi!r}")
+        if missingDay30 not in ('skip', 'last'):
+            raise ValueError(f"Unknown missingDay30 policy: {missingDay30!r}")
+
+    def __repr__(self):
+        return (
+            f"LunarRule(days={self.days}, months={self.months}, "
+            f"leapMonths={self.leapMonths}, canchi={self.canchi!r})"
+        )
+
+    def iterJdn(self, j1, j2):
+        """
+        Yield the Julian Day Numbers of all occurrences between two days.
+
+        Lunar day rules walk the memoized LunarYear month starts, pure
+        Stem-Branch rules step 60 days at a time.
+
+        Args:
+            j1 (int): First Julian Day Number (inclusive).
+            j2 (int): Last Julian Day Number (inclusive).
+
+        Yields:
+            int: Julian Day Number of each occurrence, in ascending order.
+        """
+        if self.days is None and self.months is None:
+            jdn = j1 + (self.canchiIndex - CanChi.ngayIndex(j1)) % 60
+            while jdn <= j2:
+                yield jdn
+                jdn += 60
+            return
+        ly = LunarYear.containing(j1, self.timeZone)
+        while ly.starts[0] <= j2:
+            for i, (start, (m, leap)) in enumerate(zip(ly.starts, ly.months)):
+                if start > j2:
+                    return
+                if leap and not self.leapMonths or self.months is not None and m not in self.months:
+                    continue
+                length = (ly.starts[i + 1] if i + 1 < len(ly.starts) else ly.end) - start
+                if self.days is None:
+                    first = max(start, j1)
+                    days = range(first + (self.canchiIndex - CanChi.ngayIndex(first)) % 60, start + length, 60)
+                else:
+                    days = []
+                    for dl in self.days:
+                        if dl > length:
+                            if dl != 30 or self.missingDay30 == 'skip' or length in self.days:
+                                continue
+                            dl = length
+                        days.append(start + dl - 1)
+                for jdn in days:
+                    if j1 <= jdn <= j2 and (self.canchiIndex is None or CanChi.ngayIndex(jdn) == self.canchiIndex):
+                        yield jdn
+            ly = LunarYear.get(ly.year + 1, self.timeZone)
+
+    def between(self, d1, m1, y1, d2, m2, y2):
+        """
+        Yield all occurrences between two Gregorian dates (inclusive).
+
+        Args:
+            d1 (int): Day of the first date.
+            m1 (int): Month of the first date.
+            y1 (int): Year of the first date.
+            d2 (int): Day of the last date.
+            m2 (int): Month of the last date.
+            y2 (int): Year of the last date.
+
+        Yields:
+            tuple[int, int, int]: Each occurrence as (day, month, year).
+        """
+        for jdn in self.iterJdn(Date.convertDate2jdn(d1, m1, y1), Date.convertDate2jdn(d2, m2, y2)):
+            yield Date.convertjdn2Date(jdn)
+
+    def toRRule(self, d, m, y):
+        """
+        Return the rule as RFC 5545 DTSTART / RRULE lines.
+
+        Stem-Branch rules repeat every 60 days and are exact. Lunar day rules
+        use RSCALE=CHINESE from RFC 7529, whose months follow the UTC+8 Chinese
+        calendar and may differ from the Vietnamese one by a day or a month;
+        use toRDate when exact dates matter.
+
+        Args:
+            d (int): Day of the DTSTART date.
+            m (int): Month of the DTSTART date.
+            y (int): Year of the DTSTART date.
 
         Returns:
-            float: Julian Date (fractional) of the exact moment.
+            str | None: DTSTART and RRULE lines, or None if the rule combines
+            lunar days with a Stem-Branch and cannot be written as an RRULE.
         """
-        js = TietKhi.jdate(day.day, day.month, day.year, 0, 0, 0)
-        je = TietKhi.jdate(day.day, day.month, day.year, 23, 59, 59)
-        
-        def normalize(angle):
-            return angle % 360
-        
-        def isBetween(start, end, target):
-            start = normalize(start)
-            end = normalize(end)
-            target = normalize(target)
-            
-            if start <= end:
-                return start <= target <= end
-            else:
-                return target >= start or target <= end
-        
-        for _ in range(100):
-            jm = (js + je) / 2
-            
-            sls = TietKhi.getSunLongitude(js)
-            sle = TietKhi.getSunLongitude(je)
-            slm = TietKhi.getSunLongitude(jm)
-            
-            if abs(slm - targetLong) < 0.001 or abs((slm - targetLong + 360) % 360) < 0.001:
-                return jm
-            
-            if isBetween(sls, slm, targetLong):
-                je = jm
-            else:
-                js = jm
-        
-        return (js + je) / 2
-    
+        j1 = Date.convertDate2jdn(d, m, y)
+        if self.days is None and self.months is None:
+            ds, ms, ys = Date.convertjdn2Date(j1 + (self.canchiIndex - CanChi.ngayIndex(j1)) % 60)
+            return f"DTSTART;VALUE=DATE:{ys:04d}{ms:02d}{ds:02d}\nRRULE:FREQ=DAILY;INTERVAL=60"
+        if self.canchiIndex is not None or self.days is None:
+            return None
+        rule = 'RRULE:RSCALE=CHINESE;FREQ=' + ('MONTHLY' if self.months is None else 'YEARLY')
+        if self.months is not None:
+            months = []
+            for mo in self.months:
+                months += [str(mo), f'{mo}L'] if self.leapMonths else [str(mo)]
+            rule += ';BYMONTH=' + ','.join(months)
+        rule += ';BYMONTHDAY=' + ','.join(str(dl) for dl in self.days)
+        rule += ';SKIP=' + ('OMIT' if self.missingDay30 == 'skip' else 'BACKWARD')
+        return f"DTSTART;VALUE=DATE:{y:04d}{m:02d}{d:02d}\n{rule}"
+
+    def toRDate(self, d1, m1, y1, d2, m2, y2):
+        """
+        Return all occurrences between two Gregorian dates as an RFC 5545 RDATE line.
+
+        Args:
+            d1 (int): Day of the first date.
+            m1 (int): Month of the first date.
+            y1 (int): Year of the first date.
+            d2 (int): Day of the last date.
+            m2 (int): Month of the last date.
+            y2 (int): Year of the last date.
+
+        Returns:
+            str: An 'RDATE;VALUE=DATE:...' line listing every occurrence.
+        """
+        dates = (f'{y:04d}{m:02d}{d:02d}' for d, m, y in self.between(d1, m1, y1, d2, m2, y2))
+        return 'RDATE;VALUE=DATE:' + ','.join(dates)
+
+class CanChi:
+    CAN = ['Giáp', 'Ất', 'Bính', 'Đinh', 'Mậu', 'Kỷ', 'Canh', 'Tân', 'Nhâm', 'Qúy']
+    CHI = ['Tý', 'Sửu', 'Dần', 'Mão', 'Thìn', 'Tị', 'Ngọ', 'Mùi', 'Thân', 'Dậu', 'Tuất', 'Hợi']
+
     @staticmethod
-    def getTermDate(termName, year):
+    def toIndex(cch):
         """
-        Return the exact datetime when a solar term (Tiết Khí) begins in a given year.
+        Return the position of a Stem-Branch in the sexagenary cycle.
 
         Args:
-            termName (str): Name of the solar term in Vietnamese (e.g., 'Xuân Phân', 'Đông Chí').
-            year (int): Gregorian year.
+            cch (str): Stem-Branch in Vietnamese (e.g. 'Giáp Tý', 'Canh Thân').
 
         Returns:
-            datetime | None: Datetime of the solar term's start in Vietnam time (UTC+7),
-            or None if the term name is not recognized or the date is not found.
+            int | None: Index 0–59 (0 = Giáp Tý, 59 = Qúy Hợi),
+            or None if the combination is not valid.
         """
-        if termName not in TietKhi.TERMS:
+        parts = cch.split()
+        if len(parts) != 2:
             return None
-        
-        targetLong = TietKhi.TERMS[termName]
-        day = TietKhi.getDay(year, targetLong)
-        
-        if not day:
+        c, b = parts
+        if c not in CanChi.CAN or b not in CanChi.CHI:
             return None
+        c = CanChi.CAN.index(c); b = CanChi.CHI.index(b)
+        if (c - b) % 2:
+            return None
+        return c + 10 * ((5 * (b - c) // 2) % 6)
+
+    @staticmethod
+    def fromIndex(i):
+        """
+        Return the Stem-Branch at a position of the sexagenary cycle.
+
+        Args:
+            i (int): Index in the cycle, taken modulo 60.
+
+        Returns:
+            str: Stem-Branch in Vietnamese.
+        """
+        return CanChi.CAN[i % 10] + ' ' + CanChi.CHI[i % 12]
+
+    @staticmethod
+    def ngayIndex(jdn):
+        """
+        Return the sexagenary index of the day with a given Julian Day Number.
+
+        Args:
+            jdn (int): Julian Day Number.
+
+        Returns:
+            int: Index 0–59, CanChi.fromIndex(ngayIndex(jdn)) is the day's Stem-Branch.
+        """
+        return (jdn + 49) % 60
+
+    @staticmethod
+    def gioIndex(jdn, h):
+        """
+        Return the sexagenary index of an hour of a day.
+
+        The Tý hour starts at 23:00, so 23:00–23:59 takes the stem of the next day.
+
+        Args:
+            jdn (int): Julian Day Number.
+            h (int): Hour in 24-hour format (0–23).
+
+        Returns:
+            int: Index 0–59, CanChi.fromIndex(gioIndex(jdn, h)) is the hour's Stem-Branch.
+        """
+        b = (h + 1) // 2 % 12
+        c = (2 * ((jdn + (h == 23) + 9) % 10) + b) % 10
+        return c + 10 * ((5 * (b - c) // 2) % 6)
+
+    @staticmethod
+    def nam(y):
+        """
+        Return the heavenly stems and earthly branches (Stem-Branch) of the year given.
         
-        jdExact = TietKhi.getExactTime(day, targetLong)
-        jdUtc = jdExact + 7/24
-        
-        jdn = int(jdUtc + 0.5)
-        fraction = (jdUtc + 0.5) - jdn
-        
-        d, m, y = Date.convertjdn2Date(jdn)
-        
-        hours = fraction * 24
-        h = int(hours)
-        minutes = (hours - h) * 60
-        mn = int(minutes)
-        return datetime(y, m, d, h, mn)
+        Args:
+            y (int): Year in Lunar calendar.
+
+        Returns:
+            The Stem-Branch of the year given in Vietnamese.  
+        """
+        can = ['Giáp', 'Ất', 'Bính', 'Đinh', 'Mậu', 'Kỷ', 'Canh', 'Tân', 'Nhâm', 'Qúy']
+        chi = ['Tý', 'Sửu', 'Dần', 'Mão', 'Thìn', 'Tị', 'Ngọ', 'Mùi', 'Thân', 'Dậu', 'Tuất', 'Hợi']
+        c1 = can[int(str(y + 6)[-1])]; c2 = chi[(y + 8) % 12]
+        return c1 + ' ' + c2
     
     @staticmethod
-    def getTerm(d, m, y):
+    def thang(m, y):
         """
-        Return the solar term (Tiết Khí) that a given Gregorian date belongs to.
+        Return the heavenly stems and earthly branches (Stem-Branch) of the month given.
+        
+        Args:
+            m (int): Month of the Lunar year.
+            y (int): Year in Lunar calendar.
 
+        Returns:
+            The Stem-Branch of the month given in Vietnamese.  
+        """
+        can = ['Giáp', 'Ất', 'Bính', 'Đinh', 'Mậu', 'Kỷ', 'Canh', 'Tân', 'Nhâm', 'Qúy']
+        chi = ['Tý', 'Sửu', 'Dần', 'Mão', 'Thìn', 'Tị', 'Ngọ', 'Mùi', 'Thân', 'Dậu', 'Tuất', 'Hợi']
+        chin = chi[2::] + chi[:2]
+        start_can = {
+            'Giáp': 'Bính', 'Kỷ': 'Bính',
+            'Ất': 'Mậu',  'Canh': 'Mậu',
+            'Bính': 'Canh','Tân': 'Canh',
+            'Đinh': 'Nhâm','Nhâm': 'Nhâm',
+            'Mậu': 'Giáp','Qúy': 'Giáp'
+        }
+        yrc1 = can[(y - 4) % 10]; c0 = can.index(start_can[yrc1])
+        moc1 = can[(c0 + m - 1) % 10]; moc2 = chin[m - 1]
+        return moc1 + ' ' + moc2
+    
+    @staticmethod
+    def ngay(d,m,y):
+        """
+        Return the heavenly stems and earthly branches (Stem-Branch) of the date given.
+        
         Args:
-            d (int): Day of the month.
+            d (int): Day of the month
             m (int): Month of the year.
             y (int): Year in Gregorian calendar.
 
         Returns:
-            str | None: Name of the solar term in Vietnamese,
-            or None if no matching term is found.
+            The Stem-Branch of the date given in Vietnamese.  
         """
-        jd = TietKhi.jdate(d, m, y, 23, 59, 59)
-        sl = TietKhi.getSunLongitude(jd)
-        
-        for i in range(len(TietKhi.TERMS_LIST)):
-            name, long = TietKhi.TERMS_LIST[i]
-            nextLong = TietKhi.TERMS_LIST[(i + 1) % len(TietKhi.TERMS_LIST)][1]
-            
-            if long < nextLong:
-                if long <= sl < nextLong:
-                    return name
-            else:
-                if sl >= long or sl < nextLong:
-                    return name
-        return None
-    
+        can = ['Giáp', 'Ất', 'Bính', 'Đinh', 'Mậu', 'Kỷ', 'Canh', 'Tân', 'Nhâm', 'Qúy']
+        chi = ['Tý', 'Sửu', 'Dần', 'Mão', 'Thìn', 'Tị', 'Ngọ', 'Mùi', 'Thân', 'Dậu', 'Tuất', 'Hợi']
+        jdn = Date.convertDate2jdn(d, m, y)
+        c1 = can[(jdn + 9) % 10]; c2 = chi[(jdn + 1) % 12]
+        return c1 + ' ' + c2
+
     @staticmethod
-    def getAllTerms(y):
+    def _target(cch):
+        i = CanChi.toIndex(cch)
+        if i is None:
+            raise ValueError(f'Invalid Stem-Branch {cch!r}')
+        return i
+
+    @staticmethod
+    def _offset(cur, target, n):
         """
-        Return the start datetime of all 24 solar terms (Tiết Khí) for a given year.
+        Return the distance from a position of sexagenary index cur to the n-th position
+        after it (n > 0) or before it (n < 0) whose index is target.
+        """
+        if n > 0:
+            return (target - cur - 1) % 60 + 1 + 60 * (n - 1)
+        if n < 0:
+            return -((cur - target - 1) % 60 + 1) - 60 * (-n - 1)
+        raise ValueError('n must not be 0')
+
+    @staticmethod
+    def findNgay(cch, d, m, y, n=1):
+        """
+        Return the n-th day of a given Stem-Branch after (or before) a Gregorian date.
 
         Args:
-            y (int): Gregorian year.
+            cch (str): Stem-Branch of the day (e.g. 'Canh Thân').
+            d (int): Day of the month.
+            m (int): Month of the year.
+            y (int): Year in Gregorian calendar.
+            n (int, optional): 1 for the next occurrence, -1 for the previous one, 2 for
+                the one after next, ... The date itself is never counted. Default is 1.
 
         Returns:
-            dict[str, str]: A dictionary mapping each solar term name (in Vietnamese)
-            to a formatted string describing its start date, time, and Earthly Branch hour.
-        """
-        a = list(TietKhi.TERMS.keys())
-        res = dict()
-        for i in a:
-            b = TietKhi.getTermDate(i, y)
-            h = TotXau.gioAm(b.hour)
-            res[i] = f"Ngày {b.day:02d}/{b.month:02d}/{b.year}, vào {b.hour:02d}:{b.minute:02d}:{b.second:02d} (giờ {h})"
-        return res
+            tuple[int, int, int]: (day, month, year) of the occurrence.
 
+        Raises:
+            ValueError: If cch is not a valid Stem-Branch or n is 0.
+        """
+        jdn = Date.convertDate2jdn(d, m, y)
+        return Date.convertjdn2Date(jdn + CanChi._offset((jdn + 49) % 60, CanChi._target(cch), n))
 
-class VanSu:
     @staticmethod
-    def getSao(d, m, y):
+    def allNgay(cch, d1, m1, y1, d2, m2, y2):
+        """
+        Return every day of a given Stem-Branch from d1/m1/y1 to d2/m2/y2 inclusive.
+        """
+        first = Date.convertDate2jdn(d1, m1, y1); last = Date.convertDate2jdn(d2, m2, y2)
+        start = first + (CanChi._target(cch) - (first + 49)) % 60
+        return [Date.convertjdn2Date(jdn) for jdn in range(start, last + 1, 60)]
+
+    @staticmethod
+    def findThang(cch, m, y, n=1):
+        """
+        Return the n-th lunar month of a given Stem-Branch after (or before) a lunar month.
+        Leap months share the Stem-Branch of their month and are not counted.
+
+        Args:
+            cch (str): Stem-Branch of the month (e.g. 'Bính Dần').
+            m (int): Month of the Lunar year.
+            y (int): Year in Lunar calendar.
+            n (int, optional): As in findNgay. Default is 1.
+
+        Returns:
+            tuple[int, int]: (month, year) in the Lunar calendar.
+        """
+        k = 12 * y + m - 1
+        k += CanChi._offset((k + 14) % 60, CanChi._target(cch), n)
+        return k % 12 + 1, k // 12
+
+    @staticmethod
+    def allThang(cch, m1, y1, m2, y2):
+        """
+        Return every lunar month (month, year) of a given Stem-Branch from m1/y1 to m2/y2 inclusive.
+        """
+        first = 12 * y1 + m1 - 1; last = 12 * y2 + m2 - 1
+        start = first + (CanChi._target(cch) - (first + 14)) % 60
+        return [(k % 12 + 1, k // 12) for k in range(start, last + 1, 60)]
+
+    @staticmethod
+    def findNam(cch, y, n=1):
+        """
+        Return the n-th lunar year of a given Stem-Branch after (or before) year y (see findNgay).
+        """
+        return y + CanChi._offset((y - 4) % 60, CanChi._target(cch), n)
+
+    @staticmethod
+    def allNam(cch, y1, y2):
+        """
+        Return every lunar year of a given Stem-Branch from y1 to y2 inclusive.
+        """
+        return list(range(y1 + (CanChi._target(cch) - (y1 - 4)) % 60, y2 + 1, 60))
+
+class TotXau:
+    HOANG_HAC_DAO = [
+        ('Thanh Long', 'Hoàng Đạo'), ('Minh Đường', 'Hoàng Đạo'), ('Thiên Hình', 'Hắc Đạo'),
+        ('Chu Tước', 'Hắc Đạo'), ('Kim Quỹ', 'Hoàng Đạo'), ('Kim Đường', 'Hoàng Đạo'),
+        ('Bạch Hổ', 'Hắc Đạo'), ('Ngọc Đường', 'Hoàng Đạo'), ('Thiên Lao', 'Hắc Đạo'),
+        ('Huyền Vũ', 'Hắc Đạo'), ('Tư Mệnh', 'Hoàng Đạo'), ('Câu Trận', 'Hắc Đạo')
+    ]
+
+    NGUYET_PHA = {1: 'Thân', 2: 'Dậu', 3: 'Tuất', 4: 'Hợi', 5: 'Tý', 6: 'Sửu', 7: 'Dần', 8: 'Mão', 9: 'Thìn', 10: 'Tị', 11: 'Ngọ', 12: 'Mùi'}
+    SAT_CHU = {1: 'Tý', 2: 'Sửu', 3: 'Sửu', 4: 'Tuất', 5: 'Thìn', 6: 'Thìn', 7: 'Sửu', 8: 'Thìn', 9: 'Sửu', 10: 'Thìn', 11: 'Mùi', 12: 'Thìn'}
+    THO_TU = {1: 'Tuất', 2: 'Thân', 3: 'Hợi', 4: 'Tị', 5: 'Tý', 6: 'Ngọ', 7: 'Sửu', 8: 'Mùi', 9: 'Dần', 10: 'Thân', 11: 'Mão', 12: 'Dậu'}
+    DAI_BAI = {
+        'Giáp': {3: 'Mậu Tuất', 7: 'Qúy Hợi', 10: 'Bính Thân', 11: 'Đinh Hợi'},
+        'Kỷ': {3: 'Mậu Tuất', 7: 'Qúy Hợi', 10: 'Bính Thân', 11: 'Đinh Hợi'},
+        'Ất': {4: 'Nhâm Thân', 9: 'Ất Tị'}, 'Canh': {4: 'Nhâm Thân', 9: 'Ất Tị'},
+        'Bính': {3: 'Tân Tị', 9: 'Canh Thìn'}, 'Tân': {3: 'Tân Tị', 9: 'Canh Thìn'},
+        'Mậu': {m: 'Kỷ Sửu' for m in range(1, 13)}, 'Qúy': {m: 'Kỷ Sửu' for m in range(1, 13)},
+    }
+    VANG_VONG = {1: 'Dần', 2: 'Tị', 3: 'Thân', 4: 'Hợi', 5: 'Mão', 6: 'Ngọ', 7: 'Dậu', 8: 'Tý', 9: 'Thìn', 10: 'Mùi', 11: 'Tuất', 12: 'Sửu'}
+    TAM_NUONG = frozenset((3, 7, 13, 18, 22, 27))
+    NGUYET_KY = frozenset((5, 14, 23))
+
+    TRUC_BANG = {
+        "Thanh Long": {(1,7):"Tý",(2,8):"Dần",(3,9):"Thìn",(4,10):"Ngọ",(5,11):"Thân",(6,12):"Tuất"},
+        "Minh Đường": {(1,7):"Sửu",(2,8):"Mão",(3,9):"Tị",(4,10):"Mùi",(5,11):"Dậu",(6,12):"Hợi"},
+        "Thiên Hình": {(1,7):"Dần",(2,8):"Thìn",(3,9):"Ngọ",(4,10):"Thân",(5,11):"Tuất",(6,12):"Tý"},
+        "Chu Tước": {(1,7):"Mão",(2,8):"Tị",(3,9):"Mùi",(4,10):"Dậu",(5,11):"Hợi",(6,12):"Sửu"},
+        "Kim Quỹ": {(1,7):"Thìn",(2,8):"Ngọ",(3,9):"Thân",(4,10):"Tuất",(5,11):"Tý",(6,12):"Dần"},
+        "Kim Đường": {(1,7):"Tị",(2,8):"Mùi",(3,9):"Dậu",(4,10):"Hợi",(5,11):"Sửu",(6,12):"Mão"},
+        "Bạch Hổ": {(1,7):"Ngọ",(2,8):"Thân",(3,9):"Tuất",(4,10):"Tý",(5,11):"Dần",(6,12):"Thìn"},
+        "Ngọc Đường": {(1,7):"Mùi",(2,8):"Dậu",(3,9):"Hợi",(4,10):"Sửu",(5,11):"Mão",(6,12):"Tị"},
+        "Thiên Lao": {(1,7):"Thân",(2,8):"Tuất",(3,9):"Tý",(4,10):"Dần",(5,11):"Thìn",(6,12):"Ngọ"},
+        "Huyền Vũ": {(1,7):"Dậu",(2,8):"Hợi",(3,9):"Sửu",(4,10):"Mão",(5,11):"Tị",(6,12):"Mùi"},
+        "Tư Mệnh": {(1,7):"Tuất",(2,8):"Tý",(3,9):"Dần",(4,10):"Thìn",(5,11):"Ngọ",(6,12):"Thân"},
+        "Câu Trận": {(1,7):"Hợi",(2,8):"Sửu",(3,9):"Mão",(4,10):"Tị",(5,11):"Mùi",(6,12):"Dậu"}
+    }
+    HOANG_DAO = {"Thanh Long","Minh Đường","Kim Quỹ","Kim Đường","Ngọc Đường","Tư Mệnh"}
+
+    CUU_DIEU_NAM = ('La Hầu', 'Thổ Tú', 'Thủy Diệu', 'Thái Bạch', 'Thái Dương', 'Vân Hớn', 'Kế Đô', 'Thái Âm', 'Mộc Đức')
+    CUU_DIEU_NU = ('Kế Đô', 'Vân Hớn', 'Mộc Đức', 'Thái Âm', 'Thổ Tú', 'La Hầu', 'Thái Dương', 'Thái Bạch', 'Thủy Diệu')
+
+    QUY_HOI = {'Tý': (23, 1), 'Sửu': (1, 3), 'Dần': (3, 5),
+               'Mão': (5, 7), 'Thìn': (7, 9), 'Tị': (9, 11),
+               'Ngọ': (11, 13), 'Mùi': (13, 15), 'Thân': (15, 17),
+               'Dậu': (17, 19), 'Tuất': (19, 21), 'Hợi': (21, 23)
+               }
+
+    GIO_HOANG_DAO = {('Dần', 'Thân'): ('Tý', 'Sửu', 'Thìn', 'Tị', 'Mùi', 'Tuất'),
+                     ('Mão', 'Dậu'): ('Tý', 'Dần', 'Mão', 'Ngọ', 'Mùi', 'Dậu'),
+                     ('Thìn', 'Tuất'): ('Dần', 'Thìn', 'Tị', 'Thân', 'Dậu', 'Hợi'),
+                     ('Tị', 'Hợi'): ('Sửu', 'Thìn', 'Ngọ', 'Mùi', 'Tuất', 'Hợi'),
+                     ('Tý', 'Ngọ'): ('Tý', 'Sửu', 'Mão', 'Ngọ', 'Thân', 'Dậu'),
+                     ('Sửu', 'Mùi'): ('Dần', 'Mão', 'Tị', 'Thân', 'Tuất', 'Hợi')
+                     }
+
+    XUNG = {
+        "Giáp Tý":  ["Giáp Tý", "Giáp Ngọ", "Canh Tý", "Canh Ngọ", "Mậu Ngọ"],
+        "Ất Sửu":   ["Ất Sửu", "Ất Mùi", "Tân Sửu", "Tân Mùi", "Kỷ Mùi"],
+        "Bính Dần": ["Bính Dần", "Bính Thân", "Nhâm Dần", "Nhâm Thân", "Giáp Thân"],
+        "Đinh Mão": ["Đinh Mão", "Đinh Dậu", "Qúy Mão", "Qúy Dậu", "Ất Dậu"],
+        "Mậu Thìn": ["Mậu Thìn", "Mậu Tuất", "Giáp Thìn", "Giáp Tuất", "Canh Tuất"],
+        "Kỷ Tị":    ["Kỷ Tị", "Kỷ Hợi", "Ất Tị", "Ất Hợi", "Tân Hợi"],
+        "Canh Ngọ": ["Canh Ngọ", "Canh Tý", "Bính Ngọ", "Bính Tý", "Nhâm Tý"],
+        "Tân Mùi":  ["Tân Mùi", "Tân Sửu", "Đinh Mùi", "Đinh Sửu", "Qúy Sửu"],
+        "Nhâm Thân":["Nhâm Thân", "Nhâm Dần", "Mậu Thân", "Mậu Dần", "Bính Dần"],
+        "Qúy Dậu":  ["Qúy Dậu", "Qúy Mão", "Kỷ Dậu", "Kỷ Mão", "Đinh Mão"],
+        "Giáp Tuất":["Giáp Tuất", "Giáp Thìn", "Canh Tuất", "Canh Thìn", "Nhâm Thìn"],
+        "Ất Hợi":   ["Ất Hợi", "Ất Tị", "Tân Hợi", "Tân Tị", "Qúy Tị"],
+        "Bính Tý":  ["Bính Tý", "Bính Ngọ", "Nhâm Tý", "Nhâm Ngọ", "Canh Ngọ"],
+        "Đinh Sửu": ["Đinh Sửu", "Đinh Mùi", "Qúy Sửu", "Qúy Mùi", "Tân Mùi"],
+        "Mậu Dần":  ["Mậu Dần", "Mậu Thân", "Giáp Dần", "Giáp Thân", "Canh Thân"],
+        "Kỷ Mão":   ["Kỷ Mão", "Kỷ Dậu", "Ất Mão", "Ất Dậu", "Tân Dậu"],
+        "Canh Thìn":["Canh Thìn", "Canh Tuất", "Bính Thìn", "Bính Tuất", "Giáp Tuất"],
+        "Tân Tị":   ["Tân Tị", "Tân Hợi", "Đinh Tị", "Đinh Hợi", "Ất Hợi"],
+        "Nhâm Ngọ": ["Nhâm Ngọ", "Nhâm Tý", "Mậu Ngọ", "Mậu Tý", "Giáp Tý"],
+        "Qúy Mùi":  ["Qúy Mùi", "Qúy Sửu", "Kỷ Mùi", "Kỷ Sửu", "Ất Sửu"],
+        "Giáp Thân":["Giáp Thân", "Giáp Dần", "Canh Thân", "Canh Dần", "Mậu Dần"],
+        "Ất Dậu":   ["Ất Dậu", "Ất Mão", "Tân Dậu", "Tân Mão", "Kỷ Mão"],
+        "Bính Tuất":["Bính Tuất", "Bính Thìn", "Nhâm Tuất", "Nhâm Thìn", "Mậu Thìn"],
+        "Đinh Hợi": ["Đinh Hợi", "Đinh Tị", "Qúy Hợi", "Qúy Tị", "Kỷ Tị"],
+        "Mậu Tý":   ["Mậu Tý", "Mậu Ngọ", "Giáp Tý", "Giáp Ngọ", "Bính Ngọ"],
+        "Kỷ Sửu":   ["Kỷ Sửu", "Kỷ Mùi", "Ất Sửu", "Ất Mùi", "Đinh Mùi"],
+        "Canh Dần": ["Canh Dần", "Canh Thân", "Bính Dần", "Bính Thân", "Nhâm Thân"],
+        "Tân Mão":  ["Tân Mão", "Tân Dậu", "Đinh Mão", "Đinh Dậu", "Qúy Dậu"],
+        "Nhâm Thìn":["Nhâm Thìn", "Nhâm Tuất", "Mậu Thìn", "Mậu Tuất", "Bính Tuất"],
+        "Qúy Tị":   ["Qúy Tị", "Qúy Hợi", "Kỷ Tị", "Kỷ Hợi", "Đinh Hợi"],
+        "Giáp Ngọ": ["Giáp Ngọ", "Giáp Tý", "Canh Tý", "Canh Ngọ", "Mậu Tý"],
+        "Ất Mùi":   ["Ất Mùi", "Ất Sửu", "Tân Sửu", "Tân Mùi", "Kỷ Sửu"],
+        "Bính Thân":["Bính Thân", "Bính Dần", "Nhâm Dần", "Nhâm Thân", "Giáp Dần"],
+        "Đinh Dậu": ["Đinh Dậu", "Đinh Mão", "Qúy Mão", "Qúy Dậu", "Ất Mão"],
+        "Mậu Tuất": ["Mậu Tuất", "Mậu Thìn", "Giáp Thìn", "Giáp Tuất", "Canh Thìn"],
+        "Kỷ Hợi":   ["Kỷ Hợi", "Kỷ Tị", "Ất Tị", "Ất Hợi", "Tân Tị"],
+        "Canh Tý":  ["Canh Tý", "Canh Ngọ", "Bính Ngọ", "Bính Tý", "Nhâm Ngọ"],
+        "Tân Sửu":  ["Tân Sửu", "Tân Mùi", "Đinh Mùi", "Đinh Sửu", "Qúy Mùi"],
+        "Nhâm Dần": ["Nhâm Dần", "Nhâm Thân", "Mậu Thân", "Mậu Dần", "Bính Thân"],
+        "Qúy Mão":  ["Qúy Mão", "Qúy Dậu", "Kỷ Dậu", "Kỷ Mão", "Đinh Dậu"],
+        "Giáp Thìn":["Giáp Thìn", "Giáp Tuất", "Canh Thìn", "Canh Tuất", "Nhâm Tuất"],
+        "Ất Tị":    ["Ất Tị", "Ất Hợi", "Tân Tị", "Tân Hợi", "Qúy Hợi"],
+        "Bính Ngọ": ["Bính Ngọ", "Bính Tý", "Nhâm Ngọ", "Nhâm Tý", "Canh Tý"],
+        "Đinh Mùi": ["Đinh Mùi", "Đinh Sửu", "Qúy Mùi", "Qúy Sửu", "Tân Sửu"],
+        "Mậu Thân": ["Mậu Thân", "Mậu Dần", "Giáp Thân", "Giáp Dần", "Canh Dần"],
+        "Kỷ Dậu":   ["Kỷ Dậu", "Kỷ Mão", "Ất Dậu", "Ất Mão", "Tân Mão"],
+        "Canh Tuất":["Canh Tuất", "Canh Thìn", "Bính Tuất", "Bính Thìn", "Giáp Thìn"],
+        "Tân Hợi":  ["Tân Hợi", "Tân Tị", "Đinh Hợi", "Đinh Tị", "Ất Tị"],
+        "Nhâm Tý":  ["Nhâm Tý", "Nhâm Ngọ", "Mậu Tý", "Mậu Ngọ", "Giáp Ngọ"],
+        "Qúy Sửu":  ["Qúy Sửu", "Qúy Mùi", "Kỷ Sửu", "Kỷ Mùi", "Ất Mùi"],
+        "Giáp Dần": ["Giáp Dần", "Giáp Thân", "Canh Dần", "Canh Thân", "Mậu Thân"],
+        "Ất Mão":   ["Ất Mão", "Ất Dậu", "Tân Mão", "Tân Dậu", "Kỷ Dậu"],
+        "Bính Thìn":["Bính Thìn", "Bính Tuất", "Nhâm Thìn", "Nhâm Tuất", "Mậu Tuất"],
+        "Đinh Tị":  ["Đinh Tị", "Đinh Hợi", "Qúy Tị", "Qúy Hợi", "Kỷ Hợi"],
+        "Mậu Ngọ":  ["Mậu Ngọ", "Mậu Tý", "Giáp Ngọ", "Giáp Tý", "Bính Tý"],
+        "Kỷ Mùi":   ["Kỷ Mùi", "Kỷ Sửu", "Ất Mùi", "Ất Sửu", "Đinh Sửu"],
+        "Canh Thân":["Canh Thân", "Canh Dần", "Bính Thân", "Bính Dần", "Nhâm Dần"],
+        "Tân Dậu":  ["Tân Dậu", "Tân Mão", "Đinh Dậu", "Đinh Mão", "Qúy Mão"],
+        "Nhâm Tuất":["Nhâm Tuất", "Nhâm Thìn", "Mậu Tuất", "Mậu Thìn", "Bính Thìn"],
+        "Qúy Hợi":  ["Qúy Hợi", "Qúy Tị", "Kỷ Hợi", "Kỷ Tị", "Đinh Tị"]
+    }
+
+    @staticmethod
+    def getHoangHacDaoIndex(chi, m):
+        """
+        Return the index in HOANG_HAC_DAO of the star governing a day.
+
+        The Thanh Long day of lunar months 1 and 7 is Tý and moves two branches
+        forward every month, the other eleven stars follow it in order.
+
+        Args:
+            chi (int): Day Earthly Branch index (0 = Tý, ..., 11 = Hợi).
+            m (int): Lunar month (1–12).
+
+        Returns:
+            int: Index (0–11) into HOANG_HAC_DAO.
+        """
+        return (chi - 2 * ((m - 1) % 6)) % 12
+
+    @staticmethod
+    def getHoangHacDao(d, m):
+        """
+        Determine whether a given day branch (Địa Chi) in a specific lunar month
+        is a Hoàng Đạo (auspicious) or Hắc Đạo (inauspicious) day.
+
+        Args:
+            d (str): Day Earthly Branch (e.g. 'Tý', 'Sửu', 'Dần', ...).
+            m (int): Lunar month (1–12).
+
+        Returns:
+            tuple[str | None, str | None]:
+                - Name of the star (e.g., 'Thanh Long', 'Bạch Hổ', ...)
+                - Type: 'Hoàng Đạo' or 'Hắc Đạo'
+
+                Returns (None, None) if no match is found.
+        """
+        for ten, bang in TotXau.TRUC_BANG.items():
+            for thang, chi in bang.items():
+                if m in thang and d == chi:
+                    loai = "Hoàng Đạo" if ten in TotXau.HOANG_DAO else "Hắc Đạo"
+                    return ten, loai
+        return None, None
+    
+    @staticmethod
+    def isTamNuong(dl, ml, yl):
+        """
+        Check if a lunar day is a Tam Nương day (considered inauspicious).
+        Tam Nương days are fixed lunar days: 3, 7, 13, 18, 22, 27.
+
+        Args:
+            dl (int): Lunar day.
+            ml (int): Lunar month (unused).
+            yl (int): Lunar year (unused).
+
+        Returns:
+            bool: True if the day is Tam Nương day, otherwise False.
+        """
+        return dl in TotXau.TAM_NUONG
+    
+    @staticmethod
+    def isNguyetPha(dl, ml, yl):
+        """
+        Check if a lunar date is a Nguyệt Phá day (considered inauspicious).
+
+        Args:
+            dl (int): Lunar day.
+            ml (int): Lunar month.
+            yl (int): Lunar year.
+
+        Returns:
+            bool: True if it is a Nguyệt Phá day, otherwise False.
+        """
+        isLeap = 1 if yl % 19 in [0, 3, 6, 9, 11, 14, 17] else 0
+        ds, ms, ys = SolarAndLunar.convertLunar2Solar(dl, ml, yl, isLeap)
+        return CanChi.ngay(ds, ms, ys).split()[1] == TotXau.NGUYET_PHA[ml]
+            
+    @staticmethod
+    def isSatChu(dl, ml, yl):
+        """
+        Check if a lunar date is a Sát Chủ day (considered inauspicious).
+
+        Args:
+            dl (int): Lunar day.
+            ml (int): Lunar month.
+            yl (int): Lunar year.
+
+        Returns:
+            bool: True if it is a Sát Chủ day, otherwise False.
+        """
+        isLeap = 1 if yl % 19 in [0, 3, 6, 9, 11, 14, 17] else 0
+        ds, ms, ys = SolarAndLunar.convertLunar2Solar(dl, ml, yl, isLeap)
+        return CanChi.ngay(ds, ms, ys).split()[1] == TotXau.SAT_CHU[ml]
+    
+    @staticmethod
+    def isThoTu(dl, ml, yl):
+        """
+        Check if a lunar date is a Thọ Tử day (considered inauspicious).
+        
+        Args:
+            dl (int): Lunar day.
+            ml (int): Lunar month.
+            yl (int): Lunar year.
+
+        Returns:
+            bool: True if it is a Thọ Tử day, otherwise False.
+        """
+        isLeap = 1 if yl % 19 in [0, 3, 6, 9, 11, 14, 17] else 0
+        ds, ms, ys = SolarAndLunar.convertLunar2Solar(dl, ml, yl, isLeap)
+        return CanChi.ngay(ds, ms, ys).split()[1] == TotXau.THO_TU[ml]
+    
+    @staticmethod
+    def isVangVong(dl, ml, yl):
+        """
+        Check if a lunar date is a Vãng Vong day (considered inauspicious).
+
+        Args:
+            dl (int): Lunar day.
+            ml (int): Lunar month.
+            yl (int): Lunar year.
+
+        Returns:
+            bool: True if it is a Vãng Vong day, otherwise False.
+        """
+        isLeap = 1 if yl % 19 in [0, 3, 6, 9, 11, 14, 17] else 0
+        ds, ms, ys = SolarAndLunar.convertLunar2Solar(dl, ml, yl, isLeap)
+        return CanChi.ngay(ds, ms, ys).split()[1] == TotXau.VANG_VONG[ml]
+    
+    @staticmethod
+    def isNguyetKy(dl, ml, yl):
+        """
+        Check if a lunar date is a Nguyệt Kỵ day (considered inauspicious).
+
+        Args:
+            dl (int): Lunar day.
+            ml (int): Lunar month.
+            yl (int): Lunar year.
+
+        Returns:
+            bool: True if it is a Nguyệt Kỵ day, otherwise False.
+        """
+        return dl in TotXau.NGUYET_KY
+    
+    @staticmethod
+    def isDaiBai(dl, ml, yl):
+        """
+        Check if a lunar date is a Đại Bại day (considered inauspicious).
+
+        Args:
+            dl (int): Lunar day.
+            ml (int): Lunar month.
+            yl (int): Lunar year.
+
+        Returns:
+            bool: True if it is a Đại Bại day, otherwise False.
+        """
+        try:
+            isLeap = 1 if yl % 19 in [0, 3, 6, 9, 11, 14, 17] else 0
+            ds, ms, ys = SolarAndLunar.convertLunar2Solar(dl, ml, yl, isLeap)
+            canchi = CanChi.ngay(ds, ms, ys)
+            return canchi == TotXau.DAI_BAI[CanChi.nam(yl).split()[0]][ml]
+        except KeyError:
+            return False
+    
+    @staticmethod
+    def getCuuDieu(yl, gen):
+        """
+        Determine the Cửu Diệu star (Nine-Year Cycle Star) for a person
+        based on their lunar birth year and gen.
+
+        Args:
+            yl (int): Lunar birth year.
+            gen (str): gen identifier:
+                - 'm' for male (nam)
+                - 'f' for female (nữ)
+
+        Returns:
+            str | None: Name of the Cửu Diệu star for the current year.
+            Returns None if age < 10.
+        """
+        age = (datetime.now().year - yl) + 1
+        if age < 10:
+            return None
+        idx = age % 9
+        if idx == 0:
+            idx = 9
+        return TotXau.CUU_DIEU_NAM[idx - 1] if gen == 'm' else TotXau.CUU_DIEU_NU[idx - 1]
+            
+    @staticmethod
+    def getGioHoangDao(dl, ml, yl):
+        """
+        Determine the Hoàng Đạo (auspicious) hours for a given lunar date.
+
+        Args:
+            dl (int): Lunar day.
+            ml (int): Lunar month.
+            yl (int): Lunar year.
+
+        Returns:
+            tuple[str, ...] | None: A tuple of Earthly Branches representing auspicious hours (e.g. ('Tý', 'Sửu', 'Thìn', ...)).
+            Returns None if no matching rule is found.
+        """
+        isLeap = 1 if yl % 19 in [0, 3, 6, 9, 11, 14, 17] else 0
+        ds, ms, ys = SolarAndLunar.convertLunar2Solar(dl, ml, yl, isLeap)
+        chi = CanChi.ngay(ds, ms, ys).split()[1]
+        for k, v in TotXau.GIO_HOANG_DAO.items():
+            if chi in k:
+                return v
+            
+    @staticmethod
+    def getGioTimeline(d1, m1, y1, d2, m2, y2, onlyGood=False):
+        """
+        Return the Âm lịch hours of a range of days as a flat, time-ordered list of intervals.
+
+        Each day has 12 two-hour intervals. Its Tý hour starts at 23:00 of the previous day,
+        so the list runs from 23:00 the day before d1/m1/y1 to 23:00 on d2/m2/y2, without gaps.
+        The Stem-Branch and the Hoàng Đạo flag of an hour follow the day it belongs to
+        (as CanChi.gioIndex), and are read from per-day sexagenary indices, not from
+        lunar date conversions.
+
+        Args:
+            d1 (int): Day of the first Gregorian date.
+            m1 (int): Month of the first date.
+            y1 (int): Year of the first date.
+            d2 (int): Day of the last Gregorian date (inclusive).
+            m2 (int): Month of the last date.
+            y2 (int): Year of the last date.
+            onlyGood (bool, optional): True to keep only the Hoàng Đạo hours. Default is False.
+
+        Returns:
+            list[tuple[datetime, datetime, str, str, bool]]:
+                (start, end, Earthly Branch, hour Stem-Branch, True for a Hoàng Đạo hour).
+        """
+        names = [CanChi.fromIndex(i) for i in range(60)]
+        good = []
+        for b in CanChi.CHI:
+            hours = next(v for k, v in TotXau.GIO_HOANG_DAO.items() if b in k)
+            good.append([h in hours for h in CanChi.CHI])
+        offsets = [(timedelta(hours=2 * b - 1), timedelta(hours=2 * b + 1)) for b in range(12)]
+        res = []
+        for jdn in range(Date.convertDate2jdn(d1, m1, y1), Date.convertDate2jdn(d2, m2, y2) + 1):
+            midnight = datetime.combine(date.fromordinal(jdn - 1721425), datetime.min.time())
+            cc = (jdn + 49) % 60; flags = good[(jdn + 1) % 12]
+            for b in range(12):
+                if onlyGood and not flags[b]:
+                    continue
+                lo, hi = offsets[b]
+                res.append((midnight + lo, midnight + hi, CanChi.CHI[b], names[(12 * cc + b) % 60], flags[b]))
+        return res
+
+    @staticmethod
+    def getXung(d, m, y):
+        """
+        Get the list of conflicting (xung khắc) Can-Chi combinations for a given Gregorian date.
+
+        Args:
+            d (int): Gregorian day.
+            m (int): Gregorian month.
+            y (int): Gregorian year.
+
+        Returns:
+            list[str, str, str, str, str]:
+                A list of Can-Chi combinations considered conflicting
+                with the given date.
+                Returns an empty list if no mapping is found.
+        """
+        cch = CanChi.ngay(d, m, y)
+        return list(TotXau.XUNG.get(cch, []))
+
+    @staticmethod
+    def quyHoi(h):
+        """
+        Get the hour range (in 24-hour format) corresponding to a given Earthly Branch (Địa Chi) time.
+
+        Args:
+            h (str): Earthly Branch (e.g., 'Tý', 'Sửu', 'Dần', ...).
+
+        Returns:
+            tuple[int, int]: A tuple (start_hour, end_hour) representing the 24-hour range.
+            Returns None if no mapping is found.
+        """
+        return TotXau.QUY_HOI.get(h, None)
+    
+    @staticmethod
+    def gioAm(h):
+        """
+        Determine the Earthly Branch (Âm lịch hour) corresponding
+        to a given 24-hour clock hour.
+
+        Args:
+            h (int): Hour in 24-hour format (0–23).
+
+        Returns:
+            str | None: The corresponding Earthly Branch (e.g., 'Tý', 'Sửu', ...).
+            Returns None if the input hour is outside 0 - 23.
+        """
+        if not 0 <= h <= 23:
+            return None
+        for b, c in TotXau.QUY_HOI.items():
+            if c[0] < c[1] and c[0] <= h < c[1]:
+                return b
+            if c[0] > c[1] and (h >= c[0] or h < c[1]):
+                return b
+
+class TietKhi:
+    TERMS = {
+        'Lập Xuân': 315, 'Vũ Thủy': 330, 'Kinh Trập': 345,
+        'Xuân Phân': 0, 'Thanh Minh': 15, 'Cốc Vũ': 30,
+        'Lập Hạ': 45, 'Tiểu Mãn': 60, 'Mang Chủng': 75,
+        'Hạ Chí': 90, 'Tiểu Thử': 105, 'Đại Thử': 120,
+        'Lập Thu': 135, 'Xử Thử': 150, 'Bạch Lộ': 165,
+        'Thu Phân': 180, 'Hàn Lộ': 195, 'Sương Giáng': 210,
+        'Lập Đông': 225, 'Tiểu Tuyết': 240, 'Đại Tuyết': 255,
+        'Đông Chí': 270, 'Tiểu Hàn': 285, 'Đại Hàn': 300
+    }
+    
+    TERMS_LIST = [
+        ('Xuân Phân', 0), ('Thanh Minh', 15), ('Cốc Vũ', 30),
+        ('Lập Hạ', 45), ('Tiểu Mãn', 60), ('Mang Chủng', 75),
+        ('Hạ Chí', 90), ('Tiểu Thử', 105), ('Đại Thử', 120),
+        ('Lập Thu', 135), ('Xử Thử', 150), ('Bạch Lộ', 165),
+        ('Thu Phân', 180), ('Hàn Lộ', 195), ('Sương Giáng', 210),
+        ('Lập Đông', 225), ('Tiểu Tuyết', 240), ('Đại Tuyết', 255),
+        ('Đông Chí', 270), ('Tiểu Hàn', 285), ('Đại Hàn', 300),
+        ('Lập Xuân', 315), ('Vũ Thủy', 330), ('Kinh Trập', 345)
+    ]
+
+    _termTables = _Memo()
+    _shared = None
+    
+    @staticmethod
+    def jdate(d, m, y, h, mn, s, timeZone = 7.0):
+        """
+        Return the Julian Date (fractional) of a given date and time.
+
+        Args:
+            d (int): Day of the month.
+            m (int): Month of the year.
+            y (int): Year in Gregorian calendar.
+            h (int): Hour (0–23).
+            mn (int): Minute (0–59).
+            s (int): Second (0–59).
+            timeZone (float, optional): Time zone offset in hours. Default is 7.0.
+
+        Returns:
+            float: Julian Date as a floating-point number.
+        """
+        jdn = Date.convertDate2jdn(d, m, y)
+        return (jdn + (h - 12)/24 + mn/1440 + s/86400) - timeZone/24
+    
+    @staticmethod
+    def getSunLongitude(jd):
+        """
+        Return the true solar longitude (in degrees) for a given Julian Date.
+
+        This is the apparent longitude from Ephemeris.sunLongitude at the
+        selected precision tier.
+
+        Args:
+            jd (float): Julian Date.
+
+        Returns:
+            float: Solar longitude in degrees (0–360).
+        """
+        return Ephemeris.sunLongitude(jd)
+    
+    @staticmethod
+    def getDay(year, targetLong):
+        """
+        Find the date in a given year when the sun reaches a target solar longitude.
+
+        Args:
+            year (int): Gregorian year to search within.
+            targetLong (float): Target solar longitude in degrees (0–360).
+
+        Returns:
+            datetime | None: The date when the sun first reaches the target longitude,
+            or None if not found within the search window.
+        """
+        if targetLong >= 315 or targetLong < 45:
+            start = datetime(year, 1, 1)
+        elif targetLong < 135:
+            start = datetime(year, 4, 1)
+        elif targetLong < 225:
+            start = datetime(year, 7, 1)
+        else:
+            start = datetime(year, 10, 1)
+        
+        for i in range(120):
+            curr = start + timedelta(days=i)
+            next = curr + timedelta(days=1)
+            
+            jd1 = TietKhi.jdate(curr.day, curr.month, curr.year, 0, 0, 0)
+            jd2 = TietKhi.jdate(next.day, next.month, next.year, 0, 0, 0)
+            
+            sl1 = TietKhi.getSunLongitude(jd1)
+            sl2 = TietKhi.getSunLongitude(jd2)
+            
+            if sl1 <= targetLong <= sl2 or (sl1 > sl2 and (targetLong >= sl1 or targetLong <= sl2)):
+                return curr
+        
+        return None
+            
+    
+    @staticmethod
+    def getExactTime(day, targetLong):
+        """
+        Find the exact Julian Date within a given day when the sun reaches
+        a target solar longitude, using binary search.
+
+        Args:
+            day (datetime): The date to search within.
+            targetLong (float): Target solar longitude in degrees (0–360).
+
+        Returns:
+            float: Julian Date (fractional) of the exact moment.
+        """
+        js = TietKhi.jdate(day.day, day.month, day.year, 0, 0, 0)
+        je = TietKhi.jdate(day.day, day.month, day.year, 23, 59, 59)
+        
+        def normalize(angle):
+            return angle % 360
+        
+        def isBetween(start, end, target):
+            start = normalize(start)
+            end = normalize(end)
+            target = normalize(target)
+            
+            if start <= end:
+                return start <= target <= end
+            else:
+                return target >= start or target <= end
+        
+        for _ in range(100):
+            jm = (js + je) / 2
+            
+            sls = TietKhi.getSunLongitude(js)
+            sle = TietKhi.getSunLongitude(je)
+            slm = TietKhi.getSunLongitude(jm)
+            
+            if abs(slm - targetLong) < 0.001 or abs((slm - targetLong + 360) % 360) < 0.001:
+                return jm
+            
+            if isBetween(sls, slm, targetLong):
+                je = jm
+            else:
+                js = jm
+        
+        return (js + je) / 2
+    
+    @staticmethod
+    def getTermDate(termName, year):
+        """
+        Return the exact datetime when a solar term (Tiết Khí) begins in a given year.
+
+        Args:
+            termName (str): Name of the solar term in Vietnamese (e.g., 'Xuân Phân', 'Đông Chí').
+            year (int): Gregorian year.
+
+        Returns:
+            datetime | None: Datetime of the solar term's start in Vietnam time (UTC+7),
+            or None if the term name is not recognized or the date is not found.
+        """
+        if termName not in TietKhi.TERMS:
+            return None
+        
+        targetLong = TietKhi.TERMS[termName]
+        day = TietKhi.getDay(year, targetLong)
+        
+        if not day:
+            return None
+        
+        jdExact = TietKhi.getExactTime(day, targetLong)
+        jdUtc = jdExact + 7/24
+        
+        jdn = int(jdUtc + 0.5)
+        fraction = (jdUtc + 0.5) - jdn
+        
+        d, m, y = Date.convertjdn2Date(jdn)
+        
+        hours = fraction * 24
+        h = int(hours)
+        minutes = (hours - h) * 60
+        mn = int(minutes)
+        return datetime(y, m, d, h, mn)
+    
+    @staticmethod
+    def _termInYear(termName, year):
+        """
+        Return getTermDate of the term that starts within Gregorian year `year`.
+        getTermDate counts Tiểu Hàn and Đại Hàn with the previous Đông Chí, so for
+        those the January instant is the term of year - 1.
+        """
+        td = TietKhi.getTermDate(termName, year)
+        if td and td.year > year:
+            td = TietKhi.getTermDate(termName, year - 1)
+        return td
+
+    @staticmethod
+    def getTerm(d, m, y, timeZone=7.0):
+        """
+        Return the solar term (Tiết Khí) that a given Gregorian date belongs to.
+
+        Args:
+            d (int): Day of the month.
+            m (int): Month of the year.
+            y (int): Year in Gregorian calendar.
+            timeZone (float, optional): Time zone offset in hours. Default is 7.0.
+
+        Returns:
+            str | None: Name of the solar term in Vietnamese,
+            or None if no matching term is found.
+        """
+        jd = TietKhi.jdate(d, m, y, 23, 59, 59, timeZone)
+        sl = TietKhi.getSunLongitude(jd)
+        
+        for i in range(len(TietKhi.TERMS_LIST)):
+            name, long = TietKhi.TERMS_LIST[i]
+            nextLong = TietKhi.TERMS_LIST[(i + 1) % len(TietKhi.TERMS_LIST)][1]
+            
+            if long < nextLong:
+                if long <= sl < nextLong:
+                    return name
+            else:
+                if sl >= long or sl < nextLong:
+                    return name
+        return None
+
+    @staticmethod
+    def getTermGuarded(d, m, y, timeZone=7.0):
+        """
+        Return the same solar term as getTerm, from the mean longitude and the
+        main equation-of-center term, calling the full series only within
+        SolarAndLunar.sunGuard(T) degrees of a term boundary, or outside
+        SolarAndLunar.GUARDED_RANGE.
+
+        Args:
+            d (int): Day of the month.
+            m (int): Month of the year.
+            y (int): Year in Gregorian calendar.
+            timeZone (float, optional): Time zone offset in hours. Default is 7.0.
+
+        Returns:
+            str: Name of the solar term in Vietnamese.
+        """
+        jd = TietKhi.jdate(d, m, y, 23, 59, 59, timeZone)
+        T = (jd - 2451545) / 36525
+        lam = 280.46645 + 36000.76983*T + 1.9146*math.sin(math.radians(357.52910 + 35999.05030*T))
+        lam -= 360 * math.floor(lam / 360)
+        lo, hi = SolarAndLunar.GUARDED_RANGE
+        if lo <= jd < hi and abs((lam + 7.5) % 15 - 7.5) > SolarAndLunar.sunGuard(T):
+            return TietKhi.TERMS_LIST[int(lam // 15) % 24][0]
+        return TietKhi.getTerm(d, m, y, timeZone)
+    
+    @staticmethod
+    def getAllTerms(y):
+        """
+        Return the start datetime of all 24 solar terms (Tiết Khí) for a given year.
+
+        Args:
+            y (int): Gregorian year.
+
+        Returns:
+            dict[str, str]: A dictionary mapping each solar term name (in Vietnamese)
+            to a formatted string describing its start date, time, and Earthly Branch hour.
+        """
+        a = list(TietKhi.TERMS.keys())
+        res = dict()
+        for i in a:
+            b = TietKhi.getTermDate(i, y)
+            h = TotXau.gioAm(b.hour)
+            res[i] = f"Ngày {b.day:02d}/{b.month:02d}/{b.year}, vào {b.hour:02d}:{b.minute:02d}:{b.second:02d} (giờ {h})"
+        return res
+    
+    @staticmethod
+    def getDayTermIndex(jdn, timeZone=7.0):
+        """
+        Return the index in TERMS_LIST of the solar term a day belongs to.
+
+        Uses the same end-of-day instant as getTerm, so
+        TERMS_LIST[getDayTermIndex(jdn)][0] == getTerm(d, m, y).
+
+        Args:
+            jdn (int): Julian Day Number.
+            timeZone (float, optional): Time zone offset in hours. Default is 7.0.
+
+        Returns:
+            int: Index (0–23) into TERMS_LIST.
+        """
+        jd = (jdn + (23 - 12)/24 + 59/1440 + 59/86400) - timeZone/24
+        return int(TietKhi.getSunLongitude(jd) // 15) % 24
+
+    @staticmethod
+    def getTermTable(y, timeZone=7.0):
+        """
+        Return the memoized table of solar term start days in a Gregorian year.
+
+        The table is built once per year with a weekly scan and a short
+        bisection inside each week that contains a term change.
+
+        Args:
+            y (int): Gregorian year.
+            timeZone (float, optional): Time zone offset in hours. Default is 7.0.
+
+        Returns:
+            tuple[tuple[int, ...], tuple[int, ...]]: (days, terms) where days[0] is 31/12 of
+            the previous year and every later entry is the JDN on which the
+            term terms[i] (index into TERMS_LIST) starts.
+        """
+        return TietKhi._termTables.get((y, timeZone, Ephemeris.getTier()), TietKhi._buildTermTable, y, timeZone)
+
+    @staticmethod
+    def _buildTermTable(y, timeZone):
+        shared = TietKhi._shared
+        table = shared.termTable(y, timeZone, Ephemeris.getTier()) if shared is not None else None
+        if table is not None:
+            return table
+        idx = TietKhi.getDayTermIndex
+        lo = Date.convertDate2jdn(1, 1, y) - 1; last = Date.convertDate2jdn(31, 12, y)
+        days = [lo]; terms = [idx(lo, timeZone)]
+        cur = terms[0]
+        while lo < last:
+            hi = min(lo + 7, last)
+            t = idx(hi, timeZone)
+            if t != cur:
+                a, b = lo, hi
+                while b - a > 1:
+                    mid = (a + b) // 2
+                    if idx(mid, timeZone) == cur:
+                        a = mid
+                    else:
+                        b = mid
+                days.append(b); terms.append(t)
+                cur = t; lo = b
+            else:
+                lo = hi
+        return tuple(days), tuple(terms)
+
+    @staticmethod
+    def getTermAt(jdn, timeZone=7.0):
+        """
+        Return the solar term of a day and whether the term starts on it,
+        using the memoized term table of its year.
+
+        Args:
+            jdn (int): Julian Day Number.
+            timeZone (float, optional): Time zone offset in hours. Default is 7.0.
+
+        Returns:
+            tuple[int, bool]: (index into TERMS_LIST, True if the term starts that day).
+        """
+        days, terms = TietKhi.getTermTable(Date.convertjdn2Date(jdn)[2], timeZone)
+        i = bisect_right(days, jdn) - 1
+        return terms[i], i > 0 and days[i] == jdn
+
+
+class FourPillars:
+    """
+    Four Pillars (Tứ Trụ / Bát Tự): the Stem-Branch of the year, month, day and hour of a moment.
+
+    The pillar year starts at the exact moment of Lập Xuân and the month at each Tiết
+    (Lập Xuân opens the Dần month, Kinh Trập the Mão month, ..., Tiểu Hàn the Sửu month),
+    taken from TietKhi.getTermDate. The month stem follows the year stem (Giáp and Kỷ
+    years start with Bính Dần). The day and hour change at 23:00, the start of the Tý
+    hour, as in CanChi.gioIndex.
+    """
+    TIET = ('Lập Xuân', 'Kinh Trập', 'Thanh Minh', 'Lập Hạ', 'Mang Chủng', 'Tiểu Thử',
+            'Lập Thu', 'Bạch Lộ', 'Hàn Lộ', 'Lập Đông', 'Đại Tuyết', 'Tiểu Hàn')
+    _CANCHI = tuple(CanChi.fromIndex(i) for i in range(60))
+    _EPOCH = 2440588
+    _bounds = _Memo()
+
+    @staticmethod
+    def _buildBounds(y, timeZone):
+        """
+        Return the start of each month of TIET in pillar year y, in local seconds
+        since 1970-01-01 (getTermDate gives UTC+7 wall time).
+        """
+        epoch = datetime(1970, 1, 1)
+        return tuple((TietKhi.getTermDate(name, y) - epoch).total_seconds() + (timeZone - 7) * 3600
+                     for name in FourPillars.TIET)
+
+    @staticmethod
+    def getBounds(y, timeZone=7.0):
+        """
+        Return the memoized month starts of a pillar year (see _buildBounds).
+        """
+        return FourPillars._bounds.get((y, timeZone, Ephemeris.getTier()), FourPillars._buildBounds, y, timeZone)
+
+    @staticmethod
+    def _local(t, timeZone):
+        """
+        Return (local seconds since 1970-01-01, has a time of day) of a POSIX timestamp,
+        datetime, date or numpy.datetime64. Naive datetimes and datetime64 values are
+        taken as local wall time, datetime64 days (unit D or coarser) as dates.
+        """
+        dtype = getattr(t, 'dtype', None)
+        if dtype is not None and dtype.kind == 'M':
+            if t != t:
+                return math.nan, True
+            return int(t.astype('datetime64[us]').astype('int64')) / 1e6, dtype.str[4:-1] not in ('Y', 'M', 'W', 'D')
+        if isinstance(t, datetime):
+            if t.tzinfo is None:
+                return (t - datetime(1970, 1, 1)).total_seconds(), True
+            return t.timestamp() + timeZone * 3600, True
+        if isinstance(t, date):
+            return (t.toordinal() - 719163) * 86400.0, False
+        return float(t) + timeZone * 3600, True
+
+    @staticmethod
+    def get(t, timeZone=7.0):
+        """
+        Return the Four Pillars of a moment.
+
+        Args:
+            t (datetime | date | numpy.datetime64 | float): Aware or naive (local) datetime, date,
+                naive datetime64 or POSIX timestamp. A date (or datetime64 with unit D) has no hour
+                pillar and the other pillars are taken at 00:00.
+            timeZone (float, optional): Time zone offset in hours. Default is 7.0.
+
+        Returns:
+            tuple[str, str, str, str | None]: Stem-Branch of the year, month, day and hour.
+        """
+        return FourPillars.getMany([t], timeZone)[0]
+
+    @staticmethod
+    def getIndexes(t, timeZone=7.0):
+        """
+        Return the sexagenary indexes (see CanChi.toIndex) of the Four Pillars of a moment.
+        """
+        return FourPillars.getMany([t], timeZone, asIndex=True)[0]
+
+    @staticmethod
+    def getMany(values, timeZone=7.0, asIndex=False):
+        """
+        Return the Four Pillars of many moments (e.g. the birth times of a user table).
+
+        Month starts are memoized per pillar year and the Gregorian year of the last
+        item is kept, so each item costs a bisect and integer arithmetic.
+
+        Args:
+            values (iterable): Datetimes, dates, datetime64 values or POSIX timestamps, as
+                accepted by get (a list, a numpy datetime64 array, a pandas Series or its .values).
+                None or NaN / NaT items give None.
+            timeZone (float, optional): Time zone offset in hours. Default is 7.0.
+            asIndex (bool, optional): True to return sexagenary indexes instead of names.
+
+        Returns:
+            list[tuple | None]: (year, month, day, hour) per item.
+        """
+        names = None if asIndex else FourPillars._CANCHI
+        res = []
+        lo = hi = 0; y = None
+        for t in values:
+            if t is None:
+                res.append(None); continue
+            local, timed = FourPillars._local(t, timeZone)
+            if local != local:
+                res.append(None); continue
+            day = math.floor(local / 86400)
+            jdn = FourPillars._EPOCH + day
+            if not lo <= jdn < hi:
+                y = Date.convertjdn2Date(jdn)[2]
+                lo = Date.convertDate2jdn(1, 1, y); hi = Date.convertDate2jdn(1, 1, y + 1)
+            bounds = FourPillars.getBounds(y, timeZone)
+            py = y
+            if local < bounds[0]:
+                py = y - 1; bounds = FourPillars.getBounds(py, timeZone)
+            branch = (bisect_right(bounds, local) + 1) % 12
+            yc = (py - 4) % 60
+            mc = (yc % 5 * 2 + 2 + (branch - 2) % 12) % 10
+            h = int((local - day * 86400) // 3600)
+            pillars = (yc, mc + 10 * ((5 * (branch - mc) // 2) % 6),
+                       (jdn + (timed and h == 23) + 49) % 60, CanChi.gioIndex(jdn, h) if timed else None)
+            res.append(pillars if names is None else tuple(None if i is None else names[i] for i in pillars))
+        return res
+
+class Stars:
+    """
+    Daily good and bad stars (Cát tinh / Hung tinh) of the almanac.
+
+    Every rule gives, for each lunar month 1–12, the Heavenly Stem or
+    Earthly Branch of the days the star falls on. The rules are compiled
+    once into a table indexed by (lunar month, sexagenary day index), so a
+    lookup is one list access. Leap months use the rules of their month number.
+    """
+    TOT = 'Sao tốt'
+    XAU = 'Sao xấu'
+    RULES = [
+        ('Thiên Đức', TOT, ['Đinh', 'Thân', 'Nhâm', 'Tân', 'Hợi', 'Giáp', 'Qúy', 'Dần', 'Bính', 'Ất', 'Tị', 'Canh']),
+        ('Thiên Đức Hợp', TOT, ['Nhâm', 'Tị', 'Đinh', 'Bính', 'Dần', 'Kỷ', 'Mậu', 'Hợi', 'Tân', 'Canh', 'Thân', 'Ất']),
+        ('Nguyệt Đức', TOT, ['Bính', 'Giáp', 'Nhâm', 'Canh'] * 3),
+        ('Nguyệt Đức Hợp', TOT, ['Tân', 'Kỷ', 'Đinh', 'Ất'] * 3),
+        ('Nguyệt Không', TOT, ['Nhâm', 'Canh', 'Bính', 'Giáp'] * 3),
+        ('Thiên Hỷ', TOT, ['Tuất', 'Hợi', 'Tý', 'Sửu', 'Dần', 'Mão', 'Thìn', 'Tị', 'Ngọ', 'Mùi', 'Thân', 'Dậu']),
+        ('Thiên Phú', TOT, ['Thìn', 'Tị', 'Ngọ', 'Mùi', 'Thân', 'Dậu', 'Tuất', 'Hợi', 'Tý', 'Sửu', 'Dần', 'Mão']),
+        ('Sinh Khí', TOT, ['Tý', 'Sửu', 'Dần', 'Mão', 'Thìn', 'Tị', 'Ngọ', 'Mùi', 'Thân', 'Dậu', 'Tuất', 'Hợi']),
+        ('Ngũ Phú', TOT, ['Hợi', 'Dần', 'Tị', 'Thân'] * 3),
+        ('Thiên Mã', TOT, ['Ngọ', 'Thân', 'Tuất', 'Tý', 'Dần', 'Thìn'] * 2),
+        ('Dịch Mã', TOT, ['Thân', 'Tị', 'Dần', 'Hợi'] * 3),
+        ('Giải Thần', TOT, ['Thân', 'Thân', 'Tuất', 'Tuất', 'Tý', 'Tý', 'Dần', 'Dần', 'Thìn', 'Thìn', 'Ngọ', 'Ngọ']),
+        ('Thiên Cương', XAU, ['Tị', 'Tý', 'Mùi', 'Dần', 'Dậu', 'Thìn', 'Hợi', 'Ngọ', 'Sửu', 'Thân', 'Mão', 'Tuất']),
+        ('Hà Khôi', XAU, ['Hợi', 'Ngọ', 'Sửu', 'Thân', 'Mão', 'Tuất', 'Tị', 'Tý', 'Mùi', 'Dần', 'Dậu', 'Thìn']),
+        ('Thiên Lại', XAU, ['Dậu', 'Ngọ', 'Mão', 'Tý'] * 3),
+        ('Địa Phá', XAU, ['Hợi', 'Tý', 'Sửu', 'Dần', 'Mão', 'Thìn', 'Tị', 'Ngọ', 'Mùi', 'Thân', 'Dậu', 'Tuất']),
+        ('Thiên Hỏa', XAU, ['Tý', 'Mão', 'Ngọ', 'Dậu'] * 3),
+        ('Nguyệt Sát', XAU, ['Sửu', 'Tuất', 'Mùi', 'Thìn'] * 3),
+        ('Kiếp Sát', XAU, ['Hợi', 'Thân', 'Tị', 'Dần'] * 3),
+        ('Tai Sát', XAU, ['Tý', 'Dậu', 'Ngọ', 'Mão'] * 3),
+        ('Nguyệt Yếm', XAU, ['Tuất', 'Dậu', 'Thân', 'Mùi', 'Ngọ', 'Tị', 'Thìn', 'Mão', 'Dần', 'Sửu', 'Tý', 'Hợi']),
+        ('Nguyệt Hình', XAU, ['Tị', 'Tý', 'Thìn', 'Thân', 'Ngọ', 'Sửu', 'Dần', 'Dậu', 'Mùi', 'Hợi', 'Mão', 'Tuất']),
+        ('Cửu Không', XAU, ['Thìn', 'Sửu', 'Tuất', 'Mùi'] * 3),
+        ('Trùng Tang', XAU, ['Giáp', 'Ất', 'Mậu', 'Bính', 'Đinh', 'Kỷ', 'Canh', 'Tân', 'Mậu', 'Nhâm', 'Qúy', 'Kỷ']),
+        ('Trùng Phục', XAU, ['Canh', 'Tân', 'Kỷ', 'Nhâm', 'Qúy', 'Mậu', 'Giáp', 'Ất', 'Kỷ', 'Bính', 'Đinh', 'Mậu']),
+    ]
+    _tables = _Memo()
+
+    @staticmethod
+    def _compile():
+        """
+        Return table[ml - 1][cc] = (good star names, bad star names) for every lunar month
+        and sexagenary day index.
+        """
+        table = []
+        for ml in range(12):
+            row = []
+            for cc in range(60):
+                can, chi = CanChi.CAN[cc % 10], CanChi.CHI[cc % 12]
+                hit = [(name, kind) for name, kind, days in Stars.RULES if days[ml] in (can, chi)]
+                row.append((tuple(n for n, k in hit if k == Stars.TOT), tuple(n for n, k in hit if k == Stars.XAU)))
+            table.append(tuple(row))
+        return tuple(table)
+
+    @staticmethod
+    def lookup(ml, cc):
+        """
+        Return the stars of a day from its lunar month and sexagenary index.
+
+        Args:
+            ml (int): Lunar month (1–12).
+            cc (int): Sexagenary index of the day (CanChi.ngayIndex or CanChi.toIndex).
+
+        Returns:
+            tuple[tuple[str, ...], tuple[str, ...]]: (good stars, bad stars), in RULES order.
+        """
+        return Stars._tables.get('rules', Stars._compile)[ml - 1][cc % 60]
+
+    @staticmethod
+    def getDay(d, m, y, timeZone=7.0):
+        """
+        Return the good and bad stars of a Gregorian date.
+
+        Args:
+            d (int): Day of the month.
+            m (int): Month of the year.
+            y (int): Year in Gregorian calendar.
+            timeZone (float, optional): Time zone offset in hours. Default is 7.0.
+
+        Returns:
+            tuple[tuple[str, ...], tuple[str, ...]]: (good stars, bad stars).
+        """
+        jdn = Date.convertDate2jdn(d, m, y)
+        ml = LunarYear.containing(jdn, timeZone).locate(jdn)[1]
+        return Stars.lookup(ml, CanChi.ngayIndex(jdn))
+
+    @staticmethod
+    def getRange(d1, m1, y1, d2, m2, y2, timeZone=7.0):
+        """
+        Return the good and bad stars of every day of a Gregorian date range.
+
+        Args:
+            d1 (int): Day of the first date.
+            m1 (int): Month of the first date.
+            y1 (int): Year of the first date.
+            d2 (int): Day of the last date (inclusive).
+            m2 (int): Month of the last date.
+            y2 (int): Year of the last date.
+            timeZone (float, optional): Time zone offset in hours. Default is 7.0.
+
+        Returns:
+            list[tuple[tuple[int, int, int], tuple[str, ...], tuple[str, ...]]]:
+            ((day, month, year), good stars, bad stars) per day.
+        """
+        table = Stars._tables.get('rules', Stars._compile)
+        first = Date.convertDate2jdn(d1, m1, y1); last = Date.convertDate2jdn(d2, m2, y2)
+        res = []
+        if last < first:
+            return res
+        ly = LunarYear.containing(first, timeZone)
+        k = bisect_right(ly.starts, first) - 1
+        for jdn in range(first, last + 1):
+            if k + 1 < len(ly.starts) and jdn >= ly.starts[k + 1]:
+                k += 1
+            elif jdn >= ly.end:
+                ly = LunarYear.get(ly.year + 1, timeZone); k = 0
+            good, bad = table[ly.months[k][0] - 1][(jdn + 49) % 60]
+            res.append((Date.convertjdn2Date(jdn), good, bad))
+        return res
+
+class VanSu:
+    SAO = [
+        "Giác", "Cang", "Đê", "Phòng", "Tâm", "Vĩ", "Cơ",
+        "Đẩu", "Ngưu", "Nữ", "Hư", "Nguy", "Thất", "Bích",
+        "Khuê", "Lâu", "Vị", "Mão", "Tất", "Chủy", "Sâm",
+        "Tỉnh", "Quỷ", "Liễu", "Tinh", "Trương", "Dực", "Chẩn"
+    ]
+    TRUC = ['Kiến', 'Trừ', 'Mãn', 'Bình', 'Định', 'Chấp', 'Phá', 'Nguy', 'Thành', 'Thu', 'Khai', 'Bế']
+
+    @staticmethod
+    def getTrucIndex(jdn, timeZone=7.0):
+        """
+        Return the index in TRUC of the 12 Trực governing a day.
+
+        The solar-term month starts with each Tiết (Lập Xuân opens the Dần month,
+        Kinh Trập the Mão month, ...), and Kiến falls on the day whose branch is the
+        month branch. The Trực of the day a Tiết starts repeats the previous day's.
+
+        Args:
+            jdn (int): Julian Day Number.
+            timeZone (float, optional): Time zone offset in hours. Default is 7.0.
+
+        Returns:
+            int: Index 0–11 (0 = Kiến, 11 = Bế).
+        """
+        t = TietKhi.getTermAt(jdn, timeZone)[0]
+        return ((jdn + 1) - (2 + (t - 21) % 24 // 2)) % 12
+
+    @staticmethod
+    def getTruc(d, m, y, timeZone=7.0):
+        """
+        Return the name of the 12 Trực governing a Gregorian date (see getTrucIndex).
+        """
+        return VanSu.TRUC[VanSu.getTrucIndex(Date.convertDate2jdn(d, m, y), timeZone)]
+
+    @staticmethod
+    def getTrucRange(d1, m1, y1, d2, m2, y2, timeZone=7.0):
+        """
+        Return the 12 Trực of every day of a Gregorian date range.
+
+        The month branch changes only on term-table boundaries, so each day costs
+        one comparison and one subtraction.
+
+        Args:
+            d1 (int): Day of the first date.
+            m1 (int): Month of the first date.
+            y1 (int): Year of the first date.
+            d2 (int): Day of the last date (inclusive).
+            m2 (int): Month of the last date.
+            y2 (int): Year of the last date.
+            timeZone (float, optional): Time zone offset in hours. Default is 7.0.
+
+        Returns:
+            list[tuple[tuple[int, int, int], str]]: ((day, month, year), Trực name) per day.
+        """
+        first = Date.convertDate2jdn(d1, m1, y1); last = Date.convertDate2jdn(d2, m2, y2)
+        res = []; end = first
+        for jdn in range(first, last + 1):
+            if jdn >= end:
+                y = Date.convertjdn2Date(jdn)[2]
+                days, terms = TietKhi.getTermTable(y, timeZone)
+                i = bisect_right(days, jdn) - 1
+                end = days[i + 1] if i + 1 < len(days) else Date.convertDate2jdn(1, 1, y + 1)
+                month = 2 + (terms[i] - 21) % 24 // 2
+            res.append((Date.convertjdn2Date(jdn), VanSu.TRUC[(jdn + 1 - month) % 12]))
+        return res
+
+    @staticmethod
+    def getSao(d, m, y):
         """
         Return the name of the 28 lunar mansion star (Nhị Thập Bát Tú)
         corresponding to a given Gregorian date.
 
         Args:
-            d (int): Day of the month.
-            m (int): Month of the year.
-            y (int): Year in Gregorian calendar.
+            d (int): Day of the month.
+            m (int): Month of the year.
+            y (int): Year in Gregorian calendar.
+
+        Returns:
+            str: Name of the lunar mansion star in Vietnamese.
+        """
+        return VanSu.SAO[(Date.convertDate2jdn(d, m, y) + 11) % 28]
+
+    @staticmethod
+    def getHanh(cch):
+        """
+        Return the Five Element (Ngũ Hành) associated with a given Stem-Branch combination.
+
+        Args:
+            cch (str): Stem-Branch combination in Vietnamese (e.g., 'Giáp Tý', 'Bính Dần').
+
+        Returns:
+            str | None: One of 'Kim', 'Hỏa', 'Mộc', 'Thổ', 'Thủy',
+            or None if the combination is not recognized.
+        """
+        if cch in ['Giáp Tý', 'Ất Sửu', 'Nhâm Thân', 'Qúy Dậu', 'Canh Thìn', 'Tân Tị',
+                 'Giáp Ngọ', 'Ất Mùi', 'Nhâm Dần', 'Qúy Mão', 'Canh Tuất', 'Tân Hợi']:
+            return 'Kim'
+        elif cch in ['Bính Dần', 'Đinh Mão', 'Giáp Tuất', 'Ất Hợi', 'Mậu Tý', 'Ký Sửu',
+                   'Bính Thân', 'Đinh Dậu', 'Giáp Thìn', 'Ất Tị', 'Mậu Ngọ', 'Kỷ Mùi']:
+            return 'Hỏa'
+        elif cch in ['Mậu Thìn', 'Kỷ Tị', 'Nhâm Ngọ', 'Qúy Mùi', 'Canh Dần', 'Tân Mão',
+                   'Mậu Tuất', 'Kỷ Hợi', 'Nhâm Tý', 'Qủy Sửu', 'Canh Thân', 'Tân Dậu']:
+            return 'Mộc'
+        elif cch in ['Canh Ngọ', 'Tân Mùi', 'Mậu Dần', 'Kỷ Mão', 'Bính Tuất', 'Đinh Hợi',
+                   'Canh Tý', 'Tân Sửu', 'Mậu Thân', 'Kỷ Dậu', 'Bính Thìn', 'Đinh Tị']:
+            return 'Thổ'
+        elif cch in ['Bính Tý', 'Đinh Sửu', 'Giáp Thân', 'Ất Dậu', 'Nhâm Thìn', 'Qúy Tị',
+                   'Bính Ngọ', 'Đinh Mùi', 'Giáp Dần', 'Ất Mão', 'Nhâm Tuất', 'Qúy Hợi']:
+            return 'Thủy'
+    
+    @staticmethod
+    def get28_Hanh(d, m, y):
+        """
+        Return the Five Element (Ngũ Hành) and 28 lunar mansion star (Nhị Thập Bát Tú)
+        for a given Gregorian date.
+
+        Args:
+            d (int): Day of the month.
+            m (int): Month of the year.
+            y (int): Year in Gregorian calendar.
+
+        Returns:
+            dict: A dictionary with keys:
+                - 'hành' (str): The Five Element of the day's Stem-Branch.
+                - 'sao' (str): The 28 lunar mansion star name in Vietnamese.
+        """
+        a = CanChi.ngay(d, m, y)
+        return {
+            'hành': VanSu.getHanh(a),
+            'sao': VanSu.getSao(d, m, y),
+        }
+        
+    @staticmethod
+    def getInfo(d, m, y, SorL):
+        """
+        Return a formatted almanac summary string for a given date.
+
+        The summary includes weekday, lunar date, Can-Chi (Stem-Branch) for day/month/year,
+        Five Element, 28 lunar mansion star, Hoàng Đạo / Hắc Đạo, inauspicious day flags,
+        auspicious hours, conflicting ages, and solar term information.
+
+        Args:
+            d (int): Day of the date.
+            m (int): Month of the date.
+            y (int): Year of the date.
+            SorL (str): Calendar type:
+                - 's' if the input date is in the Gregorian (solar) calendar.
+                - 'l' if the input date is in the Lunar calendar.
+
+        Returns:
+            str: A multi-line formatted string containing the full almanac information.
+        """
+        if SorL == 's':
+            thu = Date.dayWeek(d, m, y)
+            dl, ml, yl, isLeap = SolarAndLunar.convertSolar2Lunar(d, m, y)
+            ccng = CanChi.ngay(d, m, y); canng = ccng.split()[1]
+            ccth = CanChi.thang(ml, yl)
+            ccnm = CanChi.nam(yl)
+            hanh = VanSu.get28_Hanh(d, m, y)['hành']; sao = VanSu.get28_Hanh(d, m, y)['sao']
+            hodhad = TotXau.getHoangHacDao(canng, ml)
+            tamnuong, nguyetpha, satchu, thotu, vangvong, nguyetky, daibai = TotXau.isTamNuong(dl,ml,yl), TotXau.isNguyetPha(dl,ml,yl), TotXau.isSatChu(dl,ml,yl), TotXau.isThoTu(dl,ml,yl), TotXau.isVangVong(dl,ml,yl), TotXau.isNguyetKy(dl,ml,yl), TotXau.isDaiBai(dl,ml,yl)
+            ghd = TotXau.getGioHoangDao(dl, ml, yl)
+            tx = TotXau.getXung(d, m, y)
+            gd = []; tiet = TietKhi.getTerm(d, m, y)
+            for i in range(len(ghd)):
+                sth = TotXau.quyHoi(ghd[i])
+                b = ''
+                b += ghd[i]
+                b += (f' ({sth[0]}h - {sth[1]}h)')
+                gd.append(b)
+            
+            labels = [
+                ('Tam Nương', tamnuong),
+                ('Nguyệt Phá', nguyetpha),
+                ('Sát Chủ', satchu),
+                ('Thọ Tử', thotu),
+                ('Vãng Vong', vangvong),
+                ('Nguyệt Kỵ', nguyetky),
+                ('Đại Bại', daibai)
+            ]
+            a = ' - '.join(name for name, ok in labels if ok)
+            inf = (
+                f'{d}/{m}/{y}\t{thu.upper()}\tNgày {dl}/{ml}/{yl} ÂL\n'
+                f'Ngày {ccng} - Tháng {ccth} - Năm {ccnm}\n'
+                f'Hành {hanh} - Sao {sao}\n'
+                f'{" ".join(hodhad)}\n'
+                f'{a}\n'
+                f'- Giờ tốt: {", ".join(gd)}\n'
+                f'- Tuổi xung: {", ".join(tx)}\n'
+            )
+            td = TietKhi._termInYear(tiet, y)
+            if td and td.day == d and td.month == m:
+                gio = TotXau.gioAm(td.hour)
+                return inf + f'- BẮT ĐẦU TIẾT: {tiet} lúc {td.hour:02}h{td.minute:02} (giờ {gio})'
+            else:
+                return inf + f'- Thuộc tiết {tiet}.'
+
+        elif SorL == 'l':
+            dl, ml, yl = d, m, y
+            isLeap = 1 if yl % 19 in [0, 3, 6, 9, 11, 14, 17] else 0
+            ds, ms, ys = SolarAndLunar.convertLunar2Solar(dl, ml, yl, isLeap)
+            thu = Date.dayWeek(ds, ms, ys)
+            ccng = CanChi.ngay(ds, ms, ys); ccth = CanChi.thang(ml, yl); ccnm = CanChi.nam(yl); canng = ccng.split()[1]
+            hanh = VanSu.get28_Hanh(ds, ms, ys)['hành']; sao = VanSu.get28_Hanh(ds, ms, ys)['sao']
+            hodhad = TotXau.getHoangHacDao(canng, ml)
+            tamnuong, nguyetpha, satchu, thotu, vangvong, nguyetky, daibai = TotXau.isTamNuong(dl,ml,yl), TotXau.isNguyetPha(dl,ml,yl), TotXau.isSatChu(dl,ml,yl), TotXau.isThoTu(dl,ml,yl), TotXau.isVangVong(dl,ml,yl), TotXau.isNguyetKy(dl,ml,yl), TotXau.isDaiBai(dl,ml,yl)
+            ghd = TotXau.getGioHoangDao(dl, ml, yl)
+            tx = TotXau.getXung(ds, ms, ys)
+            gd = []; tiet = TietKhi.getTerm(ds, ms, ys)
+            for i in range(len(ghd)):
+                sth = TotXau.quyHoi(ghd[i])
+                b = ''
+                b += ghd[i]
+                b += (f' ({sth[0]}h - {sth[1]}h)')
+                gd.append(b)
+            
+            labels = [
+                ('Tam Nương', tamnuong),
+                ('Nguyệt Phá', nguyetpha),
+                ('Sát Chủ', satchu),
+                ('Thọ Tử', thotu),
+                ('Vãng Vong', vangvong),
+                ('Nguyệt Kỵ', nguyetky),
+                ('Đại Bại', daibai)
+            ]
+            a = ' - '.join(name for name, ok in labels if ok)
+            inf = (
+                f'{ds}/{ms}/{ys}\t{thu.upper()}\tNgày {dl}/{ml}/{yl} ÂL\n'
+                f'Ngày {ccng} - Tháng {ccth} - Năm {ccnm}\n'
+                f'Hành {hanh} - Sao {sao}\n'
+                f'{" ".join(hodhad)}\n'
+                f'{a}\n'
+                f'- Giờ tốt: {", ".join(gd)}\n'
+                f'- Tuổi xung: {", ".join(tx)}\n'
+            )
+            td = TietKhi._termInYear(tiet, ys)
+            if td and td.day == ds and td.month == ms:
+                gio = TotXau.gioAm(td.hour)
+                return inf + f'- BẮT ĐẦU TIẾT: {tiet} lúc {td.hour:02}h{td.minute:02} (giờ {gio})'
+            else:
+                return inf + f'- Thuộc tiết {tiet}.'
+
+    @staticmethod
+    def monthView(m, y, firstWeekday=0, timeZone=7.0):
+        """
+        Return the 42 cells (6 weeks × 7 days) of a month grid for calendar UIs.
+
+        The lunar months and solar terms of the whole grid are resolved once
+        through LunarYear and TietKhi.getTermTable, every cell afterwards is
+        plain integer arithmetic.
+
+        Args:
+            m (int): Month of the year.
+            y (int): Year in Gregorian calendar.
+            firstWeekday (int, optional): First column of the grid,
+                0 = Monday ... 6 = Sunday. Default is 0.
+            timeZone (float, optional): Time zone offset in hours. Default is 7.0.
+
+        Returns:
+            list[dict]: 42 cells in row-major order, each with keys:
+                - 'date' (tuple[int, int, int]): (day, month, year) in the Gregorian calendar.
+                - 'inMonth' (bool): True if the cell belongs to month m.
+                - 'lunar' (tuple[int, int, int, int]): (lunar_day, lunar_month, lunar_year, is_leap_month).
+                - 'hoangDao' (tuple[str, str]): Star name and 'Hoàng Đạo' / 'Hắc Đạo'.
+                - 'tiet' (str | None): Name of the solar term starting that day, otherwise None.
+        """
+        first = Date.convertDate2jdn(1, m, y)
+        start = first - (first - firstWeekday) % 7
+        ly = LunarYear.containing(start, timeZone)
+        i = bisect_right(ly.starts, start) - 1
+        termStarts = {}
+        for yy in {Date.convertjdn2Date(start)[2], Date.convertjdn2Date(start + 41)[2]}:
+            days, terms = TietKhi.getTermTable(yy, timeZone)
+            termStarts.update(zip(days[1:], terms[1:]))
+        cells = []
+        for jdn in range(start, start + 42):
+            if i + 1 < len(ly.starts) and jdn >= ly.starts[i + 1]:
+                i += 1
+            elif jdn >= ly.end:
+                ly = LunarYear.get(ly.year + 1, timeZone); i = 0
+            ml, leap = ly.months[i]
+            dd, mm, yy = Date.convertjdn2Date(jdn)
+            cells.append({
+                'date': (dd, mm, yy),
+                'inMonth': mm == m,
+                'lunar': (jdn - ly.starts[i] + 1, ml, ly.year, leap),
+                'hoangDao': tuple(TotXau.HOANG_HAC_DAO[TotXau.getHoangHacDaoIndex((jdn + 1) % 12, ml)]),
+                'tiet': TietKhi.TERMS_LIST[termStarts[jdn]][0] if jdn in termStarts else None,
+            })
+        return cells
+
+class DaySet:
+    __slots__ = ('index', 'bits')
+
+    def __init__(self, index, bits):
+        """
+        A set of days of a DayIndex, packed as one bit per day (bit i = day index.start + i).
+        Supports &, |, ^, - and ~ (complement within the index range).
+
+        Args:
+            index (DayIndex): The index the days belong to.
+            bits (int): Packed bitset.
+        """
+        self.index = index
+        self.bits = bits
+
+    def _other(self, other):
+        if not isinstance(other, DaySet) or other.index is not self.index:
+            raise ValueError('DaySet operands must come from the same DayIndex')
+        return other.bits
+
+    def __and__(self, other):
+        return DaySet(self.index, self.bits & self._other(other))
+
+    def __or__(self, other):
+        return DaySet(self.index, self.bits | self._other(other))
+
+    def __xor__(self, other):
+        return DaySet(self.index, self.bits ^ self._other(other))
+
+    def __sub__(self, other):
+        return DaySet(self.index, self.bits & ~self._other(other))
+
+    def __invert__(self):
+        return DaySet(self.index, self.index.all.bits ^ self.bits)
+
+    def __eq__(self, other):
+        return isinstance(other, DaySet) and other.index is self.index and other.bits == self.bits
+
+    def __hash__(self):
+        return hash((id(self.index), self.bits))
+
+    def __len__(self):
+        return bin(self.bits).count('1')
+
+    def __bool__(self):
+        return self.bits != 0
+
+    def __contains__(self, jdn):
+        i = jdn - self.index.start
+        return 0 <= i < self.index.size and (self.bits >> i) & 1 == 1
+
+    def __iter__(self):
+        """
+        Yield the Julian Day Numbers of the set in increasing order.
+        """
+        start = self.index.start
+        for k, byte in enumerate(self.bits.to_bytes((self.index.size + 7) // 8, 'little')):
+            while byte:
+                low = byte & -byte
+                yield start + 8 * k + low.bit_length() - 1
+                byte ^= low
+
+    def dates(self):
+        """
+        Return the days of the set.
+
+        Returns:
+            list[tuple[int, int, int]]: Gregorian dates (day, month, year) in increasing order.
+        """
+        return [Date.convertjdn2Date(jdn) for jdn in self]
+
+    def countByMonth(self):
+        """
+        Count the days of the set in every Gregorian month of the index.
+
+        Returns:
+            dict[tuple[int, int], int]: {(month, year): count} in calendar order.
+        """
+        res = {}
+        for m, y, i, j in self.index._months:
+            res[(m, y)] = bin((self.bits >> i) & ((1 << (j - i)) - 1)).count('1')
+        return res
+
+    def __repr__(self):
+        return f'<DaySet of {len(self)} days>'
+
+
+class RulePack:
+    """
+    User-defined almanac rules declared as data (a list of dicts or JSON).
+
+    A rule is {'name': ..., 'kind': ..., 'when': {field: spec, ...}}. Every field of
+    'when' must match, the values listed for one field are alternatives. A spec is
+    a value, a list of values, or {'by': field, 'map': {key: spec}} when the allowed
+    values depend on another field, e.g. Sát Chủ:
+
+        {'name': 'Sát Chủ', 'kind': 'xau',
+         'when': {'dayBranch': {'by': 'lunarMonth', 'map': {1: 'Tý', 2: 'Sửu', 3: 'Sửu', ...}}}}
+
+    (the full map is TotXau.SAT_CHU).
+
+    Fields are those of FIELDS: lunarDay (1–30), lunarMonth (1–12), leap (0 / 1),
+    yearStem, yearBranch, dayStem, dayBranch, dayCanChi (names of CanChi), term
+    (names of TietKhi.TERMS_LIST), weekday (0 = Monday) and truc (names of VanSu.TRUC).
+
+    The conditions over the same set of fields are compiled into one lookup table
+    whose entries are bitsets of the rules they accept, so a day costs one table
+    access per distinct field set, whatever the number of rules.
+    """
+    FIELDS = ('lunarDay', 'lunarMonth', 'leap', 'yearStem', 'yearBranch', 'dayStem', 'dayBranch',
+              'dayCanChi', 'term', 'weekday', 'truc')
+    _DOMAINS = (
+        tuple(range(1, 31)), tuple(range(1, 13)), (0, 1), tuple(CanChi.CAN), tuple(CanChi.CHI),
+        tuple(CanChi.CAN), tuple(CanChi.CHI), tuple(CanChi.fromIndex(i) for i in range(60)),
+        tuple(name for name, _ in TietKhi.TERMS_LIST), tuple(range(7)), tuple(VanSu.TRUC),
+    )
+
+    def __init__(self, rules, name=None):
+        """
+        Compile a list of rules.
+
+        Args:
+            rules (list[dict]): Rules as described in the class docstring.
+            name (str, optional): Name of the pack.
+
+        Raises:
+            ValueError: If a rule is malformed, names an unknown field or value,
+                or reuses the name of another rule.
+        """
+        self.name = name
+        self.rules = [dict(rule) for rule in rules]
+        self.names = []; self.kinds = []
+        tables = {}
+        for r, rule in enumerate(self.rules):
+            extra = set(rule) - {'name', 'kind', 'when'}
+            if 'name' not in rule or extra:
+                raise ValueError(f'Rule {rule!r} needs a name and only takes name, kind and when')
+            if rule['name'] in self.names:
+                raise ValueError(f'Duplicate rule name {rule["name"]!r}')
+            self.names.append(rule['name']); self.kinds.append(rule.get('kind'))
+            for key, spec in rule.get('when', {}).items():
+                f = self._field(rule, key)
+                by, test = self._spec(rule, f, spec)
+                fields = tuple(sorted(by | {f}))
+                table = tables.get(fields)
+                if table is None:
+                    table = tables[fields] = []
+                table.append((r, test))
+
+        self._all = (1 << len(self.rules)) - 1
+        self._tables = []
+        for fields, tests in tables.items():
+            table = []
+            v = [0] * len(RulePack.FIELDS)
+            for combo in product(*(range(len(RulePack._DOMAINS[f])) for f in fields)):
+                for f, x in zip(fields, combo):
+                    v[f] = x
+                bits = self._all
+                for r, test in tests:
+                    if not test(v):
+                        bits &= ~(1 << r)
+                table.append(bits)
+            radices = tuple(len(RulePack._DOMAINS[f]) for f in fields)
+            self._tables.append((fields, radices, table))
+
+    @classmethod
+    def fromJSON(cls, source):
+        """
+        Compile a rule pack from JSON text or a file handle. The document is either
+        a list of rules or {"name": ..., "rules": [...]}.
+        """
+        doc = json.load(source) if hasattr(source, 'read') else json.loads(source)
+        if isinstance(doc, dict):
+            return cls(doc.get('rules', []), doc.get('name'))
+        return cls(doc)
+
+    def __len__(self):
+        return len(self.rules)
+
+    def __repr__(self):
+        return f'RulePack({self.name!r}, {len(self.rules)} rules, {len(self._tables)} tables)'
+
+    @staticmethod
+    def _field(rule, key):
+        if key not in RulePack.FIELDS:
+            raise ValueError(f'Unknown field {key!r} in rule {rule.get("name")!r}, expected one of {RulePack.FIELDS}')
+        return RulePack.FIELDS.index(key)
+
+    @staticmethod
+    def _value(rule, f, v):
+        """
+        Return the index of a value in the domain of field f. Numbers may be given as
+        strings (JSON object keys), 'Quý' is accepted for 'Qúy'.
+        """
+        domain = RulePack._DOMAINS[f]
+        if isinstance(v, str):
+            v = v.strip()
+            if isinstance(domain[0], int):
+                v = int(v) if v.isdigit() else v
+            else:
+                v = v.replace('Quý', 'Qúy')
+        if v in domain:
+            return domain.index(v)
+        raise ValueError(f'Invalid {RulePack.FIELDS[f]} value {v!r} in rule {rule.get("name")!r}')
+
+    @staticmethod
+    def _spec(rule, f, spec):
+        """
+        Return (fields the spec depends on, test), test(v) telling whether the spec
+        accepts the value indexes v (indexed by field).
+        """
+        if isinstance(spec, dict):
+            if set(spec) != {'by', 'map'}:
+                raise ValueError(f'Conditional spec of rule {rule.get("name")!r} needs exactly "by" and "map"')
+            k = RulePack._field(rule, spec['by'])
+            by = {k}; cases = {}
+            for key, sub in spec['map'].items():
+                subBy, test = RulePack._spec(rule, f, sub)
+                by |= subBy
+                cases[RulePack._value(rule, k, key)] = test
+            return by, lambda v: v[k] in cases and cases[v[k]](v)
+        values = spec if isinstance(spec, (list, tuple)) else [spec]
+        allowed = frozenset(RulePack._value(rule, f, x) for x in values)
+        return set(), lambda v: v[f] in allowed
+
+    @staticmethod
+    def _dayValues(jdn, dl, ml, leap, yl, term):
+        """
+        Return the value indexes (in FIELDS order) of a day.
+        """
+        branch = (jdn + 1) % 12
+        return (dl - 1, ml - 1, leap, (yl + 6) % 10, (yl + 8) % 12, (jdn + 9) % 10, branch,
+                (jdn + 49) % 60, term, jdn % 7, (branch - 2 - (term - 21) % 24 // 2) % 12)
+
+    def _match(self, v):
+        """
+        Return the bitset of the rules matching the value indexes of a day.
+        """
+        bits = self._all
+        for fields, radices, table in self._tables:
+            i = 0
+            for f, n in zip(fields, radices):
+                i = i * n + v[f]
+            bits &= table[i]
+            if not bits:
+                break
+        return bits
+
+    def _names(self, bits):
+        return tuple(name for r, name in enumerate(self.names) if bits >> r & 1)
+
+    def getDay(self, d, m, y, timeZone=7.0):
+        """
+        Return the names of the rules matching a Gregorian date, in rule order.
+        """
+        jdn = Date.convertDate2jdn(d, m, y)
+        dl, ml, yl, leap = LunarYear.containing(jdn, timeZone).locate(jdn)
+        return self._names(self._match(RulePack._dayValues(jdn, dl, ml, leap, yl, TietKhi.getTermAt(jdn, timeZone)[0])))
+
+    def getRange(self, d1, m1, y1, d2, m2, y2, timeZone=7.0):
+        """
+        Return the rules matching every day of a Gregorian date range.
+
+        Args:
+            d1 (int): Day of the first date.
+            m1 (int): Month of the first date.
+            y1 (int): Year of the first date.
+            d2 (int): Day of the last date (inclusive).
+            m2 (int): Month of the last date.
+            y2 (int): Year of the last date.
+            timeZone (float, optional): Time zone offset in hours. Default is 7.0.
+
+        Returns:
+            list[tuple[tuple[int, int, int], tuple[str, ...]]]: ((day, month, year), rule names) per day.
+        """
+        first = Date.convertDate2jdn(d1, m1, y1); last = Date.convertDate2jdn(d2, m2, y2)
+        res = []
+        if last < first:
+            return res
+        ly = LunarYear.containing(first, timeZone)
+        k = bisect_right(ly.starts, first) - 1
+        termEnd = first
+        for jdn in range(first, last + 1):
+            if k + 1 < len(ly.starts) and jdn >= ly.starts[k + 1]:
+                k += 1
+            elif jdn >= ly.end:
+                ly = LunarYear.get(ly.year + 1, timeZone); k = 0
+            if jdn >= termEnd:
+                y = Date.convertjdn2Date(jdn)[2]
+                days, terms = TietKhi.getTermTable(y, timeZone)
+                t = bisect_right(days, jdn) - 1
+                term = terms[t]
+                termEnd = days[t + 1] if t + 1 < len(days) else Date.convertDate2jdn(1, 1, y + 1)
+            ml, leap = ly.months[k]
+            v = RulePack._dayValues(jdn, jdn - ly.starts[k] + 1, ml, leap, ly.year, term)
+            res.append((Date.convertjdn2Date(jdn), self._names(self._match(v))))
+        return res
+
+class DayIndex:
+    FLAGS = ('hoangDao', 'tamNuong', 'nguyetPha', 'satChu', 'thoTu', 'vangVong', 'nguyetKy', 'daiBai')
+
+    def __init__(self, fromYear, toYear=None, timeZone=7.0, rules=()):
+        """
+        Build packed per-day bitsets over whole Gregorian years: Hoàng Đạo, each TotXau
+        bad-day flag, weekday, 28 mansion star (VanSu.SAO) and solar term.
+
+        The flags follow the day's own lunar month (leap months use their month number).
+
+        Args:
+            fromYear (int): First Gregorian year (inclusive).
+            toYear (int, optional): Last Gregorian year (inclusive). Default is fromYear.
+            timeZone (float, optional): Time zone offset in hours. Default is 7.0.
+            rules (RulePack | iterable[RulePack], optional): Rule packs evaluated in the
+                same pass, each rule becomes a flag named after it.
+        """
+        toYear = fromYear if toYear is None else toYear
+        if toYear < fromYear:
+            raise ValueError(f'toYear {toYear} is before fromYear {fromYear}')
+        packs = [rules] if isinstance(rules, RulePack) else list(rules)
+        ruleNames = [name for pack in packs for name in pack.names]
+        clash = set(DayIndex.FLAGS).intersection(ruleNames) or len(set(ruleNames)) != len(ruleNames)
+        if clash:
+            raise ValueError(f'Rule names must be unique and differ from {DayIndex.FLAGS}')
+        self.timeZone = timeZone
+        self.start = Date.convertDate2jdn(1, 1, fromYear)
+        self.size = Date.convertDate2jdn(31, 12, toYear) + 1 - self.start
+        self._months = []
+        for y in range(fromYear, toYear + 1):
+            for m in range(1, 13):
+                i = Date.convertDate2jdn(1, m, y) - self.start
+                self._months.append((m, y, i, i + Date.dayMonth(m, y)))
+
+        chi = CanChi.CHI.index
+        byMonth = [{m: chi(b) for m, b in t.items()}
+                   for t in (TotXau.NGUYET_PHA, TotXau.SAT_CHU, TotXau.THO_TU, TotXau.VANG_VONG)]
+        daiBai = {c: {m: CanChi.toIndex(cc) for m, cc in t.items()} for c, t in TotXau.DAI_BAI.items()}
+        flags = [bytearray((self.size + 7) // 8) for _ in DayIndex.FLAGS]
+        saos = [bytearray((self.size + 7) // 8) for _ in VanSu.SAO]
+        terms = [bytearray((self.size + 7) // 8) for _ in TietKhi.TERMS_LIST]
+        weekdays = [bytearray((self.size + 7) // 8) for _ in range(7)]
+        packFlags = [[bytearray((self.size + 7) // 8) for _ in pack.names] for pack in packs]
+
+        ly = LunarYear.containing(self.start, timeZone)
+        k = bisect_right(ly.starts, self.start) - 1
+        termEnd = self.start
+        for i in range(self.size):
+            jdn = self.start + i
+            if k + 1 < len(ly.starts) and jdn >= ly.starts[k + 1]:
+                k += 1
+            elif jdn >= ly.end:
+                ly = LunarYear.get(ly.year + 1, timeZone); k = 0
+            if jdn >= termEnd:
+                y = Date.convertjdn2Date(jdn)[2]
+                days, termIdx = TietKhi.getTermTable(y, timeZone)
+                t = bisect_right(days, jdn) - 1
+                term = termIdx[t]
+                termEnd = days[t + 1] if t + 1 < len(days) else Date.convertDate2jdn(1, 1, y + 1)
+            dl = jdn - ly.starts[k] + 1; ml = ly.months[k][0]
+            branch = (jdn + 1) % 12
+            on = (
+                TotXau.HOANG_HAC_DAO[TotXau.getHoangHacDaoIndex(branch, ml)][1] == 'Hoàng Đạo',
+                dl in TotXau.TAM_NUONG,
+                branch == byMonth[0][ml], branch == byMonth[1][ml],
+                branch == byMonth[2][ml], branch == byMonth[3][ml],
+                dl in TotXau.NGUYET_KY,
+                daiBai.get(CanChi.CAN[(ly.year + 6) % 10], {}).get(ml) == (jdn + 49) % 60,
+            )
+            byte, bit = i >> 3, 1 << (i & 7)
+            for arr, v in zip(flags, on):
+                if v:
+                    arr[byte] |= bit
+            saos[(jdn + 11) % 28][byte] |= bit
+            terms[term][byte] |= bit
+            weekdays[jdn % 7][byte] |= bit
+            if packs:
+                v = RulePack._dayValues(jdn, dl, ml, ly.months[k][1], ly.year, term)
+                for pack, arrs in zip(packs, packFlags):
+                    bits = pack._match(v)
+                    while bits:
+                        low = bits & -bits
+                        arrs[low.bit_length() - 1][byte] |= bit
+                        bits ^= low
+
+        pack = lambda arr: int.from_bytes(bytes(arr), 'little')
+        self.all = DaySet(self, (1 << self.size) - 1)
+        self._flags = {name: pack(arr) for name, arr in zip(DayIndex.FLAGS, flags)}
+        for rp, arrs in zip(packs, packFlags):
+            self._flags.update((name, pack(arr)) for name, arr in zip(rp.names, arrs))
+        self._saos = {name: pack(arr) for name, arr in zip(VanSu.SAO, saos)}
+        self._terms = {name: pack(arr) for (name, _), arr in zip(TietKhi.TERMS_LIST, terms)}
+        self._weekdays = [pack(arr) for arr in weekdays]
+
+    def flag(self, name):
+        """
+        Return the days carrying a flag of FLAGS (e.g. 'hoangDao', 'tamNuong')
+        or a rule of the packs given to the index.
+        """
+        if name not in self._flags:
+            raise ValueError(f'Unknown flag {name!r}, expected one of {tuple(self._flags)}')
+        return DaySet(self, self._flags[name])
+
+    def sao(self, name):
+        """
+        Return the days of a 28 mansion star (a name of VanSu.SAO).
+        """
+        if name not in self._saos:
+            raise ValueError(f'Unknown star {name!r}')
+        return DaySet(self, self._saos[name])
+
+    def tiet(self, name):
+        """
+        Return the days of a solar term (a name of TietKhi.TERMS_LIST).
+        """
+        if name not in self._terms:
+            raise ValueError(f'Unknown solar term {name!r}')
+        return DaySet(self, self._terms[name])
+
+    def weekday(self, *days):
+        """
+        Return the days falling on the given weekdays (0 = Monday, ..., 6 = Sunday).
+        """
+        bits = 0
+        for wd in days:
+            bits |= self._weekdays[wd % 7]
+        return DaySet(self, bits)
+
+    def between(self, d1, m1, y1, d2, m2, y2):
+        """
+        Return the days from d1/m1/y1 to d2/m2/y2 inclusive, clipped to the index.
+        """
+        i = max(Date.convertDate2jdn(d1, m1, y1) - self.start, 0)
+        j = min(Date.convertDate2jdn(d2, m2, y2) - self.start + 1, self.size)
+        return DaySet(self, ((1 << j) - (1 << i)) if j > i else 0)
+
+    def year(self, y):
+        """
+        Return the days of a Gregorian year, clipped to the index.
+        """
+        return self.between(1, 1, y, 31, 12, y)
+
+    def month(self, m, y):
+        """
+        Return the days of a Gregorian month, clipped to the index.
+        """
+        return self.between(1, m, y, Date.dayMonth(m, y), m, y)
+
+class LichBloc:
+    THU = ('Thứ hai', 'Thứ ba', 'Thứ tư', 'Thứ năm', 'Thứ sáu', 'Thứ bảy', 'Chủ nhật')
+    XAU = ('Tam Nương', 'Nguyệt Phá', 'Sát Chủ', 'Thọ Tử', 'Vãng Vong', 'Nguyệt Kỵ', 'Đại Bại')
+    TEXT = (
+        '{d}/{m}/{y}\t{THU}\tNgày {dl}/{ml}/{yl} ÂL\n'
+        'Ngày {ngay} - Tháng {thang} - Năm {nam}\n'
+        'Hành {hanh} - Sao {sao}\n'
+        '{hoangDao}\n'
+        '{xau}\n'
+        '- Giờ tốt: {gioTot}\n'
+        '- Tuổi xung: {tuoiXung}\n'
+        '{tiet}'
+    )
+    HTML = (
+        '<section class="page">\n'
+        '<h1>{d}</h1>\n'
+        '<p class="month">Tháng {m} năm {y} &middot; {THU}</p>\n'
+        '<p class="lunar">Ngày {dl}/{ml}/{yl} ÂL</p>\n'
+        '<p>Ngày {ngay} - Tháng {thang} - Năm {nam}</p>\n'
+        '<p>Hành {hanh} - Sao {sao}</p>\n'
+        '<p class="hoang-dao">{hoangDao}</p>\n'
+        '<p class="xau">{xau}</p>\n'
+        '<p>- Giờ tốt: {gioTot}</p>\n'
+        '<p>- Tuổi xung: {tuoiXung}</p>\n'
+        '<p class="tiet">{tiet}</p>\n'
+        '</section>'
+    )
+    HTML_HEAD = (
+        '<!DOCTYPE html>\n<html lang="vi">\n<head>\n<meta charset="utf-8">\n<title>Lịch {y}</title>\n'
+        '<style>.page {{ page-break-after: always; }} h1 {{ font-size: 4em; margin: 0; }}</style>\n'
+        '</head>\n<body>\n'
+    )
+    HTML_TAIL = '</body>\n</html>\n'
+
+    @staticmethod
+    def pages(y, timeZone=7.0):
+        """
+        Generate the tear-off calendar pages of a Gregorian year as structured records,
+        with the content of VanSu.getInfo(d, m, y, 's').
+
+        The year is walked once: lunar months and solar terms come from the memoized
+        LunarYear and term tables, per-Stem-Branch strings (Hành, tuổi xung, giờ tốt)
+        are built once and shared by every page, and the bad-day flags follow the
+        day's own lunar month.
+
+        Args:
+            y (int): Gregorian year.
+            timeZone (float, optional): Time zone offset in hours. Default is 7.0.
+
+        Yields:
+            dict: One record per day with keys:
+                - 'date' (tuple[int, int, int]): (day, month, year).
+                - 'thu' (str): Weekday name.
+                - 'lunar' (tuple[int, int, int, int]): (lunar_day, lunar_month, lunar_year, is_leap_month).
+                - 'ngay', 'thang', 'nam' (str): Stem-Branch of the day, lunar month and lunar year.
+                - 'hanh', 'sao' (str): Five Element and 28 mansion star.
+                - 'hoangDao' (tuple[str, str]): Star name and 'Hoàng Đạo' / 'Hắc Đạo'.
+                - 'xau' (tuple[str, ...]): Bad-day flags of XAU that apply.
+                - 'gioTot' (tuple[str, ...]): Auspicious hours, e.g. 'Tý (23h - 1h)'.
+                - 'tuoiXung' (tuple[str, ...]): Conflicting Stem-Branches.
+                - 'tiet' (str): Solar term of the day.
+                - 'tietStart' (datetime | None): Start of the term when it begins that day.
+        """
+        names = [CanChi.fromIndex(i) for i in range(60)]
+        hanh = [VanSu.getHanh(n) for n in names]
+        xung = [tuple(TotXau.XUNG.get(n, ())) for n in names]
+        gioTot = []
+        for b in CanChi.CHI:
+            hours = next(v for k, v in TotXau.GIO_HOANG_DAO.items() if b in k)
+            gioTot.append(tuple('%s (%sh - %sh)' % ((h,) + TotXau.quyHoi(h)) for h in hours))
+        chi = CanChi.CHI.index
+        byMonth = [{m: chi(b) for m, b in t.items()}
+                   for t in (TotXau.NGUYET_PHA, TotXau.SAT_CHU, TotXau.THO_TU, TotXau.VANG_VONG)]
+        daiBai = {c: {m: CanChi.toIndex(cc) for m, cc in t.items()} for c, t in TotXau.DAI_BAI.items()}
+
+        first = Date.convertDate2jdn(1, 1, y); last = Date.convertDate2jdn(31, 12, y)
+        ly = LunarYear.containing(first, timeZone)
+        k = bisect_right(ly.starts, first) - 1
+        days, terms = TietKhi.getTermTable(y, timeZone)
+        t = 0
+        month = None
+        for jdn in range(first, last + 1):
+            if k + 1 < len(ly.starts) and jdn >= ly.starts[k + 1]:
+                k += 1
+            elif jdn >= ly.end:
+                ly = LunarYear.get(ly.year + 1, timeZone); k = 0
+            while t + 1 < len(days) and jdn >= days[t + 1]:
+                t += 1
+            ml, leap = ly.months[k]
+            if month != (ml, ly.year):
+                month = (ml, ly.year)
+                thang = CanChi.thang(ml, ly.year); nam = CanChi.nam(ly.year)
+                targets = [table[ml] for table in byMonth]
+                bai = daiBai.get(CanChi.CAN[(ly.year + 6) % 10], {}).get(ml)
+            dl = jdn - ly.starts[k] + 1
+            cc = (jdn + 49) % 60; branch = (jdn + 1) % 12
+            on = (dl in TotXau.TAM_NUONG, branch == targets[0], branch == targets[1],
+                  branch == targets[2], branch == targets[3], dl in TotXau.NGUYET_KY, cc == bai)
+            tiet = TietKhi.TERMS_LIST[terms[t]][0]
+            td = None
+            if t > 0 and days[t] == jdn:
+                td = TietKhi._termInYear(tiet, y)
+                td = td + timedelta(hours=timeZone - 7) if td else None
+            d, m, _ = Date.convertjdn2Date(jdn)
+            yield {
+                'date': (d, m, y),
+                'thu': LichBloc.THU[jdn % 7],
+                'lunar': (dl, ml, ly.year, leap),
+                'ngay': names[cc], 'thang': thang, 'nam': nam,
+                'hanh': hanh[cc], 'sao': VanSu.SAO[(jdn + 11) % 28],
+                'hoangDao': TotXau.HOANG_HAC_DAO[TotXau.getHoangHacDaoIndex(branch, ml)],
+                'xau': tuple(name for name, ok in zip(LichBloc.XAU, on) if ok),
+                'gioTot': gioTot[branch],
+                'tuoiXung': xung[cc],
+                'tiet': tiet,
+                'tietStart': td,
+            }
+
+    @staticmethod
+    def fields(page, escape=None):
+        """
+        Flatten a page record into the display strings used by the TEXT and HTML templates.
+
+        Args:
+            page (dict): Record yielded by pages.
+            escape (callable, optional): Applied to every string value (e.g. html.escape).
+
+        Returns:
+            dict[str, str | int]: Keys d, m, y, thu, THU, dl, ml, yl, ngay, thang, nam, hanh, sao,
+            hoangDao, xau, gioTot, tuoiXung and tiet (the last line of getInfo).
+        """
+        d, m, y = page['date']; dl, ml, yl, _ = page['lunar']
+        td = page['tietStart']
+        if td:
+            tiet = f'- BẮT ĐẦU TIẾT: {page["tiet"]} lúc {td.hour:02}h{td.minute:02} (giờ {TotXau.gioAm(td.hour)})'
+        else:
+            tiet = f'- Thuộc tiết {page["tiet"]}.'
+        res = {
+            'thu': page['thu'], 'THU': page['thu'].upper(),
+            'ngay': page['ngay'], 'thang': page['thang'], 'nam': page['nam'],
+            'hanh': str(page['hanh']), 'sao': page['sao'],
+            'hoangDao': ' '.join(page['hoangDao']), 'xau': ' - '.join(page['xau']),
+            'gioTot': ', '.join(page['gioTot']), 'tuoiXung': ', '.join(page['tuoiXung']),
+            'tiet': tiet,
+        }
+        if escape:
+            res = {k: escape(v) for k, v in res.items()}
+        res.update(d=d, m=m, y=y, dl=dl, ml=ml, yl=yl)
+        return res
+
+    @staticmethod
+    def render(y, f, fmt='text', template=None, timeZone=7.0):
+        """
+        Write all the pages of a Gregorian year to a text file handle in one streaming pass.
+
+        Args:
+            y (int): Gregorian year.
+            f (file-like): Text handle to write to (opened with encoding='utf-8').
+            fmt (str, optional): 'text' (pages separated by a form feed) or 'html'
+                (one <section class="page"> per day). Default is 'text'.
+            template (str, optional): str.format template over the keys of fields,
+                replacing TEXT or HTML. Default is None.
+            timeZone (float, optional): Time zone offset in hours. Default is 7.0.
 
         Returns:
-            str: Name of the lunar mansion star in Vietnamese.
+            int: Number of pages written.
+
+        Raises:
+            ValueError: If fmt is not 'text' or 'html'.
         """
-        saos = [
-            "Giác", "Cang", "Đê", "Phòng", "Tâm", "Vĩ", "Cơ",
-            "Đẩu", "Ngưu", "Nữ", "Hư", "Nguy", "Thất", "Bích",
-            "Khuê", "Lâu", "Vị", "Mão", "Tất", "Chủy", "Sâm",
-            "Tỉnh", "Quỷ", "Liễu", "Tinh", "Trương", "Dực", "Chẩn"
-        ]
-        return saos[(Date.convertDate2jdn(d, m, y) + 11) % 28]
+        if fmt == 'text':
+            template = template or LichBloc.TEXT; escape = None; sep = '\f'
+        elif fmt == 'html':
+            template = template or LichBloc.HTML; escape = html.escape; sep = ''
+            f.write(LichBloc.HTML_HEAD.format(y=y))
+        else:
+            raise ValueError(f"fmt must be 'text' or 'html', got {fmt!r}")
+        n = 0
+        for page in LichBloc.pages(y, timeZone):
+            if n and sep:
+                f.write(sep)
+            f.write(template.format(**LichBloc.fields(page, escape)))
+            f.write('\n')
+            n += 1
+        if fmt == 'html':
+            f.write(LichBloc.HTML_TAIL)
+        return n
 
-    @staticmethod
-    def getHanh(cch):
+class Annotator:
+    FIELDS = ('jdn', 'lunarDay', 'lunarMonth', 'lunarYear', 'lunarLeap', 'canchiDay', 'canchiHour', 'gio', 'term')
+    _CANCHI = tuple(CanChi.fromIndex(i) for i in range(60))
+    _GIO = tuple(CanChi.CHI[(h + 1) // 2 % 12] for h in range(24))
+    _EPOCH = 2440588
+
+    def __init__(self, timeZone=7.0, chunkSize=65536):
         """
-        Return the Five Element (Ngũ Hành) associated with a given Stem-Branch combination.
+        Annotate streams of event timestamps with their lunar and almanac columns.
+
+        The annotator keeps the current lunar month and solar term boundaries,
+        so consecutive events of the same month or term only cost a few comparisons.
 
         Args:
-            cch (str): Stem-Branch combination in Vietnamese (e.g., 'Giáp Tý', 'Bính Dần').
+            timeZone (float, optional): Time zone offset in hours. Default is 7.0.
+            chunkSize (int, optional): Number of events per yielded chunk. Default is 65536.
+        """
+        if chunkSize < 1:
+            raise ValueError(f'chunkSize must be positive, got {chunkSize}')
+        self.timeZone = timeZone
+        self.chunkSize = chunkSize
+        self._month = (1, 0, 0, 0, 0)
+        self._term = (1, 0, 0)
 
-        Returns:
-            str | None: One of 'Kim', 'Hỏa', 'Mộc', 'Thổ', 'Thủy',
-            or None if the combination is not recognized.
+    def _localDay(self, t):
         """
-        if cch in ['Giáp Tý', 'Ất Sửu', 'Nhâm Thân', 'Qúy Dậu', 'Canh Thìn', 'Tân Tị',
-                 'Giáp Ngọ', 'Ất Mùi', 'Nhâm Dần', 'Qúy Mão', 'Canh Tuất', 'Tân Hợi']:
-            return 'Kim'
-        elif cch in ['Bính Dần', 'Đinh Mão', 'Giáp Tuất', 'Ất Hợi', 'Mậu Tý', 'Ký Sửu',
-                   'Bính Thân', 'Đinh Dậu', 'Giáp Thìn', 'Ất Tị', 'Mậu Ngọ', 'Kỷ Mùi']:
-            return 'Hỏa'
-        elif cch in ['Mậu Thìn', 'Kỷ Tị', 'Nhâm Ngọ', 'Qúy Mùi', 'Canh Dần', 'Tân Mão',
-                   'Mậu Tuất', 'Kỷ Hợi', 'Nhâm Tý', 'Qủy Sửu', 'Canh Thân', 'Tân Dậu']:
-            return 'Mộc'
-        elif cch in ['Canh Ngọ', 'Tân Mùi', 'Mậu Dần', 'Kỷ Mão', 'Bính Tuất', 'Đinh Hợi',
-                   'Canh Tý', 'Tân Sửu', 'Mậu Thân', 'Kỷ Dậu', 'Bính Thìn', 'Đinh Tị']:
-            return 'Thổ'
-        elif cch in ['Bính Tý', 'Đinh Sửu', 'Giáp Thân', 'Ất Dậu', 'Nhâm Thìn', 'Qúy Tị',
-                   'Bính Ngọ', 'Đinh Mùi', 'Giáp Dần', 'Ất Mão', 'Nhâm Tuất', 'Qúy Hợi']:
-            return 'Thủy'
-    
-    @staticmethod
-    def get28_Hanh(d, m, y):
+        Return (jdn, hour) of a POSIX timestamp or datetime in the annotator's time zone.
+        Naive datetimes are taken as local wall time.
         """
-        Return the Five Element (Ngũ Hành) and 28 lunar mansion star (Nhị Thập Bát Tú)
-        for a given Gregorian date.
+        if isinstance(t, datetime):
+            if t.tzinfo is None:
+                return t.toordinal() + 1721425, t.hour
+            t = t.timestamp()
+        elif isinstance(t, date):
+            return t.toordinal() + 1721425, 0
+        local = float(t) + self.timeZone * 3600
+        day = math.floor(local / 86400)
+        return Annotator._EPOCH + day, int((local - day * 86400) // 3600)
 
-        Args:
-            d (int): Day of the month.
-            m (int): Month of the year.
-            y (int): Year in Gregorian calendar.
+    def _lunarMonth(self, jdn):
+        """
+        Refresh the cached lunar month to the one containing jdn.
+        """
+        ly = LunarYear.containing(jdn, self.timeZone)
+        i = bisect_right(ly.starts, jdn) - 1
+        end = ly.starts[i + 1] if i + 1 < len(ly.starts) else ly.end
+        m, leap = ly.months[i]
+        self._month = (ly.starts[i], end, m, ly.year, leap)
+        return self._month
 
-        Returns:
-            dict: A dictionary with keys:
-                - 'hành' (str): The Five Element of the day's Stem-Branch.
-                - 'sao' (str): The 28 lunar mansion star name in Vietnamese.
+    def _solarTerm(self, jdn):
         """
-        a = CanChi.ngay(d, m, y)
-        return {
-            'hành': VanSu.getHanh(a),
-            'sao': VanSu.getSao(d, m, y),
-        }
-        
-    @staticmethod
-    def getInfo(d, m, y, SorL):
+        Refresh the cached solar term to the one containing jdn.
         """
-        Return a formatted almanac summary string for a given date.
+        y = Date.convertjdn2Date(jdn)[2]
+        days, terms = TietKhi.getTermTable(y, self.timeZone)
+        i = bisect_right(days, jdn) - 1
+        end = days[i + 1] if i + 1 < len(days) else Date.convertDate2jdn(1, 1, y + 1)
+        self._term = (days[i], end, TietKhi.TERMS_LIST[terms[i]][0])
+        return self._term
 
-        The summary includes weekday, lunar date, Can-Chi (Stem-Branch) for day/month/year,
-        Five Element, 28 lunar mansion star, Hoàng Đạo / Hắc Đạo, inauspicious day flags,
-        auspicious hours, conflicting ages, and solar term information.
+    def annotate(self, events):
+        """
+        Annotate an iterable of events chunk by chunk.
 
         Args:
-            d (int): Day of the date.
-            m (int): Month of the date.
-            y (int): Year of the date.
-            SorL (str): Calendar type:
-                - 's' if the input date is in the Gregorian (solar) calendar.
-                - 'l' if the input date is in the Lunar calendar.
+            events (iterable[int | float | datetime | date]): POSIX timestamps in seconds,
+                or datetimes (aware ones are converted, naive ones are local wall time).
+                Any iterable works, including lists, generators and array.array.
 
-        Returns:
-            str: A multi-line formatted string containing the full almanac information.
+        Yields:
+            dict[str, list]: One column per name of FIELDS, each holding up to chunkSize values:
+                - 'jdn' (int): Julian Day Number of the local day.
+                - 'lunarDay', 'lunarMonth', 'lunarYear', 'lunarLeap' (int): Lunar date.
+                - 'canchiDay', 'canchiHour' (str): Stem-Branch of the day and of the hour.
+                - 'gio' (str): Earthly Branch hour, as TotXau.gioAm.
+                - 'term' (str): Name of the solar term of the day.
+            The strings are shared between rows, not rebuilt per event.
         """
-        if SorL == 's':
-            thu = Date.dayWeek(d, m, y)
-            dl, ml, yl, isLeap = SolarAndLunar.convertSolar2Lunar(d, m, y)
-            ccng = CanChi.ngay(d, m, y); canng = ccng.split()[1]
-            ccth = CanChi.thang(ml, yl)
-            ccnm = CanChi.nam(yl)
-            hanh = VanSu.get28_Hanh(d, m, y)['hành']; sao = VanSu.get28_Hanh(d, m, y)['sao']
-            hodhad = TotXau.getHoangHacDao(canng, ml)
-            tamnuong, nguyetpha, satchu, thotu, vangvong, nguyetky, daibai = TotXau.isTamNuong(dl,ml,yl), TotXau.isNguyetPha(dl,ml,yl), TotXau.isSatChu(dl,ml,yl), TotXau.isThoTu(dl,ml,yl), TotXau.isVangVong(dl,ml,yl), TotXau.isNguyetKy(dl,ml,yl), TotXau.isDaiBai(dl,ml,yl)
-            ghd = TotXau.getGioHoangDao(dl, ml, yl)
-            tx = TotXau.getXung(d, m, y)
-            gd = []; tiet = TietKhi.getTerm(d, m, y)
-            for i in range(len(ghd)):
-                sth = TotXau.quyHoi(ghd[i])
-                b = ''
-                b += ghd[i]
-                b += (f' ({sth[0]}h - {sth[1]}h)')
-                gd.append(b)
-            
-            labels = [
-                ('Tam Nương', tamnuong),
-                ('Nguyệt Phá', nguyetpha),
-                ('Sát Chủ', satchu),
-                ('Thọ Tử', thotu),
-                ('Vãng Vong', vangvong),
-                ('Nguyệt Kỵ', nguyetky),
-                ('Đại Bại', daibai)
-            ]
-            a = ' - '.join(name for name, ok in labels if ok)
-            inf = (
-                f'{d}/{m}/{y}\t{thu.upper()}\tNgày {dl}/{ml}/{yl} ÂL\n'
-                f'Ngày {ccng} - Tháng {ccth} - Năm {ccnm}\n'
-                f'Hành {hanh} - Sao {sao}\n'
-                f'{" ".join(hodhad)}\n'
-                f'{a}\n'
-                f'- Giờ tốt: {", ".join(gd)}\n'
-                f'- Tuổi xung: {", ".join(tx)}\n'
-            )
-            td = TietKhi.getTermDate(tiet, y)
-            if td and td.day == d and td.month == m:
-                gio = TotXau.gioAm(td.hour)
-                return inf + f'- BẮT ĐẦU TIẾT: {tiet} lúc {td.hour:02}h{td.minute:02} (giờ {gio})'
-            else:
-                return inf + f'- Thuộc tiết {tiet}.'
-
-        elif SorL == 'l':
-            dl, ml, yl = d, m, y
-            isLeap = 1 if yl % 19 in [0, 3, 6, 9, 11, 14, 17] else 0
-            ds, ms, ys = SolarAndLunar.convertLunar2Solar(dl, ml, yl, isLeap)
-            thu = Date.dayWeek(ds, ms, ys)
-            ccng = CanChi.ngay(ds, ms, ys); ccth = CanChi.thang(ml, yl); ccnm = CanChi.nam(yl); canng = ccng.split()[1]
-            hanh = VanSu.get28_Hanh(ds, ms, ys)['hành']; sao = VanSu.get28_Hanh(ds, ms, ys)['sao']
-            hodhad = TotXau.getHoangHacDao(canng, ml)
-            tamnuong, nguyetpha, satchu, thotu, vangvong, nguyetky, daibai = TotXau.isTamNuong(dl,ml,yl), TotXau.isNguyetPha(dl,ml,yl), TotXau.isSatChu(dl,ml,yl), TotXau.isThoTu(dl,ml,yl), TotXau.isVangVong(dl,ml,yl), TotXau.isNguyetKy(dl,ml,yl), TotXau.isDaiBai(dl,ml,yl)
-            ghd = TotXau.getGioHoangDao(dl, ml, yl)
-            tx = TotXau.getXung(ds, ms, ys)
-            gd = []; tiet = TietKhi.getTerm(ds, ms, ys)
-            for i in range(len(ghd)):
-                sth = TotXau.quyHoi(ghd[i])
-                b = ''
-                b += ghd[i]
-                b += (f' ({sth[0]}h - {sth[1]}h)')
-                gd.append(b)
-            
-            labels = [
-                ('Tam Nương', tamnuong),
-                ('Nguyệt Phá', nguyetpha),
-                ('Sát Chủ', satchu),
-                ('Thọ Tử', thotu),
-                ('Vãng Vong', vangvong),
-                ('Nguyệt Kỵ', nguyetky),
-                ('Đại Bại', daibai)
-            ]
-            a = ' - '.join(name for name, ok in labels if ok)
-            inf = (
-                f'{ds}/{ms}/{ys}\t{thu.upper()}\tNgày {dl}/{ml}/{yl} ÂL\n'
-                f'Ngày {ccng} - Tháng {ccth} - Năm {ccnm}\n'
-                f'Hành {hanh} - Sao {sao}\n'
-                f'{" ".join(hodhad)}\n'
-                f'{a}\n'
-                f'- Giờ tốt: {", ".join(gd)}\n'
-                f'- Tuổi xung: {", ".join(tx)}\n'
-            )
-            td = TietKhi.getTermDate(tiet, ys)
-            if td and td.day == ds and td.month == ms:
-                gio = TotXau.gioAm(td.hour)
-                return inf + f'- BẮT ĐẦU TIẾT: {tiet} lúc {td.hour:02}h{td.minute:02} (giờ {gio})'
-            else:
-                return inf + f'- Thuộc tiết {tiet}.'
+        cols = {f: [] for f in Annotator.FIELDS}
+        (jdnCol, dayCol, monthCol, yearCol, leapCol,
+         canchiCol, hourCol, gioCol, termCol) = (cols[f] for f in Annotator.FIELDS)
+        names, gio = Annotator._CANCHI, Annotator._GIO
+        start, end, m, y, leap = self._month
+        tStart, tEnd, term = self._term
+        n = 0
+        for t in events:
+            jdn, h = self._localDay(t)
+            if not start <= jdn < end:
+                start, end, m, y, leap = self._lunarMonth(jdn)
+            if not tStart <= jdn < tEnd:
+                tStart, tEnd, term = self._solarTerm(jdn)
+            jdnCol.append(jdn); dayCol.append(jdn - start + 1); monthCol.append(m)
+            yearCol.append(y); leapCol.append(leap)
+            canchiCol.append(names[(jdn + 49) % 60])
+            hourCol.append(names[CanChi.gioIndex(jdn, h)])
+            gioCol.append(gio[h]); termCol.append(term)
+            n += 1
+            if n == self.chunkSize:
+                yield cols
+                cols = {f: [] for f in Annotator.FIELDS}
+                (jdnCol, dayCol, monthCol, yearCol, leapCol,
+                 canchiCol, hourCol, gioCol, termCol) = (cols[f] for f in Annotator.FIELDS)
+                n = 0
+        if n:
+            yield cols
 
 class Person:
     def __init__(self, bday, bmon, byr, gen):
@@ -1388,3 +4066,338 @@ class Person:
         yl = SolarAndLunar.convertSolar2Lunar(self.bday, self.bmon, self.byr)[2]
         sao = TotXau.getCuuDieu(yl, self.gen)
         return PRED9[sao] if sao in PRED9.keys() else None
+
+
+class Cohort:
+    """
+    A group of people looking for a common day (company event, wedding).
+
+    TotXau.XUNG is precomputed as the birth-year Stem-Branches clashing with each of
+    the 60 day Stem-Branches, and the group is counted per birth-year Stem-Branch,
+    so the number of clashing people of a day is five additions whatever the size
+    of the group.
+    """
+    XUNG_TABLE = tuple(tuple(CanChi.toIndex(x) for x in TotXau.XUNG.get(CanChi.fromIndex(i), []))
+                       for i in range(60))
+    BAD = ('tamNuong', 'nguyetPha', 'satChu', 'thoTu', 'vangVong', 'nguyetKy', 'daiBai')
+
+    def __init__(self, people):
+        """
+        Args:
+            people (iterable[Person]): Participants, their birth-year Stem-Branch is
+                that of their lunar birth year (Person.lunar_byr).
+        """
+        self.people = list(people)
+        self.years = [(p.lunar_byr - 4) % 60 for p in self.people]
+        self.counts = [0] * 60
+        for yc in self.years:
+            self.counts[yc] += 1
+
+    def __len__(self):
+        return len(self.people)
+
+    def __repr__(self):
+        return f'Cohort({len(self.people)} people, {sum(1 for n in self.counts if n)} birth years)'
+
+    def conflictCount(self, dayIndex):
+        """
+        Return the number of people clashing with a day of a given sexagenary index.
+        """
+        counts = self.counts
+        return sum(counts[yc] for yc in Cohort.XUNG_TABLE[dayIndex % 60])
+
+    def conflicts(self, d, m, y):
+        """
+        Return the people clashing (xung) with a Gregorian date.
+        """
+        xung = Cohort.XUNG_TABLE[CanChi.ngayIndex(Date.convertDate2jdn(d, m, y))]
+        return [p for p, yc in zip(self.people, self.years) if yc in xung]
+
+    def matrix(self, d1, m1, y1, d2, m2, y2):
+        """
+        Return the participants × days clash matrix of a Gregorian date range.
+
+        Args:
+            d1 (int): Day of the first date.
+            m1 (int): Month of the first date.
+            y1 (int): Year of the first date.
+            d2 (int): Day of the last date (inclusive).
+            m2 (int): Month of the last date.
+            y2 (int): Year of the last date.
+
+        Returns:
+            tuple[list[tuple[int, int, int]], list[bytes]]: (days, rows), rows[i][j] is 1
+            when person i clashes with day j. People born in the same Stem-Branch year
+            share one row object.
+        """
+        first = Date.convertDate2jdn(d1, m1, y1); last = Date.convertDate2jdn(d2, m2, y2)
+        days = [Date.convertjdn2Date(jdn) for jdn in range(first, last + 1)]
+        rows = {}
+        for yc in set(self.years):
+            rows[yc] = bytes(yc in Cohort.XUNG_TABLE[(jdn + 49) % 60] for jdn in range(first, last + 1))
+        return days, [rows[yc] for yc in self.years]
+
+    def rank(self, d1, m1, y1, d2, m2, y2, timeZone=7.0, bad=BAD, rules=(), maxConflicts=None):
+        """
+        Rank the days of a Gregorian date range for the group: fewest clashing people
+        first, then fewest bad-day flags, Hoàng Đạo days before Hắc Đạo days, then by date.
+
+        Args:
+            d1 (int): Day of the first date.
+            m1 (int): Month of the first date.
+            y1 (int): Year of the first date.
+            d2 (int): Day of the last date (inclusive).
+            m2 (int): Month of the last date.
+            y2 (int): Year of the last date.
+            timeZone (float, optional): Time zone offset in hours. Default is 7.0.
+            bad (tuple[str, ...], optional): DayIndex flags counted as bad. Default is BAD.
+            rules (RulePack | iterable[RulePack], optional): Rule packs given to DayIndex,
+                their rule names may be listed in bad.
+            maxConflicts (int, optional): Drop the days with more clashing people.
+
+        Returns:
+            list[tuple[tuple[int, int, int], int, bool, tuple[str, ...]]]:
+            ((day, month, year), clashing people, Hoàng Đạo, bad flags) per day.
+        """
+        first = Date.convertDate2jdn(d1, m1, y1); last = Date.convertDate2jdn(d2, m2, y2)
+        if last < first:
+            return []
+        ix = DayIndex(y1, y2, timeZone, rules)
+        nbytes = (ix.size + 7) // 8
+        flags = [(name, ix.flag(name).bits.to_bytes(nbytes, 'little')) for name in bad]
+        hoangDao = ix.flag('hoangDao').bits.to_bytes(nbytes, 'little')
+        res = []
+        for jdn in range(first, last + 1):
+            n = self.conflictCount((jdn + 49) % 60)
+            if maxConflicts is not None and n > maxConflicts:
+                continue
+            i = jdn - ix.start; byte, bit = i >> 3, i & 7
+            res.append((Date.convertjdn2Date(jdn), n, bool(hoangDao[byte] >> bit & 1),
+                        tuple(name for name, arr in flags if arr[byte] >> bit & 1)))
+        res.sort(key=lambda r: (r[1], len(r[3]), not r[2]))
+        return res
+
+
+class HolidayCalendar:
+    """
+    Vietnamese holidays and working-day arithmetic.
+
+    Public holidays are Tết Nguyên Đán (a configurable span around Mùng 1), Giỗ Tổ
+    Hùng Vương (10/3 lunar) and the fixed Gregorian holidays of FIXED; a public holiday
+    falling on a weekend gives a compensatory day off (nghỉ bù) on the next working
+    day. Mùng 1 and Rằm of every lunar month are listed as observances, they are not
+    days off. Lunar holidays come from the memoized LunarYear month tables.
+
+    The calendar keeps a working-day bitmap and the running count of working days,
+    so counting is O(1) and adding working days a bisect. The covered years grow on
+    demand, by at least GROW years at a time, and only the new years are resolved.
+    """
+    FIXED = (
+        (1, 1, 'Tết Dương lịch'),
+        (30, 4, 'Ngày Giải phóng miền Nam'),
+        (1, 5, 'Ngày Quốc tế Lao động'),
+        (1, 9, 'Quốc khánh'),
+        (2, 9, 'Quốc khánh'),
+    )
+    PUBLIC = 'public'
+    COMPENSATORY = 'compensatory'
+    OBSERVANCE = 'observance'
+    GROW = 8
+
+    def __init__(self, fromYear, toYear=None, weekend=(5, 6), tet=(1, 4), fixed=FIXED,
+                 compensate=True, extra=(), workdays=(), timeZone=7.0):
+        """
+        Args:
+            fromYear (int): First Gregorian year built (inclusive).
+            toYear (int, optional): Last Gregorian year built (inclusive). Default is fromYear.
+            weekend (tuple[int, ...], optional): Weekly days off, 0 = Monday. Default is (5, 6).
+            tet (tuple[int, int], optional): Tết days off before Mùng 1 and from Mùng 1
+                (inclusive). Default is (1, 4): the last day of the year to Mùng 4.
+            fixed (tuple, optional): (day, month, name) Gregorian public holidays. Default is FIXED.
+            compensate (bool, optional): Give a day off for public holidays on weekends. Default is True.
+            extra (iterable[tuple[int, int, int]], optional): Additional days off (d, m, y),
+                e.g. bridge days announced for a year.
+            workdays (iterable[tuple[int, int, int]], optional): Weekend days worked (d, m, y),
+                e.g. Saturdays swapped for a bridge day.
+            timeZone (float, optional): Time zone offset in hours. Default is 7.0.
+        """
+        toYear = fromYear if toYear is None else toYear
+        if toYear < fromYear:
+            raise ValueError(f'toYear {toYear} is before fromYear {fromYear}')
+        self.weekend = frozenset(w % 7 for w in weekend)
+        self.tet = tet; self.fixed = tuple(fixed); self.compensate = compensate
+        self.extra = frozenset(Date.convertDate2jdn(*dmy) for dmy in extra)
+        self.workdays = frozenset(Date.convertDate2jdn(*dmy) for dmy in workdays)
+        self.timeZone = timeZone
+        self.fromYear = self.toYear = None
+        self._holidays = {}; self._off = set(); self._resolved = set()
+        self._build(fromYear, toYear)
+
+    def _resolve(self, y):
+        """
+        Return [(jdn, name, kind)] of the holidays and observances of a Gregorian year.
+        """
+        res = []
+        ly = LunarYear.get(y, self.timeZone)
+        tet = ly.monthStart(1)
+        before, after = self.tet
+        for jdn in range(tet - before, tet + after):
+            res.append((jdn, 'Tết Nguyên Đán', HolidayCalendar.PUBLIC))
+        res.append((ly.monthStart(3) + 9, 'Giỗ Tổ Hùng Vương', HolidayCalendar.PUBLIC))
+        for d, m, name in self.fixed:
+            res.append((Date.convertDate2jdn(d, m, y), name, HolidayCalendar.PUBLIC))
+        for jdn in self.extra:
+            if Date.convertjdn2Date(jdn)[2] == y:
+                res.append((jdn, 'Ngày nghỉ', HolidayCalendar.PUBLIC))
+
+        if self.compensate:
+            off = {jdn for jdn, _, _ in res}
+            taken = set()
+            for jdn, name, _ in sorted(res):
+                if jdn % 7 in self.weekend and jdn not in self.workdays:
+                    c = jdn + 1
+                    while c % 7 in self.weekend or c in off or c in taken:
+                        c += 1
+                    taken.add(c)
+                    res.append((c, f'Nghỉ bù {name}', HolidayCalendar.COMPENSATORY))
+
+        first = Date.convertDate2jdn(1, 1, y); last = Date.convertDate2jdn(31, 12, y)
+        for ly in (LunarYear.get(y - 1, self.timeZone), ly):
+            for start, (m, leap) in zip(ly.starts, ly.months):
+                for jdn, name in ((start, 'Mùng 1'), (start + 14, 'Rằm')):
+                    if first <= jdn <= last:
+                        res.append((jdn, f'{name} tháng {m}{" nhuận" if leap else ""}', HolidayCalendar.OBSERVANCE))
+        return sorted(res)
+
+    def _build(self, fromYear, toYear):
+        """
+        Extend the covered years to include fromYear..toYear. Only years not resolved yet
+        are resolved (with the year before, whose nghỉ bù can fall in January); the bitmap
+        and the running count are then rebuilt over the whole span.
+        """
+        if self.fromYear is not None:
+            fromYear = min(fromYear, self.fromYear); toYear = max(toYear, self.toYear)
+        for y in range(fromYear - 1, toYear + 1):
+            if y in self._resolved:
+                continue
+            self._resolved.add(y)
+            for jdn, name, kind in self._resolve(y):
+                self._holidays.setdefault(jdn, []).append((name, kind))
+                if kind != HolidayCalendar.OBSERVANCE:
+                    self._off.add(jdn)
+        start = Date.convertDate2jdn(1, 1, fromYear)
+        size = Date.convertDate2jdn(1, 1, toYear + 1) - start
+        isWork = lambda jdn: jdn in self.workdays or not (jdn % 7 in self.weekend or jdn in self._off)
+        if self.fromYear is None:
+            work = bytearray(isWork(start + i) for i in range(size))
+        else:
+            work = bytearray(isWork(start + i) for i in range(self.start - start))
+            work += self._work
+            work += bytearray(isWork(start + i) for i in range(len(work), size))
+        self.fromYear = fromYear; self.toYear = toYear
+        self.start = start; self.size = size
+        self._work = work; self._cum = [0, *accumulate(work)]
+
+    def _index(self, jdn):
+        """
+        Return the bitmap index of a day, growing the covered years to reach it.
+        """
+        if not self.start <= jdn < self.start + self.size:
+            y = Date.convertjdn2Date(jdn)[2]
+            if y < self.fromYear:
+                self._build(min(y, self.fromYear - HolidayCalendar.GROW), self.toYear)
+            else:
+                self._build(self.fromYear, max(y, self.toYear + HolidayCalendar.GROW))
+        return jdn - self.start
+
+    def _at(self, target):
+        """
+        Return the JDN of the working day preceded by `target` working days from self.start.
+        """
+        while target >= self._cum[-1]:
+            self._build(self.fromYear, self.toYear + max(HolidayCalendar.GROW, (target - self._cum[-1]) // 240 + 1))
+        return self.start + bisect_right(self._cum, target) - 1
+
+    def getHolidays(self, y, observances=False):
+        """
+        Return the holidays of a Gregorian year.
+
+        Args:
+            y (int): Gregorian year.
+            observances (bool, optional): Also list Mùng 1 and Rằm. Default is False.
+
+        Returns:
+            list[tuple[tuple[int, int, int], str, str]]: ((day, month, year), name, kind) by date,
+            kind is PUBLIC, COMPENSATORY or OBSERVANCE.
+        """
+        self._index(Date.convertDate2jdn(1, 1, y))
+        res = []
+        for jdn in range(Date.convertDate2jdn(1, 1, y), Date.convertDate2jdn(1, 1, y + 1)):
+            for name, kind in self._holidays.get(jdn, ()):
+                if observances or kind != HolidayCalendar.OBSERVANCE:
+                    res.append((Date.convertjdn2Date(jdn), name, kind))
+        return res
+
+    def isHoliday(self, d, m, y):
+        """
+        Return True if a date is a public or compensatory holiday.
+        """
+        jdn = Date.convertDate2jdn(d, m, y)
+        self._index(jdn)
+        return any(kind != HolidayCalendar.OBSERVANCE for _, kind in self._holidays.get(jdn, ()))
+
+    def isWorkingDay(self, d, m, y):
+        """
+        Return True if a date is neither a weekend day nor a day off.
+        """
+        i = self._index(Date.convertDate2jdn(d, m, y))
+        return bool(self._work[i])
+
+    def countWorkingDays(self, d1, m1, y1, d2, m2, y2):
+        """
+        Return the number of working days from d1/m1/y1 to d2/m2/y2, both inclusive
+        (negative when the second date is earlier).
+        """
+        a = Date.convertDate2jdn(d1, m1, y1); b = Date.convertDate2jdn(d2, m2, y2)
+        if b < a:
+            return -self.countWorkingDays(d2, m2, y2, d1, m1, y1)
+        self._index(a); self._index(b)
+        return self._cum[b - self.start + 1] - self._cum[a - self.start]
+
+    def addWorkingDays(self, d, m, y, n):
+        """
+        Move a date by n working days. A date that is not a working day first rolls
+        forward to the next working day (as numpy.busday_offset with roll='forward').
+
+        Args:
+            d (int): Day of the month.
+            m (int): Month of the year.
+            y (int): Year in Gregorian calendar.
+            n (int): Working days to add, may be negative.
+
+        Returns:
+            tuple[int, int, int]: (day, month, year) of the resulting working day.
+        """
+        i = self._index(Date.convertDate2jdn(d, m, y))
+        target = self._cum[i] + n
+        while target < 0:
+            self._build(self.fromYear - max(HolidayCalendar.GROW, -target // 240 + 1), self.toYear)
+            i = self._index(Date.convertDate2jdn(d, m, y)); target = self._cum[i] + n
+        return Date.convertjdn2Date(self._at(target))
+
+    def nextWorkingDay(self, d, m, y):
+        """
+        Return the first working day strictly after a date.
+        """
+        i = self._index(Date.convertDate2jdn(d, m, y))
+        return Date.convertjdn2Date(self._at(self._cum[i + 1]))
+
+    def previousWorkingDay(self, d, m, y):
+        """
+        Return the last working day strictly before a date.
+        """
+        i = self._index(Date.convertDate2jdn(d, m, y))
+        while self._cum[i] == 0:
+            self._build(self.fromYear - HolidayCalendar.GROW, self.toYear)
+            i = self._index(Date.convertDate2jdn(d, m, y))
+        return Date.convertjdn2Date(self._at(self._cum[i] - 1))
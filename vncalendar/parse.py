@@ -0,0 +1,123 @@
+# ===================================================================
+# Đọc hàng loạt chuỗi ngày dương lịch và âm lịch.
+#
+# Bulk parsing of date strings into Julian Day Numbers, Gregorian and
+# lunar tuples. Accepted forms:
+#     15/08/2025, 15-8-2025, 15.8.2025     Gregorian, day first
+#     2025-08-15                           Gregorian, ISO
+#     15/8/2025 ÂL (or AL)                 lunar
+#     1/4N/2025, 1/4N/2025 ÂL              lunar, leap month
+# Lunar dates are checked against the real month table of their year
+# (LunarYear), so a missing leap month or day 30 of a short month is an
+# error. Bad items are reported per item instead of raising.
+#
+# Usage:
+#     from vncalendar.parse import Parser
+#     res = Parser.parse(['15/8/2025', '2025-08-15', '23/6N/2025 ÂL', '30/2/2025'])
+#     res['ok']       # [True, True, True, False]
+#     res['jdn'][0]; res['lunar'][2]; res['error'][3]
+# ===================================================================
+
+import re
+import unicodedata
+
+from .main import Date, LunarYear
+
+_DMY = re.compile(r'\s*(\d{1,2})[/.-](\d{1,2})(n?)[/.-](\d{4})\s*(âl|al)?\s*', re.IGNORECASE)
+_ISO = re.compile(r'\s*(\d{4})-(\d{1,2})-(\d{1,2})\s*')
+
+
+class Parser:
+    FIELDS = ('ok', 'jdn', 'solar', 'lunar', 'isLunar', 'error')
+
+    @staticmethod
+    def parseOne(s, timeZone=7.0):
+        """
+        Parse one date string.
+
+        Args:
+            s (str): Date string in one of the accepted forms.
+            timeZone (float, optional): Time zone offset in hours. Default is 7.0.
+
+        Returns:
+            tuple: (jdn, (day, month, year), (lunar_day, lunar_month, lunar_year, is_leap_month), isLunar).
+
+        Raises:
+            ValueError: If the string is not a valid date.
+        """
+        record, error = Parser._parse(s, timeZone)
+        if error:
+            raise ValueError(error)
+        return record
+
+    @staticmethod
+    def parse(strings, timeZone=7.0):
+        """
+        Parse many date strings at once. Repeated strings are parsed once.
+
+        Args:
+            strings (iterable[str]): Date strings (a list, array or pandas Series).
+                Items that are not strings (None, NaN) are reported as errors.
+            timeZone (float, optional): Time zone offset in hours. Default is 7.0.
+
+        Returns:
+            dict[str, list]: One list per name of FIELDS, aligned with the input:
+            ok (bool), jdn, solar (day, month, year), lunar (day, month, year, leap),
+            isLunar (True for lunar input) and error (message). Failed items have
+            ok False, an error message and None elsewhere.
+        """
+        res = {name: [] for name in Parser.FIELDS}
+        ok, jdns, solars, lunars, isLunars, errors = (res[name] for name in Parser.FIELDS)
+        seen = {}
+        for s in strings:
+            hit = seen.get(s) if isinstance(s, str) else None
+            if hit is None:
+                hit = Parser._parse(s, timeZone)
+                if isinstance(s, str):
+                    seen[s] = hit
+            record, error = hit
+            ok.append(error is None); errors.append(error)
+            if error is None:
+                jdn, solar, lunar, isLunar = record
+            else:
+                jdn = solar = lunar = isLunar = None
+            jdns.append(jdn); solars.append(solar); lunars.append(lunar); isLunars.append(isLunar)
+        return res
+
+    @staticmethod
+    def _parse(s, timeZone):
+        """
+        Return (record, None) for a valid date string, (None, error message) otherwise.
+        """
+        if not isinstance(s, str):
+            return None, f'Not a string: {s!r}'
+        if not s.isascii():
+            s = unicodedata.normalize('NFC', s)
+        match = _DMY.fullmatch(s)
+        if match:
+            d, m, leap, y, suffix = match.groups()
+            d, m, y = int(d), int(m), int(y)
+            if leap or suffix:
+                return Parser._lunar(s, d, m, y, int(bool(leap)), timeZone)
+        else:
+            match = _ISO.fullmatch(s)
+            if not match:
+                return None, f'Unrecognized date: {s!r}'
+            y, m, d = (int(g) for g in match.groups())
+        if not (y >= 1 and 1 <= m <= 12 and 1 <= d <= Date.dayMonth(m, y)):
+            return None, f'Invalid date: {s.strip()!r}'
+        jdn = Date.convertDate2jdn(d, m, y)
+        return (jdn, (d, m, y), LunarYear.containing(jdn, timeZone).locate(jdn), False), None
+
+    @staticmethod
+    def _lunar(s, d, m, y, leap, timeZone):
+        if not (y >= 1 and 1 <= m <= 12):
+            return None, f'Invalid lunar date: {s.strip()!r}'
+        ly = LunarYear.get(y, timeZone)
+        length = ly.monthLength(m, leap)
+        if length is None:
+            return None, f'Lunar year {y} has no leap month {m}: {s.strip()!r}'
+        if not 1 <= d <= length:
+            return None, f'Lunar month {m}{"N" if leap else ""}/{y} has {length} days: {s.strip()!r}'
+        jdn = ly.monthStart(m, leap) + d - 1
+        return (jdn, Date.convertjdn2Date(jdn), (d, m, y, leap), True), None
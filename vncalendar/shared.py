@@ -0,0 +1,298 @@
+# ===================================================================
+# Bảng lịch dùng chung giữa các tiến trình (shared memory / fork).
+#
+# Almanac tables shared between processes. The parent builds the lunar
+# year, solar term and per-day tables once and publishes them in one
+# read-only buffer (multiprocessing.shared_memory, or a plain buffer
+# inherited across fork). Workers attach without copying and install the
+# table, so LunarYear.get and TietKhi.getTermTable restore their entries
+# from it instead of recomputing them.
+#
+# Usage (parent):
+#     table = DayTable.build(1900, 2100)
+#     name = table.publish()             # hand the name to the workers
+#     ...
+#     table.unlink()                     # on shutdown
+#
+# Usage (worker):
+#     table = DayTable.attach(name)
+#     table.install()
+#     ...
+#     table.close()
+# ===================================================================
+
+from array import array
+import inspect
+import struct
+
+from .main import Date, Ephemeris, LunarYear, TietKhi
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # Python 3.7
+    shared_memory = None
+
+# SharedMemory(track=False) (Python 3.13+) attaches without registering the
+# segment with the resource tracker; older versions need _attachUntracked.
+_TRACK = shared_memory is not None and 'track' in inspect.signature(shared_memory.SharedMemory).parameters
+
+_HEADER = struct.Struct('<4siiid8si')
+_MAGIC = b'VNC1'
+_YEAR_INTS = 30   # k, count, end, 13 starts, 13 packed months, padding
+_TERM_INTS = 57   # count, 28 days, 28 terms
+_TERM_SLOTS = 28
+
+
+class DayTable:
+    def __init__(self, buf, owner=None):
+        """
+        Wrap a buffer laid out by DayTable.build. Use build, attach or fromBuffer instead.
+
+        Args:
+            buf (buffer): Bytes-like object holding the table.
+            owner (SharedMemory, optional): Segment the buffer belongs to, if any.
+        """
+        self._buf = buf; self._shm = owner
+        magic, self.fromYear, self.toYear, self.start, self.timeZone, tier, size = _HEADER.unpack_from(buf, 0)
+        if magic != _MAGIC:
+            raise ValueError('Buffer does not hold a vncalendar DayTable')
+        self.tier = tier.rstrip(b'\0').decode()
+        self.size = size
+        nYears = self.toYear - self.fromYear + 2; nTerms = self.toYear - self.fromYear + 1
+        view = memoryview(buf)[_HEADER.size:_HEADER.size + 4 * (nYears * _YEAR_INTS + nTerms * _TERM_INTS + size)]
+        ints = view.cast('i')
+        a = nYears * _YEAR_INTS; b = a + nTerms * _TERM_INTS
+        self._view = view; self._ints = ints
+        self._years = ints[:a]; self._terms = ints[a:b]; self._days = ints[b:]
+
+    @staticmethod
+    def nbytes(fromYear, toYear, size):
+        return _HEADER.size + 4 * ((toYear - fromYear + 2) * _YEAR_INTS + (toYear - fromYear + 1) * _TERM_INTS + size)
+
+    @classmethod
+    def build(cls, fromYear, toYear, timeZone=7.0, buf=None):
+        """
+        Compute the tables of Gregorian years fromYear..toYear (lunar years fromYear - 1..toYear).
+
+        Args:
+            fromYear (int): First Gregorian year (inclusive).
+            toYear (int): Last Gregorian year (inclusive).
+            timeZone (float, optional): Time zone offset in hours. Default is 7.0.
+            buf (buffer, optional): Writable buffer of at least nbytes(...) bytes to fill.
+                Default is a new bytearray, which child processes inherit across fork.
+
+        Returns:
+            DayTable: The table over the filled buffer.
+        """
+        start = Date.convertDate2jdn(1, 1, fromYear)
+        size = Date.convertDate2jdn(31, 12, toYear) + 1 - start
+        if buf is None:
+            buf = bytearray(DayTable.nbytes(fromYear, toYear, size))
+        _HEADER.pack_into(buf, 0, _MAGIC, fromYear, toYear, start, timeZone, Ephemeris.getTier().encode(), size)
+        table = cls(buf)
+
+        for i, y in enumerate(range(fromYear - 1, toYear + 1)):
+            ly = LunarYear.get(y, timeZone)
+            row = [ly.k, len(ly.starts), ly.end] + list(ly.starts) + [0] * (13 - len(ly.starts))
+            row += [m | leap << 4 for m, leap in ly.months] + [0] * (13 - len(ly.months)) + [0]
+            table._years[i * _YEAR_INTS:(i + 1) * _YEAR_INTS] = _ints(row)
+
+        for i, y in enumerate(range(fromYear, toYear + 1)):
+            days, terms = TietKhi.getTermTable(y, timeZone)
+            pad = [0] * (_TERM_SLOTS - len(days))
+            table._terms[i * _TERM_INTS:(i + 1) * _TERM_INTS] = _ints([len(days)] + list(days) + pad + list(terms) + pad)
+
+        records = []
+        ly = LunarYear.containing(start, timeZone); k = 0
+        while k + 1 < len(ly.starts) and start >= ly.starts[k + 1]:
+            k += 1
+        y = fromYear - 1; yearEnd = start; t = 0
+        for jdn in range(start, start + size):
+            if k + 1 < len(ly.starts) and jdn >= ly.starts[k + 1]:
+                k += 1
+            elif jdn >= ly.end:
+                ly = LunarYear.get(ly.year + 1, timeZone); k = 0
+            if jdn == yearEnd:
+                y += 1; yearEnd = Date.convertDate2jdn(1, 1, y + 1)
+                days, terms = TietKhi.getTermTable(y, timeZone); t = 0
+            while t + 1 < len(days) and jdn >= days[t + 1]:
+                t += 1
+            m, leap = ly.months[k]
+            records.append(jdn - ly.starts[k] + 1 | m << 5 | leap << 9 | terms[t] << 10
+                           | (t > 0 and days[t] == jdn) << 15 | (ly.year - fromYear + 1) << 16)
+        table._days[:] = _ints(records)
+        return table
+
+    @classmethod
+    def fromBuffer(cls, buf):
+        """
+        Wrap an existing buffer (e.g. an mmap) that holds a built table, without copying.
+        """
+        return cls(buf)
+
+    def publish(self, name=None):
+        """
+        Copy the table into a new shared memory segment owned by this object.
+
+        Args:
+            name (str, optional): Segment name. Default is a random name.
+
+        Returns:
+            str: The segment name workers pass to attach.
+
+        Raises:
+            RuntimeError: If multiprocessing.shared_memory is not available (Python < 3.8).
+        """
+        if shared_memory is None:
+            raise RuntimeError('multiprocessing.shared_memory needs Python 3.8+, build the table before forking instead')
+        n = DayTable.nbytes(self.fromYear, self.toYear, self.size)
+        shm = shared_memory.SharedMemory(name=name, create=True, size=n)
+        shm.buf[:n] = memoryview(self._buf)[:n]
+        self._release()
+        DayTable.__init__(self, shm.buf, shm)
+        return shm.name
+
+    @classmethod
+    def attach(cls, name):
+        """
+        Attach to a table published by another process, without copying it.
+
+        Args:
+            name (str): Segment name returned by publish.
+
+        Returns:
+            DayTable: Read-only view of the shared table.
+        """
+        if shared_memory is None:
+            raise RuntimeError('multiprocessing.shared_memory needs Python 3.8+')
+        if _TRACK:
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            shm = DayTable._attachUntracked(name)
+        return cls(shm.buf, shm)
+
+    @staticmethod
+    def _attachUntracked(name):
+        """
+        Attach without track=False (Python 3.8–3.12), where attaching registers the
+        segment with the resource tracker as if this process had created it.
+
+        Only the publisher owns the segment. A worker sharing the publisher's tracker
+        (fork, multiprocessing children) must leave the registration alone; one that
+        starts its own tracker must unregister, or that tracker would unlink the
+        segment when the worker exits. This peeks at resource_tracker internals, so
+        it is only used where track=False does not exist.
+        """
+        from multiprocessing import resource_tracker
+        tracker = getattr(resource_tracker, '_resource_tracker', None)
+        ownTracker = getattr(tracker, '_fd', None) is None
+        shm = shared_memory.SharedMemory(name=name)
+        if ownTracker:
+            resource_tracker.unregister(getattr(shm, '_name', '/' + shm.name), 'shared_memory')
+        return shm
+
+    def install(self):
+        """
+        Make LunarYear.get and TietKhi.getTermTable restore their entries from this table.
+        Entries already memoized are kept.
+        """
+        LunarYear._shared = self; TietKhi._shared = self
+
+    def uninstall(self):
+        """
+        Stop using this table for new memo entries.
+        """
+        if LunarYear._shared is self:
+            LunarYear._shared = None
+        if TietKhi._shared is self:
+            TietKhi._shared = None
+
+    def _release(self):
+        for v in (self._days, self._terms, self._years, self._ints, self._view):
+            v.release()
+
+    def close(self):
+        """
+        Uninstall the table and detach this process from it. Restored LunarYear
+        objects and term tables stay valid, they do not reference the buffer.
+        """
+        self.uninstall()
+        self._release()
+        if self._shm is not None:
+            self._shm.close()
+
+    def unlink(self):
+        """
+        Close the table and destroy the shared memory segment (call once, from the publisher).
+        """
+        shm = self._shm
+        self.close()
+        if shm is not None:
+            shm.unlink()
+
+    def __del__(self):
+        # Release the views first so a dropped SharedMemory can close its mapping.
+        try:
+            self._release()
+        except (AttributeError, BufferError):
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def covers(self, timeZone, tier):
+        return timeZone == self.timeZone and tier == self.tier
+
+    def lunarYear(self, year, timeZone=7.0, tier='fast'):
+        """
+        Return the LunarYear of a lunar year restored from the table,
+        or None if the table does not hold it.
+        """
+        i = year - self.fromYear + 1
+        if not self.covers(timeZone, tier) or not 0 <= i <= self.toYear - self.fromYear + 1:
+            return None
+        row = self._years[i * _YEAR_INTS:(i + 1) * _YEAR_INTS]
+        n = row[1]
+        return LunarYear._restore(year, timeZone, row[0], row[3:3 + n],
+                                  [(p & 15, p >> 4) for p in row[16:16 + n]], row[2])
+
+    def termTable(self, y, timeZone=7.0, tier='fast'):
+        """
+        Return TietKhi.getTermTable(y) restored from the table,
+        or None if the table does not hold it.
+        """
+        i = y - self.fromYear
+        if not self.covers(timeZone, tier) or not 0 <= i <= self.toYear - self.fromYear:
+            return None
+        row = self._terms[i * _TERM_INTS:(i + 1) * _TERM_INTS]
+        n = row[0]
+        return tuple(row[1:1 + n]), tuple(row[1 + _TERM_SLOTS:1 + _TERM_SLOTS + n])
+
+    def lunar(self, jdn):
+        """
+        Return (lunar_day, lunar_month, lunar_year, is_leap_month) of a day,
+        or None outside the table.
+        """
+        i = jdn - self.start
+        if not 0 <= i < self.size:
+            return None
+        r = self._days[i]
+        return r & 31, r >> 5 & 15, (r >> 16) + self.fromYear - 1, r >> 9 & 1
+
+    def termAt(self, jdn):
+        """
+        Return (index into TERMS_LIST, True if the term starts that day) of a day,
+        or None outside the table.
+        """
+        i = jdn - self.start
+        if not 0 <= i < self.size:
+            return None
+        r = self._days[i]
+        return r >> 10 & 31, bool(r >> 15 & 1)
+
+
+def _ints(values):
+    return memoryview(array('i', values))
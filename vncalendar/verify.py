@@ -0,0 +1,220 @@
+# ===================================================================
+# Kiểm tra tương đương giữa các đường tính nhanh (bảng tra, bộ nhớ đệm)
+# và đường tính thiên văn gốc của SolarAndLunar / TietKhi.
+#
+# Differential equivalence harness between the fast paths (memoized
+# tables, index arithmetic) and the reference astronomical path of
+# SolarAndLunar / TietKhi, day by day.
+#
+# Usage:
+#     python -m vncalendar.verify --from 1800 --to 2199 --tz 7 8
+#     python -m vncalendar.verify --from 1900 --to 2100 --golden golden.txt
+#     python -m vncalendar.verify --check golden.txt
+#     python -m vncalendar.verify --tier auto --from 1900 --to 2100
+#     python -m vncalendar.verify --path guarded --from 500 --to 3200
+# ===================================================================
+
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import hashlib
+import sys
+
+from .main import Date, Ephemeris, SolarAndLunar, LunarYear, CanChi, TotXau, TietKhi
+
+FIELDS = ('lunarDay', 'lunarMonth', 'lunarYear', 'lunarLeap', 'term', 'termStart', 'hoangDao', 'canchi')
+
+
+class Verify:
+    @staticmethod
+    def reference(jdn, timeZone=7.0):
+        """
+        Return the record of a day computed with the reference functions.
+
+        Args:
+            jdn (int): Julian Day Number.
+            timeZone (float, optional): Time zone offset in hours. Default is 7.0.
+
+        Returns:
+            tuple[int, ...]: Values in the order of FIELDS.
+        """
+        d, m, y = Date.convertjdn2Date(jdn)
+        dl, ml, yl, leap = SolarAndLunar.convertSolar2Lunar(d, m, y, timeZone)
+        names = [name for name, _ in TietKhi.TERMS_LIST]
+        term = names.index(TietKhi.getTerm(d, m, y, timeZone))
+        pd, pm, py = Date.convertjdn2Date(jdn - 1)
+        start = int(names.index(TietKhi.getTerm(pd, pm, py, timeZone)) != term)
+        cch = CanChi.ngay(d, m, y)
+        hoangDao = TotXau.HOANG_HAC_DAO.index(TotXau.getHoangHacDao(cch.split()[1], ml))
+        return dl, ml, yl, leap, term, start, hoangDao, CanChi.toIndex(cch)
+
+    @staticmethod
+    def fast(jdn, timeZone=7.0):
+        """
+        Return the record of a day computed with the memoized fast paths.
+
+        Args:
+            jdn (int): Julian Day Number.
+            timeZone (float, optional): Time zone offset in hours. Default is 7.0.
+
+        Returns:
+            tuple[int, ...]: Values in the order of FIELDS.
+        """
+        dl, ml, yl, leap = LunarYear.containing(jdn, timeZone).locate(jdn)
+        term, start = TietKhi.getTermAt(jdn, timeZone)
+        hoangDao = TotXau.getHoangHacDaoIndex((jdn + 1) % 12, ml)
+        return dl, ml, yl, leap, term, int(start), hoangDao, CanChi.ngayIndex(jdn)
+
+    @staticmethod
+    def guarded(jdn, timeZone=7.0):
+        """
+        Return the record of a day computed with the guarded mean-lunation paths
+        (convertSolar2LunarGuarded, getTermGuarded).
+
+        Args:
+            jdn (int): Julian Day Number.
+            timeZone (float, optional): Time zone offset in hours. Default is 7.0.
+
+        Returns:
+            tuple[int, ...]: Values in the order of FIELDS.
+        """
+        d, m, y = Date.convertjdn2Date(jdn)
+        dl, ml, yl, leap = SolarAndLunar.convertSolar2LunarGuarded(d, m, y, timeZone)
+        names = [name for name, _ in TietKhi.TERMS_LIST]
+        term = names.index(TietKhi.getTermGuarded(d, m, y, timeZone))
+        pd, pm, py = Date.convertjdn2Date(jdn - 1)
+        start = int(names.index(TietKhi.getTermGuarded(pd, pm, py, timeZone)) != term)
+        hoangDao = TotXau.getHoangHacDaoIndex((jdn + 1) % 12, ml)
+        return dl, ml, yl, leap, term, start, hoangDao, CanChi.ngayIndex(jdn)
+
+    @staticmethod
+    def compareYear(y, timeZone=7.0, limit=10, withReference=True, tier=None, path='fast'):
+        """
+        Compare both paths for every day of a Gregorian year.
+
+        Args:
+            y (int): Gregorian year.
+            timeZone (float, optional): Time zone offset in hours. Default is 7.0.
+            limit (int, optional): Maximum number of divergences to keep. Default is 10.
+            withReference (bool, optional): False to skip the reference path and only
+                digest the fast path (used by the golden check). Default is True.
+            tier (str, optional): Ephemeris tier to run with. Default is Ephemeris.getTier().
+            path (str, optional): 'fast' (memoized tables) or 'guarded'
+                (mean lunations with exact fallback). Default is 'fast'.
+
+        Returns:
+            tuple[float, int, str, list]: (timeZone, year, digest of the records, divergences),
+            the digest is taken over the reference records when withReference is True,
+            and every divergence is (jdn, reference record, fast record).
+        """
+        other = Verify.guarded if path == 'guarded' else Verify.fast
+        h = hashlib.blake2b(digest_size=8)
+        diverged = []
+        with Ephemeris.using(tier or Ephemeris.getTier()):
+            for jdn in range(Date.convertDate2jdn(1, 1, y), Date.convertDate2jdn(31, 12, y) + 1):
+                fast = other(jdn, timeZone)
+                if withReference:
+                    ref = Verify.reference(jdn, timeZone)
+                    if ref != fast and len(diverged) < limit:
+                        diverged.append((jdn, ref, fast))
+                else:
+                    ref = fast
+                h.update(array('i', ref).tobytes())
+        return timeZone, y, h.hexdigest(), diverged
+
+    @staticmethod
+    def run(fromYear, toYear, timeZones=(7.0, 8.0), workers=None, limit=10, withReference=True, tier=None, path='fast'):
+        """
+        Compare both paths over a range of years in parallel processes.
+
+        Args:
+            fromYear (int): First Gregorian year (inclusive).
+            toYear (int): Last Gregorian year (inclusive).
+            timeZones (iterable[float], optional): Time zones to check. Default is (7.0, 8.0).
+            workers (int, optional): Number of processes. Default is the CPU count.
+            limit (int, optional): Maximum number of divergences kept per year. Default is 10.
+            withReference (bool, optional): See compareYear. Default is True.
+            tier (str, optional): Ephemeris tier to run with. Default is Ephemeris.getTier().
+            path (str, optional): See compareYear. Default is 'fast'.
+
+        Returns:
+            list[tuple[float, int, str, list]]: compareYear results ordered by time zone and year.
+        """
+        jobs = [(y, float(tz)) for tz in timeZones for y in range(fromYear, toYear + 1)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(Verify.compareYear, y, tz, limit, withReference, tier or Ephemeris.getTier(), path) for y, tz in jobs]
+            return [f.result() for f in futures]
+
+    @staticmethod
+    def writeGolden(results, f):
+        """
+        Write one 'timeZone year digest' line per result to a text file handle.
+        """
+        f.write('# vncalendar golden digests: timeZone year blake2b-64 of ' + ','.join(FIELDS) + '\n')
+        for tz, y, digest, _ in results:
+            f.write(f'{tz:g} {y} {digest}\n')
+
+    @staticmethod
+    def readGolden(f):
+        """
+        Return {(timeZone, year): digest} from a golden file handle.
+        """
+        res = {}
+        for line in f:
+            if line.strip() and not line.startswith('#'):
+                tz, y, digest = line.split()
+                res[(float(tz), int(y))] = digest
+        return res
+
+    @staticmethod
+    def report(jdn, ref, fast, timeZone, out=sys.stdout):
+        """
+        Print one divergence with the date, time zone and the differing fields.
+        """
+        d, m, y = Date.convertjdn2Date(jdn)
+        diff = ', '.join(f'{n}: {a} != {b}' for n, a, b in zip(FIELDS, ref, fast) if a != b)
+        out.write(f'DIVERGENCE {d:02d}/{m:02d}/{y} (jdn {jdn}, UTC{timeZone:+g})  {diff}\n')
+        out.write(f'    reference {dict(zip(FIELDS, ref))}\n')
+        out.write(f'    fast      {dict(zip(FIELDS, fast))}\n')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m vncalendar.verify', description='Compare fast paths with the reference astronomical path.')
+    parser.add_argument('--from', dest='fromYear', type=int, default=1900)
+    parser.add_argument('--to', dest='toYear', type=int, default=2100)
+    parser.add_argument('--tz', type=float, nargs='+', default=[7.0, 8.0])
+    parser.add_argument('--tier', choices=['fast', 'precise', 'auto'], default=None)
+    parser.add_argument('--path', choices=['fast', 'guarded'], default='fast')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--limit', type=int, default=10, help='divergences to print')
+    parser.add_argument('--golden', help='write reference digests to this file')
+    parser.add_argument('--check', help='check the fast path against a golden file')
+    args = parser.parse_args(argv)
+
+    if args.check:
+        with open(args.check, encoding='utf-8') as f:
+            golden = Verify.readGolden(f)
+        tzs = sorted({tz for tz, _ in golden}); years = [y for _, y in golden]
+        results = Verify.run(min(years), max(years), tzs, args.workers, withReference=False, tier=args.tier, path=args.path)
+        bad = [(tz, y) for tz, y, digest, _ in results if (tz, y) in golden and golden[(tz, y)] != digest]
+        for tz, y in bad[:args.limit]:
+            print(f'MISMATCH UTC{tz:+g} {y}')
+        print(f'{len(golden)} year digests checked, {len(bad)} mismatched')
+        return 1 if bad else 0
+
+    results = Verify.run(args.fromYear, args.toYear, args.tz, args.workers, args.limit, tier=args.tier, path=args.path)
+    shown = 0; years = 0
+    for tz, y, _, diverged in results:
+        years += bool(diverged)
+        for jdn, ref, fast in diverged:
+            if shown < args.limit:
+                Verify.report(jdn, ref, fast, tz); shown += 1
+    print(f'{len(results)} years checked, {years} with divergences')
+    if args.golden:
+        with open(args.golden, 'w', encoding='utf-8') as f:
+            Verify.writeGolden(results, f)
+    return 1 if years else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())